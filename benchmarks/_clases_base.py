@@ -0,0 +1,100 @@
+"""
+Copia congelada de las clases de cartas anteriores a las plantillas compartidas y a __slots__
+Solo se conservan los constructores: es lo que determina cuánta memoria ocupa cada
+instancia (un __dict__ por objeto y los datos estáticos copiados en cada una).
+No se usan en el juego; sirven de referencia para benchmarks/memoria_cartas.py.
+"""
+
+from typing import Any, Dict, List
+
+
+class Habilidad:
+    """Habilidad con todos sus campos copiados en la instancia"""
+
+    def __init__(self, datos_habilidad: Dict[str, Any]):
+        self.nombre = datos_habilidad.get('nombre', 'Habilidad Sin Nombre')
+        self.tipo = datos_habilidad.get('tipo', 'pasiva')
+        self.descripcion = datos_habilidad.get('descripcion', '')
+
+        self.costo_mana = datos_habilidad.get('costo_mana', 0)
+        self.cooldown = datos_habilidad.get('cooldown', 0)
+        self.cooldown_actual = 0
+        self.rango = datos_habilidad.get('rango', 1)
+        self.duracion = datos_habilidad.get('duracion', 0)
+
+        self.trigger = datos_habilidad.get('trigger', 'permanente')
+        self.area = datos_habilidad.get('area', 'single')
+
+        self.propiedades = {k: v for k, v in datos_habilidad.items()
+                            if k not in ['nombre', 'tipo', 'descripcion', 'costo_mana',
+                                         'cooldown', 'rango', 'duracion', 'trigger', 'area']}
+
+
+class CartaBase:
+    """Carta con sus datos estáticos, stats y estadísticas de combate en un __dict__ propio"""
+
+    def __init__(self, datos_carta: Dict[str, Any]):
+        self.duenio = None
+        self.id = datos_carta.get('id', 0)
+        self.nombre = datos_carta.get('nombre', 'Carta Sin Nombre')
+        self.descripcion = datos_carta.get('descripcion', '')
+
+        self.tier = datos_carta.get('tier', 1)
+        self.costo = datos_carta.get('costo', 1)
+        self.rol = datos_carta.get('rol', 'basico')
+        self.categoria = datos_carta.get('categoria', 'general')
+
+        stats_data = datos_carta.get('stats', {})
+        self.vida_maxima = stats_data.get('vida', 100)
+        self.vida_actual = self.vida_maxima
+        self.dano_fisico_base = stats_data.get('dano_fisico', 10)
+        self.dano_magico_base = stats_data.get('dano_magico', 0)
+        self.defensa_fisica_base = stats_data.get('defensa_fisica', 0)
+        self.defensa_magica_base = stats_data.get('defensa_magica', 0)
+        self.rango_movimiento_base = stats_data.get('rango_movimiento', 1)
+        self.rango_ataque_base = stats_data.get('rango_ataque', 1)
+
+        self.dano_fisico_actual = self.dano_fisico_base
+        self.dano_magico_actual = self.dano_magico_base
+        self.defensa_fisica_actual = self.defensa_fisica_base
+        self.defensa_magica_actual = self.defensa_magica_base
+        self.rango_movimiento_actual = self.rango_movimiento_base
+        self.rango_ataque_actual = self.rango_ataque_base
+
+        self.mana_maxima = 100
+        self.mana_actual = 0
+
+        self.habilidades: List[Habilidad] = [Habilidad(h) for h in datos_carta.get('habilidades', [])]
+
+        self.viva = True
+        self.puede_actuar = True
+        self.efectos_activos = []
+        self.coordenada = None
+
+        self.stats_combate = {
+            'dano_infligido': 0,
+            'dano_recibido': 0,
+            'habilidades_usadas': 0,
+            'enemigos_eliminados': 0
+        }
+        self.modo_control = "pasivo"
+        self.orden_manual_pendiente = False
+        self._en_uso = False  # ManagerCartas lo agregaba a cada copia del pool
+
+
+class EstadoCarta:
+    """Estado de combate con un __dict__ por instancia"""
+
+    def __init__(self, carta):
+        self.id_carta: int = carta.id
+        self.nombre: str = carta.nombre
+        self.carta = carta
+
+        self.vida_actual: int = carta.vida_actual
+        self.cooldown_ataque: float = 0.0
+        self.estado: str = "activo"
+
+        self.dano_base: int = carta.dano_fisico_actual
+        self.defensa: int = carta.defensa_fisica_actual
+        self.defensa_fisica_actual: int = carta.defensa_fisica_actual
+        self.defensa_magica_actual: int = getattr(carta, 'defensa_magica_actual', 0)
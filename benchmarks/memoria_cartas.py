@@ -0,0 +1,63 @@
+"""
+Benchmark de memoria por carta
+Mide con tracemalloc los bytes por instancia de CartaBase, Habilidad y EstadoCarta
+con su representación actual (__slots__ + plantilla compartida) y con la copia
+congelada de las clases originales en benchmarks/_clases_base.py (un __dict__ por
+instancia y los datos estáticos copiados en cada una).
+
+Uso: python -m benchmarks.memoria_cartas [--cantidad 20000]
+"""
+
+import argparse
+import tracemalloc
+
+from benchmarks import _clases_base as base
+from src.game.cartas.carta_base import CartaBase, Habilidad
+from src.game.cartas.estado_carta import EstadoCarta
+from src.game.cartas.plantilla_carta import PlantillaCarta
+from src.utils.helpers import cargar_json
+
+ARCHIVO_CARTAS = "src/data/cartas/personajes_historicos.json"
+
+
+def _medir(fabrica, cantidad: int) -> float:
+    """Bytes asignados por objeto al crear `cantidad` objetos (se mantienen vivos durante la medición)"""
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    objetos = [fabrica(i) for i in range(cantidad)]
+    total = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    del objetos
+    return total / cantidad
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes por carta: versión actual contra la versión base")
+    parser.add_argument("--cantidad", type=int, default=20000)
+    args = parser.parse_args()
+
+    datos = cargar_json(ARCHIVO_CARTAS)
+    plantillas = [PlantillaCarta(d) for d in datos]
+    n = len(plantillas)
+    cartas = [CartaBase(plantillas[i % n]) for i in range(args.cantidad)]
+    cartas_base = [base.CartaBase(datos[i % n]) for i in range(args.cantidad)]
+    con_habilidades = [d for d in datos if d.get('habilidades')] or datos
+    plantillas_habilidad = [PlantillaCarta(d).habilidades for d in con_habilidades]
+
+    filas = [
+        ("CartaBase", lambda i: CartaBase(plantillas[i % n]), lambda i: base.CartaBase(datos[i % n])),
+        ("Habilidad",
+         lambda i: Habilidad(plantillas_habilidad[i % len(plantillas_habilidad)][0]),
+         lambda i: base.Habilidad(con_habilidades[i % len(con_habilidades)]['habilidades'][0])),
+        ("EstadoCarta", lambda i: EstadoCarta(cartas[i]), lambda i: base.EstadoCarta(cartas_base[i])),
+    ]
+
+    print(f"{'clase':<14}{'antes (B)':>12}{'ahora (B)':>12}{'factor':>9}")
+    for nombre, actual, referencia in filas:
+        ahora = _medir(actual, args.cantidad)
+        antes = _medir(referencia, args.cantidad)
+        print(f"{nombre:<14}{antes:>12.0f}{ahora:>12.0f}{antes / ahora:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
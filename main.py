@@ -3,8 +3,6 @@
 Auto-battler - Punto de entrada principal
 """
 
-import time
-
 from src.core.motor_juego import MotorJuego
 from src.core.jugador import Jugador
 from src.gui import ejecutar_gui
@@ -19,12 +17,11 @@ def main():
 
     try:
         jugadores = [Jugador(i + 1, f"Jugador {i+1}") for i in range(2)]
-        motor = MotorJuego(jugadores)
+        motor = MotorJuego(jugadores, headless=True)
         motor.iniciar()
+        # En modo headless cada combate se resuelve dentro de finalizar_fase()
         while len(motor.jugadores_vivos) > 1 and motor.ronda <= 5:
             motor.controlador_preparacion.finalizar_fase()
-            while motor.fase_actual != "preparacion" and len(motor.jugadores_vivos) > 1:
-                time.sleep(0.1)
 
         if motor.jugadores_vivos:
             print(f"🏆 Ganador: {motor.jugadores_vivos[0].nombre}")
@@ -61,12 +58,10 @@ def main_con_opciones():
 
     print()
     jugadores = [Jugador(i + 1, f"Jugador {i+1}") for i in range(num_jugadores)]
-    motor = MotorJuego(jugadores)
+    motor = MotorJuego(jugadores, headless=True)
     motor.iniciar()
     while len(motor.jugadores_vivos) > 1 and motor.ronda <= 5:
         motor.controlador_preparacion.finalizar_fase()
-        while motor.fase_actual != "preparacion" and len(motor.jugadores_vivos) > 1:
-            time.sleep(0.1)
 
 
 def juego_manual():
@@ -81,7 +76,7 @@ def juego_manual():
         nombres.append(n.strip() or f"Jugador {i+1}")
 
     jugadores = [Jugador(i + 1, nombre) for i, nombre in enumerate(nombres)]
-    motor = MotorJuego(jugadores)
+    motor = MotorJuego(jugadores, headless=True)
     motor.iniciar()
 
     while len(motor.jugadores_vivos) > 1 and motor.ronda <= 5:
@@ -107,8 +102,6 @@ def juego_manual():
                     continue
                 print(tienda.comprar_carta(idx))
         motor.controlador_preparacion.finalizar_fase()
-        while motor.fase_actual != "preparacion" and len(motor.jugadores_vivos) > 1:
-            time.sleep(0.1)
 
     if motor.jugadores_vivos:
         print(f"🏆 Ganador: {motor.jugadores_vivos[0].nombre}")
@@ -1,5 +1,4 @@
 import random
-import time
 from src.core.jugador import Jugador
 from src.core.motor_juego import MotorJuego
 from src.utils.helpers import log_evento
@@ -187,24 +186,52 @@ def mostrar_resumen_ronda(jugadores, ronda):
         log_evento(f"   🎫 Tokens reroll: {estado['tokens_reroll']}")
 
 
-def simular_juego():
-    """Función principal de simulación del juego"""
+def resumir_partida(motor, semilla=None) -> dict:
+    """Extrae el resultado de una partida terminada en un dict serializable"""
+    ganador = motor.jugadores_vivos[0] if len(motor.jugadores_vivos) == 1 else None
+    return {
+        'semilla': semilla,
+        'ganador': ganador.nombre if ganador else None,
+        'rondas': motor.ronda,
+        'jugadores': [
+            {
+                'nombre': jugador.nombre,
+                'vida': jugador.vida,
+                'nivel': jugador.nivel,
+                'oro': jugador.oro,
+                'oro_total_ganado': jugador.stats_partida['oro_total_ganado'],
+                'dano_total_recibido': jugador.stats_partida['dano_total_recibido'],
+                'vivo': jugador in motor.jugadores_vivos
+            }
+            for jugador in motor.jugadores
+        ]
+    }
+
+
+def simular_juego(headless: bool = True, semilla=None, num_jugadores: int = 2, ronda_maxima: int = 10) -> dict:
+    """Función principal de simulación del juego
+
+    Con headless=True los combates corren con reloj virtual y cada ronda se
+    resuelve sin esperas de tiempo real. Con una semilla la partida es
+    reproducible. Retorna el resumen de la partida (ver resumir_partida).
+    """
     log_evento("🎮 === INICIANDO SIMULACIÓN DE AUTO-BATTLER ===")
 
+    if semilla is not None:
+        random.seed(semilla)
+
     # Crear jugadores con nombres históricos
     nombres_jugadores = ["Napoleón Bonaparte", "Marie Curie", "Leonardo da Vinci", "Cleopatra"]
     jugadores = [crear_jugador_mock(i + 1, nombre) for i, nombre in
-                 enumerate(nombres_jugadores[:2])]  # Empezar con 2 jugadores
+                 enumerate(nombres_jugadores[:num_jugadores])]
 
     log_evento(f"👥 Jugadores creados: {[j.nombre for j in jugadores]}")
 
     # Inicializar motor con jugadores
-    motor = MotorJuego(jugadores)
+    motor = MotorJuego(jugadores, headless=headless)
     motor.iniciar()
 
-    # Loop principal del juego
-    ronda_maxima = 10  # Límite de seguridad
-
+    # Loop principal del juego (ronda_maxima es el límite de seguridad)
     while len(motor.jugadores_vivos) > 1 and motor.ronda <= ronda_maxima:
         ronda = motor.ronda
         log_evento(f"\n{'=' * 60}")
@@ -243,18 +270,13 @@ def simular_juego():
         log_evento(f"\n⚔️ === FASE DE ENFRENTAMIENTO (RONDA {ronda}) ===")
         log_evento("🤖 Los jugadores entran en combate automático...")
 
-        # Esperar un poco para simular el combate
-        time.sleep(0.5)
-
-        # El combate se resuelve automáticamente en el motor
-        # Cuando termine, continuará con la siguiente ronda o terminará el juego
+        # El combate ya se resolvió dentro de finalizar_fase(): el motor de
+        # juego bloquea hasta que termina la fase de enfrentamiento y luego
+        # continúa con la siguiente ronda o termina el juego
 
         # Mostrar resumen de la ronda
         mostrar_resumen_ronda(motor.jugadores_vivos, ronda)
 
-        # Pequeña pausa entre rondas
-        time.sleep(1)
-
     # === FINAL DEL JUEGO ===
     log_evento(f"\n🏁 === JUEGO TERMINADO ===")
 
@@ -274,6 +296,7 @@ def simular_juego():
         log_evento(f"🎖️ Supervivientes: {supervivientes}")
 
     log_evento("✅ Simulación completada exitosamente")
+    return resumir_partida(motor, semilla)
 
 
 if __name__ == "__main__":
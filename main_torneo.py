@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Torneo de simulaciones - Reparte N partidas con semilla entre varios procesos
+y agrega sus resultados en un reporte para barridos de balance
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any
+
+
+def _preparar_catalogo() -> bool:
+    """Genera o valida el catálogo columnar una sola vez, antes de que los trabajadores lo abran"""
+    from src.game.cartas.catalogo_columnar import abrir_catalogo_columnar
+    from src.game.cartas.manager_cartas import manager_cartas
+
+    catalogo = abrir_catalogo_columnar(manager_cartas.archivo_cartas)
+    if catalogo is None:
+        return False
+    catalogo.cerrar()
+    return True
+
+
+def _inicializar_trabajador(silencioso: bool, catalogo_columnar: bool = False):
+    """Prepara cada proceso trabajador (el pool de cartas es propio de cada proceso)"""
+    if catalogo_columnar:
+        from src.game.cartas.manager_cartas import manager_cartas
+
+        # Todos los trabajadores mapean el mismo archivo: las páginas del catálogo se comparten
+        # y recargar en cada partida no vuelve a leer el JSON ni a deserializar el pickle
+        manager_cartas.usar_catalogo_columnar = True
+
+    if silencioso:
+        from src.utils.registro import configurar_registro
+
+        # Filtrar por nivel evita incluso formatear los mensajes de las partidas
+        configurar_registro(nivel="ERROR")
+        sys.stdout = open(os.devnull, "w", encoding="utf-8")
+
+
+def jugar_partida(semilla: int, num_jugadores: int = 2, ronda_maxima: int = 10) -> Dict[str, Any]:
+    """Juega una partida headless completa con la semilla indicada"""
+    from main_simulacion import simular_juego
+    from src.game.cartas.manager_cartas import manager_cartas
+
+    # Recargar crea instancias nuevas: ninguna carta arrastra estado de la partida anterior
+    manager_cartas.cargar_cartas()
+    return simular_juego(headless=True, semilla=semilla, num_jugadores=num_jugadores,
+                         ronda_maxima=ronda_maxima)
+
+
+def ejecutar_torneo(num_partidas: int, procesos: int = None, semilla_base: int = 0,
+                    num_jugadores: int = 2, ronda_maxima: int = 10,
+                    silencioso: bool = True) -> Dict[str, Any]:
+    """
+    Ejecuta num_partidas partidas en paralelo y retorna el reporte agregado
+
+    Args:
+        num_partidas: Cantidad de partidas a simular
+        procesos: Procesos trabajadores (None = uno por núcleo)
+        semilla_base: Semilla de la primera partida; la partida i usa semilla_base + i
+        num_jugadores: Jugadores por partida (2-4)
+        ronda_maxima: Límite de rondas por partida
+        silencioso: Descarta el log de consola de los trabajadores
+    """
+    semillas = [semilla_base + i for i in range(num_partidas)]
+    inicio = time.time()
+    # Si no se pudo generar, cada trabajador usa el catálogo compilado como antes
+    catalogo_columnar = _preparar_catalogo()
+
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar_trabajador,
+                             initargs=(silencioso, catalogo_columnar)) as executor:
+        resultados = list(executor.map(
+            jugar_partida, semillas,
+            [num_jugadores] * num_partidas,
+            [ronda_maxima] * num_partidas,
+            chunksize=max(1, num_partidas // ((procesos or os.cpu_count() or 1) * 4))
+        ))
+
+    reporte = agregar_resultados(resultados)
+    reporte['tiempo_total'] = time.time() - inicio
+    reporte['partidas_por_segundo'] = (num_partidas / reporte['tiempo_total']
+                                       if reporte['tiempo_total'] > 0 else 0.0)
+    return reporte
+
+
+def agregar_resultados(resultados: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Agrega los resúmenes de partida en estadísticas de ganadores, rondas, oro y daño"""
+    if not resultados:
+        return {'partidas': 0}
+
+    victorias = Counter(r['ganador'] for r in resultados if r['ganador'])
+    rondas = [r['rondas'] for r in resultados]
+
+    por_jugador: Dict[str, Dict[str, float]] = {}
+    for resultado in resultados:
+        for datos in resultado['jugadores']:
+            acumulado = por_jugador.setdefault(datos['nombre'], {
+                'partidas': 0, 'oro_total_ganado': 0, 'dano_total_recibido': 0, 'nivel': 0
+            })
+            acumulado['partidas'] += 1
+            acumulado['oro_total_ganado'] += datos['oro_total_ganado']
+            acumulado['dano_total_recibido'] += datos['dano_total_recibido']
+            acumulado['nivel'] += datos['nivel']
+
+    estadisticas_jugadores = {
+        nombre: {
+            'victorias': victorias.get(nombre, 0),
+            'ratio_victorias': victorias.get(nombre, 0) / datos['partidas'],
+            'oro_promedio': datos['oro_total_ganado'] / datos['partidas'],
+            'dano_promedio': datos['dano_total_recibido'] / datos['partidas'],
+            'nivel_promedio': datos['nivel'] / datos['partidas']
+        }
+        for nombre, datos in por_jugador.items()
+    }
+
+    return {
+        'partidas': len(resultados),
+        'empates_o_limite': len(resultados) - sum(victorias.values()),
+        'rondas_promedio': sum(rondas) / len(rondas),
+        'rondas_min': min(rondas),
+        'rondas_max': max(rondas),
+        'jugadores': estadisticas_jugadores
+    }
+
+
+def mostrar_reporte(reporte: Dict[str, Any]):
+    """Imprime el reporte agregado del torneo"""
+    print("=" * 60)
+    print(f"🏟️  TORNEO: {reporte['partidas']} partidas")
+    if 'tiempo_total' in reporte:
+        print(f"⏱️  {reporte['tiempo_total']:.2f}s ({reporte['partidas_por_segundo']:.1f} partidas/s)")
+    if not reporte['partidas']:
+        return
+    print(f"🔁 Rondas: promedio {reporte['rondas_promedio']:.1f} "
+          f"(min {reporte['rondas_min']}, max {reporte['rondas_max']})")
+    print(f"🤝 Sin ganador: {reporte['empates_o_limite']}")
+    for nombre, stats in sorted(reporte['jugadores'].items()):
+        print(f"👤 {nombre}: {stats['victorias']} victorias ({stats['ratio_victorias']:.0%}), "
+              f"oro {stats['oro_promedio']:.1f}, daño recibido {stats['dano_promedio']:.1f}, "
+              f"nivel {stats['nivel_promedio']:.1f}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulación de partidas en paralelo")
+    parser.add_argument("-n", "--partidas", type=int, default=100, help="Cantidad de partidas")
+    parser.add_argument("-p", "--procesos", type=int, default=None, help="Procesos (default: núcleos)")
+    parser.add_argument("-s", "--semilla", type=int, default=0, help="Semilla base")
+    parser.add_argument("-j", "--jugadores", type=int, default=2, help="Jugadores por partida (2-4)")
+    parser.add_argument("-r", "--rondas", type=int, default=10, help="Límite de rondas")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Mostrar el log de los trabajadores")
+    args = parser.parse_args()
+
+    reporte = ejecutar_torneo(args.partidas, procesos=args.procesos, semilla_base=args.semilla,
+                              num_jugadores=args.jugadores, ronda_maxima=args.rondas,
+                              silencioso=not args.verbose)
+    mostrar_reporte(reporte)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,8 @@ Clase Jugador - Representa a un jugador en el auto-battler
 
 from src.utils.helpers import log_evento, validar_rango
 from src.game.tablero.tablero_hexagonal import TableroHexagonal
-from src.data.config.game_config import GameConfig
+from src.game.cartas.fusion_cartas import BANCO, IndiceFusiones
+from src.data.config.game_config import obtener_config
 
 
 class Jugador:
@@ -14,7 +15,7 @@ class Jugador:
         self.nombre = nombre
 
         # Configuración del juego
-        self.config = GameConfig()
+        self.config = obtener_config()  # Compartida por proceso (ver game_config)
 
         # Stats básicos
         self.vida_maxima = 100
@@ -27,6 +28,9 @@ class Jugador:
         self.eliminado = False
         self.ronda_eliminacion = None
 
+        # Índice de fusiones: sigue al tablero y al banco (ver las propiedades de abajo)
+        self.indice_fusiones = IndiceFusiones()
+
         # Tablero hexagonal individual (NUEVO)
         self.tablero = TableroHexagonal()
 
@@ -55,6 +59,24 @@ class Jugador:
     def cartas(self):
         return self.cartas_banco
 
+    @property
+    def tablero(self):
+        return self._tablero
+
+    @tablero.setter
+    def tablero(self, tablero):
+        self._tablero = tablero
+        self.indice_fusiones.vincular_tablero(tablero)
+
+    @property
+    def cartas_banco(self):
+        return self._cartas_banco
+
+    @cartas_banco.setter
+    def cartas_banco(self, cartas):
+        self._cartas_banco = cartas
+        self.indice_fusiones.vincular_banco(cartas)
+
     # === MÉTODOS DE VIDA Y ESTADO (sin cambios) ===
 
     def esta_vivo(self):
@@ -212,7 +234,7 @@ class Jugador:
 
         # Intentar colocar la carta
         if self.tablero.colocar_carta(coordenada, carta):
-            log_evento(f"✅ {self.nombre} coloca carta en {coordenada}")
+            log_evento(lambda: f"✅ {self.nombre} coloca carta en {coordenada}", "DEBUG")
             return True
         return False
 
@@ -252,6 +274,7 @@ class Jugador:
             if carta is not None:
                 cartas_removidas.append(carta)
                 self.cartas_banco.append(carta)
+                self.indice_fusiones.agregar(carta, BANCO)
 
         self.tablero.limpiar_tablero()
         log_evento(f"🧹 {self.nombre} limpia tablero: {len(cartas_removidas)} cartas al banco")
@@ -271,6 +294,7 @@ class Jugador:
             return False
 
         self.cartas_banco.append(carta)
+        self.indice_fusiones.agregar(carta, BANCO)
         carta.duenio = self  # NUEVO: Asignar dueño
         log_evento(
             f"📦 {self.nombre} guarda '{carta.nombre}' en banco ({len(self.cartas_banco)}/{self.MAX_CARTAS_BANCO})")
@@ -280,9 +304,8 @@ class Jugador:
             cartas_nombres = [c.nombre for c in self.cartas_banco if c is not None]
             log_evento(f"   Banco actual: {cartas_nombres}")
 
-        # Fusionar automáticamente si es posible
-        from src.game.cartas.fusion_cartas import aplicar_fusiones
-        eventos = aplicar_fusiones(self.tablero, self.cartas_banco)
+        # Fusionar automáticamente si es posible (el índice ya sabe si hay candidatos)
+        eventos = self.indice_fusiones.resolver(self.cartas_banco)
         for evento in eventos:
             log_evento(f"🔧 {self.nombre}: {evento}")
 
@@ -292,7 +315,9 @@ class Jugador:
         """Saca una carta del banco por índice"""
         if 0 <= indice < len(self.cartas_banco):
             carta = self.cartas_banco.pop(indice)
-            log_evento(f"📤 {self.nombre} saca carta del banco")
+            if carta is not None:
+                self.indice_fusiones.quitar(carta, BANCO)
+            log_evento(lambda: f"📤 {self.nombre} saca carta del banco", "DEBUG")
             return carta
         return None
 
@@ -386,7 +411,7 @@ class Jugador:
             'rerolls_usados': 0
         }
         self.tablero.limpiar_tablero()
-        self.cartas_banco.clear()
+        self.cartas_banco = []  # Por la propiedad, para que el índice de fusiones olvide el banco anterior
 
     def __str__(self):
         """Representación en string del jugador"""
@@ -2,12 +2,16 @@ import random
 import time
 
 from src.core.jugador import Jugador
-from src.data.config.game_config import GameConfig
+from src.data.config.game_config import obtener_config
+from src.game.cartas.almacen_combate import AlmacenCombate
 from src.game.cartas.manager_cartas import manager_cartas
+from src.game.combate.configuracion_tiempo_real import configurador_tiempo_real
 from src.game.combate.interacciones.gestor_interacciones import GestorInteracciones
 from src.game.combate.mapa.mapa_global import MapaGlobal
 from src.game.combate.motor.motor_tiempo_real import MotorTiempoReal
+from src.game.combate.motor.reloj import RelojVirtual
 from src.utils.helpers import log_evento
+from src.utils.registro_estructurado import CodigoEvento
 from src.game.combate.fase.secuencia_turnos import generar_secuencia_turnos
 
 from src.game.combate.fase.controlador_fase_enfrentamiento import ControladorFaseEnfrentamiento
@@ -16,13 +20,23 @@ from src.game.fases.controlador_preparacion import ControladorFasePreparacion
 
 
 class MotorJuego:
-    def __init__(self, jugadores: list[Jugador]):
+    def __init__(self, jugadores: list[Jugador], headless: bool = False, anfitrion=None,
+                 registro_combate=None):
         self.jugadores = jugadores
         self.jugadores_vivos = list(jugadores)
         self.fase_actual = "preparacion"
         self.ronda = 1
+        # En modo headless el combate corre con reloj virtual, sin esperas
+        self.headless = headless
+        # Con un AnfitrionPartidas el combate se procesa en su loop compartido
+        # y _ejecutar_fase_combate no bloquea
+        self.anfitrion = anfitrion
+        self.id_partida = None
+        # RegistroEstructurado opcional con los eventos de cada combate (se vuelca al terminar la fase)
+        self.registro_combate = registro_combate
+        self.gestor_interacciones = None
         # Controlador especializado para la fase de preparación
-        self.config = GameConfig()
+        self.config = obtener_config()
         self.controlador_preparacion = ControladorFasePreparacion(self.jugadores_vivos, motor=self, config=self.config)
 
     def iniciar(self):
@@ -51,8 +65,23 @@ class MotorJuego:
             mapa.ubicar_jugador_en_zona(jugador, color)
 
         # 3. Crear gestor de interacciones y motor
-        gestor = GestorInteracciones(tablero=mapa.tablero)
-        self.motor = MotorTiempoReal(fps_objetivo=20)
+        gestor = GestorInteracciones(tablero=mapa.tablero, eventos=self.registro_combate,
+                                     almacen=AlmacenCombate())
+        self.gestor_interacciones = gestor
+        # Cada carta del tablero entra al combate con su estado y el bonus de sinergia de su equipo
+        # (sin esto el gestor no tenía estados registrados y los ataques no hacían daño)
+        gestor.preparar_combate(mapa.tablero.obtener_cartas())
+        if self.registro_combate is not None:
+            self.registro_combate.tick = 0
+            self.registro_combate.registrar(CodigoEvento.INICIO_COMBATE, self.ronda,
+                                            mapa.tablero.contar_cartas())
+        if self.anfitrion is not None:
+            reloj = self.anfitrion.reloj
+        else:
+            reloj = RelojVirtual() if self.headless else None
+        # FPS, límites y presupuestos salen de config/tiempo_real.json y se recargan en caliente
+        self.motor = MotorTiempoReal(reloj=reloj, configurador=configurador_tiempo_real,
+                                     leer_fps=lambda config: config.turnos.fps_durante_combate)
         self.motor.agregar_componente(gestor)
 
         # 4. Inicializar turnos y controlador
@@ -61,16 +90,38 @@ class MotorJuego:
             motor=self.motor,
             jugadores_por_color=jugadores_por_color,
             secuencia_turnos=secuencia,
-            al_terminar_fase=self.transicionar_a_fase_preparacion
+            al_terminar_fase=self._finalizar_fase_combate
         )
 
         self.motor.agregar_componente(controlador)
         controlador.iniciar_fase()
 
         # 5. Ejecutar motor de tiempo real
+        if self.anfitrion is not None:
+            self.id_partida = self.anfitrion.agregar_motor(self.motor, self.id_partida)
+            return
+
+        if self.headless:
+            self.motor.ejecutar_hasta(lambda: controlador.finalizada)
+            return
+
         self.motor.iniciar()
         while not controlador.finalizada and self.motor.estado.value == "ejecutando":
             time.sleep(0.1)
+        self.motor.detener()
+
+    def _finalizar_fase_combate(self):
+        if self.registro_combate is not None:
+            estados = self.gestor_interacciones.estados_cartas.values() if self.gestor_interacciones else ()
+            vivas = sum(1 for estado in estados if estado.esta_viva())
+            self.registro_combate.registrar(CodigoEvento.FIN_COMBATE, self.ronda, vivas)
+            self.registro_combate.volcar()
+
+        # Un motor hospedado no tiene hilo propio: se retira del anfitrión aquí
+        if self.anfitrion is not None:
+            self.anfitrion.remover_motor(self.id_partida)
+        self.transicionar_a_fase_preparacion()
+
     def transicionar_a_fase_preparacion(self):
         log_evento("🔄 Transición a fase de preparación...")
 
@@ -1,15 +1,73 @@
 import json
 import os
+import threading
+from typing import Dict, Tuple
 
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "game_config.json")
 
+_CAMPOS = ("fase_preparacion_segundos", "subasta_ratio", "oro_por_ronda", "cartas_por_tienda", "costos_nivel")
+
+# Una configuración por archivo y proceso: ruta → (mtime_ns, GameConfig)
+_cache: Dict[str, Tuple[int, "GameConfig"]] = {}
+_lock = threading.Lock()
+
+
 class GameConfig:
-    def __init__(self):
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+    """
+    Configuración de partida inmutable y compartida por proceso.
+    GameConfig() retorna la instancia en cache (se relee solo si cambió el mtime
+    del JSON); recargar_config() fuerza la relectura.
+    """
+
+    __slots__ = _CAMPOS + ("ruta",)
+
+    def __new__(cls):
+        return obtener_config()
+
+    @classmethod
+    def _desde_archivo(cls, ruta: str) -> "GameConfig":
+        with open(ruta, "r", encoding="utf-8") as f:
             data = json.load(f)
 
-        self.fase_preparacion_segundos = data.get("fase_preparacion_segundos", 30)
-        self.subasta_ratio = data.get("subasta_ratio", 0.5)
-        self.oro_por_ronda = data.get("oro_por_ronda", 10)
-        self.cartas_por_tienda = data.get("cartas_por_tienda", 5)
-        self.costos_nivel = data.get("costos_nivel", [0, 2, 6, 12, 20, 30, 42, 56, 72, 90])
+        config = object.__new__(cls)
+        fijar = object.__setattr__
+        fijar(config, "ruta", ruta)
+        fijar(config, "fase_preparacion_segundos", data.get("fase_preparacion_segundos", 30))
+        fijar(config, "subasta_ratio", data.get("subasta_ratio", 0.5))
+        fijar(config, "oro_por_ronda", data.get("oro_por_ronda", 10))
+        fijar(config, "cartas_por_tienda", data.get("cartas_por_tienda", 5))
+        fijar(config, "costos_nivel", tuple(data.get("costos_nivel", [0, 2, 6, 12, 20, 30, 42, 56, 72, 90])))
+        return config
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("GameConfig es inmutable (usar recargar_config)")
+
+    def __delattr__(self, nombre):
+        raise AttributeError("GameConfig es inmutable (usar recargar_config)")
+
+    def __reduce__(self):
+        # En otro proceso se obtiene la configuración de ese proceso
+        return obtener_config, (self.ruta,)
+
+    def __repr__(self):
+        valores = ", ".join(f"{campo}={getattr(self, campo)!r}" for campo in _CAMPOS)
+        return f"GameConfig({valores})"
+
+
+def obtener_config(ruta: str = CONFIG_PATH) -> GameConfig:
+    """Configuración en cache del proceso; se relee si el JSON cambió desde la última carga"""
+    mtime = os.stat(ruta).st_mtime_ns
+    entrada = _cache.get(ruta)
+    if entrada is not None and entrada[0] == mtime:
+        return entrada[1]
+    return recargar_config(ruta, mtime)
+
+
+def recargar_config(ruta: str = CONFIG_PATH, mtime: int = None) -> GameConfig:
+    """Relee el JSON y reemplaza la configuración en cache (los objetos ya creados conservan la anterior)"""
+    with _lock:
+        if mtime is None:
+            mtime = os.stat(ruta).st_mtime_ns
+        config = GameConfig._desde_archivo(ruta)
+        _cache[ruta] = (mtime, config)
+        return config
@@ -0,0 +1,104 @@
+"""
+Almacén columnar del estado de combate
+Vida, daño, defensas, cooldowns y bonus de sinergia de todas las
+unidades de un combate se guardan en arrays paralelos indexados por un slot
+denso. Cada EstadoCarta registrado pasa a ser una vista sobre su slot; el
+avance de cooldowns se hace en un solo recorrido y el cálculo de daño en lote
+lee las columnas directamente.
+"""
+
+from array import array
+from typing import List, Optional
+
+from src.game.cartas.estado_carta import EstadoCarta, _TOLERANCIA_COOLDOWN
+
+# Columna → (typecode, atributo privado de EstadoCarta del que se copia al registrar)
+_COLUMNAS = {
+    'vida': ('q', '_vida_actual'),
+    'dano': ('q', '_dano_base'),
+    'defensa_fisica': ('q', '_defensa_fisica'),
+    'defensa_magica': ('q', '_defensa_magica'),
+    'cooldown': ('d', '_cooldown_ataque'),
+    'intervalo': ('d', '_intervalo_ataque'),
+    'bonus_fisico': ('q', '_bonus_dano_fisico'),
+    'bonus_magico': ('q', '_bonus_dano_magico'),
+    'viva': ('b', '_viva'),
+}
+
+
+class AlmacenCombate:
+    """Estado de combate en columnas array paralelas; los slots liberados se reutilizan"""
+
+    def __init__(self):
+        for columna, (tipo, _) in _COLUMNAS.items():
+            setattr(self, columna, array(tipo))
+
+        self.estados: List[Optional[EstadoCarta]] = []  # slot → estado
+        self._slots_libres: List[int] = []
+
+    def __len__(self):
+        return len(self.estados) - len(self._slots_libres)
+
+    # === REGISTRO ===
+
+    def registrar(self, estado: EstadoCarta) -> int:
+        """Copia el estado a un slot y lo convierte en vista sobre él"""
+        if estado.almacen is self:
+            return estado._slot
+        if estado.almacen is not None:
+            estado.almacen.liberar(estado)
+
+        valores = {columna: getattr(estado, privado) for columna, (_, privado) in _COLUMNAS.items()}
+        valores['vida'] = int(valores['vida'])
+        valores['viva'] = 1 if valores['viva'] else 0
+
+        if self._slots_libres:
+            slot = self._slots_libres.pop()
+            for columna, valor in valores.items():
+                getattr(self, columna)[slot] = valor
+            self.estados[slot] = estado
+        else:
+            slot = len(self.estados)
+            for columna, valor in valores.items():
+                getattr(self, columna).append(valor)
+            self.estados.append(estado)
+
+        estado._almacen = self
+        estado._slot = slot
+        return slot
+
+    def liberar(self, estado: EstadoCarta):
+        """Devuelve los datos al objeto y libera su slot"""
+        if estado.almacen is not self:
+            return
+        slot = estado._slot
+        for columna, (_, privado) in _COLUMNAS.items():
+            setattr(estado, privado, getattr(self, columna)[slot])
+        estado._viva = bool(estado._viva)
+
+        estado._almacen = None
+        estado._slot = -1
+        self.viva[slot] = 0
+        self.estados[slot] = None
+        self._slots_libres.append(slot)
+
+    # === OPERACIONES POR LOTE ===
+    # El daño se sigue aplicando ataque por ataque (ver GestorInteracciones) para
+    # conservar el orden de las muertes dentro del tick
+
+    def avanzar_cooldowns(self, delta_time: float) -> List[int]:
+        """Descuenta delta_time a todas las unidades vivas y retorna los slots listos para atacar"""
+        cooldown = self.cooldown
+        viva = self.viva
+        listos = []
+        for slot in range(len(cooldown)):
+            if not viva[slot]:
+                continue
+            restante = cooldown[slot]
+            if restante > 0:
+                # Puede quedar negativo: el exceso se descuenta del siguiente intervalo
+                restante -= delta_time
+                cooldown[slot] = restante
+            if restante <= _TOLERANCIA_COOLDOWN:
+                listos.append(slot)
+        return listos
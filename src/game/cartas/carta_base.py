@@ -2,35 +2,39 @@
 Clase base para todas las cartas del juego
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
+from src.game.cartas.plantilla_carta import PlantillaCarta, PlantillaHabilidad
 from src.game.combate.interacciones.interaccion_modelo import TipoInteraccion, Interaccion
 from src.utils.helpers import log_evento
 
-class Habilidad:
-    """Representa una habilidad de carta"""
 
-    def __init__(self, datos_habilidad: Dict[str, Any]):
-        self.nombre = datos_habilidad.get('nombre', 'Habilidad Sin Nombre')
-        self.tipo = datos_habilidad.get('tipo', 'pasiva')  # 'activa' o 'pasiva'
-        self.descripcion = datos_habilidad.get('descripcion', '')
+def _de_plantilla(campo: str) -> property:
+    """Atributo de solo lectura que se lee de la plantilla compartida"""
+    return property(lambda self: getattr(self.plantilla, campo))
 
-        # Propiedades para habilidades activas
-        self.costo_mana = datos_habilidad.get('costo_mana', 0)
-        self.cooldown = datos_habilidad.get('cooldown', 0)
-        self.cooldown_actual = 0
-        self.rango = datos_habilidad.get('rango', 1)
-        self.duracion = datos_habilidad.get('duracion', 0)
 
+class Habilidad:
+    """Representa una habilidad de carta (datos en la plantilla, cooldown propio)"""
 
-        # Propiedades para habilidades pasivas
-        self.trigger = datos_habilidad.get('trigger', 'permanente')
-        self.area = datos_habilidad.get('area', 'single')
+    __slots__ = ('plantilla', 'cooldown_actual')
+
+    def __init__(self, datos_habilidad: Union[Dict[str, Any], PlantillaHabilidad]):
+        if not isinstance(datos_habilidad, PlantillaHabilidad):
+            datos_habilidad = PlantillaHabilidad(datos_habilidad)
+        self.plantilla = datos_habilidad
+        self.cooldown_actual = 0
 
-        # Propiedades especiales
-        self.propiedades = {k: v for k, v in datos_habilidad.items()
-                            if k not in ['nombre', 'tipo', 'descripcion', 'costo_mana',
-                                         'cooldown', 'rango', 'duracion', 'trigger', 'area']}
+    nombre = _de_plantilla('nombre')
+    tipo = _de_plantilla('tipo')  # 'activa' o 'pasiva'
+    descripcion = _de_plantilla('descripcion')
+    costo_mana = _de_plantilla('costo_mana')
+    cooldown = _de_plantilla('cooldown')
+    rango = _de_plantilla('rango')
+    duracion = _de_plantilla('duracion')
+    trigger = _de_plantilla('trigger')
+    area = _de_plantilla('area')
+    propiedades = _de_plantilla('propiedades')
 
     def puede_usar(self) -> bool:
         """Verifica si la habilidad puede ser usada"""
@@ -58,31 +62,66 @@ class Habilidad:
 
 
 class CartaBase:
-    """Clase base para todas las cartas del juego"""
+    """
+    Clase base para todas las cartas del juego
+    Los datos estáticos viven en una PlantillaCarta compartida por todas las copias;
+    la instancia guarda solo su estado de partida.
+    """
+
+    __slots__ = (
+        'plantilla', 'id', 'duenio', 'tier',
+        # Control del pool (ManagerCartas)
+        'carta_base_id', 'numero_copia', '_en_uso',
+        # Stats
+        'vida_maxima', 'vida_actual',
+        'dano_fisico_base', 'dano_magico_base', 'defensa_fisica_base', 'defensa_magica_base',
+        'rango_movimiento_base', 'rango_ataque_base',
+        'dano_fisico_actual', 'dano_magico_actual', 'defensa_fisica_actual', 'defensa_magica_actual',
+        'rango_movimiento_actual', 'rango_ataque_actual',
+        'mana_maxima', 'mana_actual',
+        # Estado
+        'habilidades', 'viva', 'puede_actuar', 'efectos_activos', 'coordenada',
+        'stats_combate', 'modo_control', 'orden_manual_pendiente',
+    )
+
+    def __init__(self, datos_carta: Union[Dict[str, Any], PlantillaCarta]):
+        # Un dict crea una plantilla propia; ManagerCartas pasa la plantilla compartida del catálogo
+        plantilla = datos_carta if isinstance(datos_carta, PlantillaCarta) else PlantillaCarta(datos_carta)
+        self.plantilla = plantilla
+        self.id = plantilla.id
+
+        self.carta_base_id = plantilla.id
+        self.numero_copia = 0
+        self._en_uso = False
+
+        # Habilidades
+        self.habilidades: List[Habilidad] = [Habilidad(hab) for hab in plantilla.habilidades]
+
+        self._inicializar_estado()
+
+    # Datos estáticos compartidos
+    nombre = _de_plantilla('nombre')
+    descripcion = _de_plantilla('descripcion')
+    costo = _de_plantilla('costo')
+    rol = _de_plantilla('rol')
+    categoria = _de_plantilla('categoria')
+    intervalo_ataque = _de_plantilla('intervalo_ataque')  # segundos entre ataques
 
-    def __init__(self, datos_carta: Dict[str, Any]):
-        # Identificación
+    def _inicializar_estado(self):
+        """Todo lo que puede cambiar durante una partida, a partir de la plantilla"""
+        plantilla = self.plantilla
         self.duenio = None
-        self.id = datos_carta.get('id', 0)
-        self.nombre = datos_carta.get('nombre', 'Carta Sin Nombre')
-        self.descripcion = datos_carta.get('descripcion', '')
-
-        # Metadatos
-        self.tier = datos_carta.get('tier', 1)
-        self.costo = datos_carta.get('costo', 1)
-        self.rol = datos_carta.get('rol', 'basico')
-        self.categoria = datos_carta.get('categoria', 'general')
-
-        # Stats base (de los datos JSON)
-        stats_data = datos_carta.get('stats', {})
-        self.vida_maxima = stats_data.get('vida', 100)
+        self.tier = plantilla.tier
+
+        # Stats base (pueden crecer con modificadores permanentes)
+        self.vida_maxima = plantilla.vida
         self.vida_actual = self.vida_maxima
-        self.dano_fisico_base = stats_data.get('dano_fisico', 10)
-        self.dano_magico_base = stats_data.get('dano_magico', 0)
-        self.defensa_fisica_base = stats_data.get('defensa_fisica', 0)
-        self.defensa_magica_base = stats_data.get('defensa_magica', 0)
-        self.rango_movimiento_base = stats_data.get('rango_movimiento', 1)
-        self.rango_ataque_base = stats_data.get('rango_ataque', 1)
+        self.dano_fisico_base = plantilla.dano_fisico
+        self.dano_magico_base = plantilla.dano_magico
+        self.defensa_fisica_base = plantilla.defensa_fisica
+        self.defensa_magica_base = plantilla.defensa_magica
+        self.rango_movimiento_base = plantilla.rango_movimiento
+        self.rango_ataque_base = plantilla.rango_ataque
 
         # Stats actuales (pueden ser modificados por efectos)
         self.dano_fisico_actual = self.dano_fisico_base
@@ -96,10 +135,6 @@ class CartaBase:
         self.mana_maxima = 100
         self.mana_actual = 0
 
-        # Habilidades
-        self.habilidades: List[Habilidad] = []
-        self._cargar_habilidades(datos_carta.get('habilidades', []))
-
         # Estado de la carta
         self.viva = True
         self.puede_actuar = True
@@ -127,11 +162,11 @@ class CartaBase:
             "stats": {"vida": 100, "dano_fisico": 10}
         })
 
-    def _cargar_habilidades(self, habilidades_data: List[Dict[str, Any]]):
-        """Carga las habilidades desde los datos JSON"""
-        for hab_data in habilidades_data:
-            habilidad = Habilidad(hab_data)
-            self.habilidades.append(habilidad)
+    def reiniciar_estado(self):
+        """Devuelve la carta al estado de recién creada sin reconstruir sus habilidades (reciclaje del pool)"""
+        self._inicializar_estado()
+        for habilidad in self.habilidades:
+            habilidad.cooldown_actual = 0
 
     # === MÉTODOS DE VIDA Y ESTADO ===
 
@@ -260,7 +295,10 @@ class CartaBase:
                 self.dano_fisico_actual += valor
             elif stat == 'dano_magico':
                 self.dano_magico_actual += valor
-            # ... etc para otros stats
+            elif stat == 'defensa_fisica':
+                self.defensa_fisica_actual += valor
+            elif stat == 'defensa_magica':
+                self.defensa_magica_actual += valor
 
     def resetear_stats_temporales(self):
         """Resetea los stats actuales a los valores base"""
@@ -0,0 +1,301 @@
+"""
+Catálogo de cartas columnar y mapeado en memoria
+Formato binario para catálogos de decenas de miles de cartas: stats numéricos
+en columnas de ancho fijo, una tabla de textos (nombres, descripciones,
+habilidades) y arrays de offsets para las habilidades de cada carta. El archivo
+se abre con mmap de solo lectura, así que todos los procesos de una simulación
+comparten las mismas páginas en lugar de guardar cada uno los dicts del JSON.
+
+Estructura: b"CCOL" + longitud (uint32) + índice JSON con la cabecera y las
+secciones {nombre: [offset, longitud, typecode]}; cada sección alineada a 8 bytes.
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.game.cartas.catalogo_compilado import TIERS, hash_archivo
+from src.utils.helpers import cargar_json, log_evento
+
+MAGIA = b"CCOL"
+VERSION_COLUMNAR = 1
+EXTENSION_COLUMNAR = ".catalogo.col"
+
+# Columna → (typecode, campo de la carta, valor por defecto); los stats van dentro de "stats"
+_ENTEROS = {
+    'id': ('q', None, 0),
+    'tier': ('q', None, 1),
+    'costo': ('q', None, 1),
+    'vida': ('q', 'stats', 100),
+    'dano_fisico': ('q', 'stats', 10),
+    'dano_magico': ('q', 'stats', 0),
+    'defensa_fisica': ('q', 'stats', 0),
+    'defensa_magica': ('q', 'stats', 0),
+    'rango_movimiento': ('q', 'stats', 1),
+    'rango_ataque': ('q', 'stats', 1),
+    'intervalo_ataque': ('d', 'stats', 1.5),
+}
+# Columnas de texto: índice (uint32) en la tabla de textos
+_TEXTOS = {'nombre': 'Carta Sin Nombre', 'descripcion': '', 'categoria': 'general', 'rol': 'basico'}
+_STATS = tuple(columna for columna, (_, grupo, _) in _ENTEROS.items() if grupo == 'stats')
+_CONOCIDOS = {'id', 'tier', 'costo', 'stats', 'habilidades', *_TEXTOS}
+
+
+def ruta_columnar_de(ruta_json: str) -> str:
+    return os.path.splitext(ruta_json)[0] + EXTENSION_COLUMNAR
+
+
+# === ESCRITURA ===
+
+def escribir_catalogo_columnar(datos: list, ruta: str, cabecera: Optional[Dict[str, Any]] = None) -> int:
+    """Escribe las cartas de `datos` (lista del JSON) en formato columnar; retorna cuántas"""
+    textos: List[str] = []
+    indice_texto: Dict[str, int] = {}
+
+    def texto(valor: str) -> int:
+        indice = indice_texto.get(valor)
+        if indice is None:
+            indice = indice_texto[valor] = len(textos)
+            textos.append(valor)
+        return indice
+
+    texto("")  # El índice 0 es siempre la cadena vacía
+    columnas = {nombre: array(tipo) for nombre, (tipo, _, _) in _ENTEROS.items()}
+    columnas.update({nombre: array('I') for nombre in _TEXTOS})
+    columnas['extras'] = array('I')
+    columnas['habilidades_inicio'] = array('Q', [0])
+    columnas['habilidades'] = array('I')
+
+    for carta in datos:
+        if carta.get('id') is None:
+            continue
+        stats = carta.get('stats', {})
+        for nombre, (_, grupo, defecto) in _ENTEROS.items():
+            origen = stats if grupo == 'stats' else carta
+            columnas[nombre].append(origen.get(nombre, defecto))
+        for nombre, defecto in _TEXTOS.items():
+            columnas[nombre].append(texto(carta.get(nombre, defecto)))
+
+        # Claves fuera del formato fijo se conservan como JSON
+        extras = {k: v for k, v in carta.items() if k not in _CONOCIDOS}
+        stats_extra = {k: v for k, v in stats.items() if k not in _STATS}
+        if stats_extra:
+            extras['stats'] = stats_extra
+        columnas['extras'].append(texto(json.dumps(extras, ensure_ascii=False)) if extras else 0)
+
+        for habilidad in carta.get('habilidades', []):
+            columnas['habilidades'].append(texto(json.dumps(habilidad, ensure_ascii=False)))
+        columnas['habilidades_inicio'].append(len(columnas['habilidades']))
+
+    # Permutación de filas ordenadas por id para buscar con bisect sobre el mmap
+    orden = sorted(range(len(columnas['id'])), key=columnas['id'].__getitem__)
+    columnas['orden_por_id'] = array('Q', orden)
+    columnas['ids_ordenados'] = array('q', [columnas['id'][fila] for fila in orden])
+
+    codificados = [t.encode('utf-8') for t in textos]
+    offsets = array('Q', [0])
+    for bloque in codificados:
+        offsets.append(offsets[-1] + len(bloque))
+    columnas['textos_offset'] = offsets
+    cuerpos = [(nombre, col.typecode, col.tobytes()) for nombre, col in columnas.items()]
+    cuerpos.append(('textos', 'B', b"".join(codificados)))
+
+    # El índice va antes que las secciones: se fija su tamaño y luego se calculan offsets
+    indice = {'version': VERSION_COLUMNAR, 'cartas': len(columnas['id']),
+              'cabecera': cabecera or {}, 'secciones': {}}
+    reserva = len(json.dumps(indice)) + 64 * len(cuerpos) + 64
+    posicion = _alinear(8 + reserva)
+    for nombre, tipo, cuerpo in cuerpos:
+        indice['secciones'][nombre] = [posicion, len(cuerpo), tipo]
+        posicion = _alinear(posicion + len(cuerpo))
+    crudo = json.dumps(indice).encode('utf-8').ljust(reserva)
+
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, 'wb') as f:
+        f.write(MAGIA + struct.pack('<I', reserva) + crudo)
+        for nombre, _, cuerpo in cuerpos:
+            f.seek(indice['secciones'][nombre][0])
+            f.write(cuerpo)
+        f.truncate(posicion)
+    os.replace(temporal, ruta)
+    return indice['cartas']
+
+
+def _alinear(posicion: int) -> int:
+    return (posicion + 7) & ~7
+
+
+# === LECTURA ===
+
+class CatalogoColumnar(Mapping):
+    """
+    Catálogo de solo lectura sobre un archivo columnar mapeado en memoria.
+    Se comporta como el dict id → datos de carta del JSON, pero cada registro
+    se arma al pedirlo; las consultas por columna no crean ningún dict.
+    """
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        with open(ruta, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:4] != MAGIA:
+            self._mmap.close()
+            raise ValueError(f"{ruta} no es un catálogo columnar")
+        reserva = struct.unpack_from('<I', self._mmap, 4)[0]
+        indice = json.loads(bytes(self._mmap[8:8 + reserva]).decode('utf-8'))
+        if indice.get('version') != VERSION_COLUMNAR:
+            self._mmap.close()
+            raise ValueError(f"Versión de catálogo columnar no soportada: {indice.get('version')}")
+
+        self.cabecera: Dict[str, Any] = indice['cabecera']
+        self._n = indice['cartas']
+        vista = memoryview(self._mmap)
+        self._columnas: Dict[str, memoryview] = {}
+        for nombre, (offset, longitud, tipo) in indice['secciones'].items():
+            seccion = vista[offset:offset + longitud]
+            self._columnas[nombre] = seccion if tipo == 'B' else seccion.cast(tipo)
+        self._textos = self._columnas.pop('textos')
+        vista.release()
+
+    def __reduce__(self):
+        # En otro proceso se vuelve a mapear el mismo archivo (las páginas se comparten)
+        return type(self), (self.ruta,)
+
+    def cerrar(self):
+        for columna in self._columnas.values():
+            columna.release()
+        self._columnas = {}
+        self._textos.release()
+        self._mmap.close()
+
+    # === COLUMNAS ===
+
+    def columna(self, nombre: str) -> memoryview:
+        """Columna completa (por fila, en el orden del JSON) sin copiarla"""
+        return self._columnas[nombre]
+
+    def texto(self, indice: int) -> str:
+        offsets = self._columnas['textos_offset']
+        return bytes(self._textos[offsets[indice]:offsets[indice + 1]]).decode('utf-8')
+
+    def fila_de(self, carta_id: int) -> Optional[int]:
+        ids = self._columnas['ids_ordenados']
+        posicion = bisect.bisect_left(ids, carta_id)
+        if posicion < len(ids) and ids[posicion] == carta_id:
+            return self._columnas['orden_por_id'][posicion]
+        return None
+
+    def valor(self, carta_id: int, columna: str):
+        fila = self.fila_de(carta_id)
+        if fila is None:
+            raise KeyError(carta_id)
+        valor = self._columnas[columna][fila]
+        return self.texto(valor) if columna in _TEXTOS else valor
+
+    def tiers(self) -> Iterator[Tuple[int, int]]:
+        """(carta_id, tier) de cada carta, leídos de las columnas"""
+        return zip(self._columnas['id'], self._columnas['tier'])
+
+    def indices(self) -> Dict[str, Dict]:
+        """Índices por tier, categoría y rol (mismo formato que compilar_catalogo)"""
+        ids = self._columnas['id']
+        cartas_por_tier = {tier: [] for tier in TIERS}
+        cartas_por_categoria: Dict[str, List[int]] = {}
+        cartas_por_rol: Dict[str, List[int]] = {}
+        categorias = {}
+        roles = {}
+        for carta_id, tier, categoria, rol in zip(ids, self._columnas['tier'],
+                                                  self._columnas['categoria'], self._columnas['rol']):
+            if tier in cartas_por_tier:
+                cartas_por_tier[tier].append(carta_id)
+            if categoria not in categorias:
+                categorias[categoria] = cartas_por_categoria.setdefault(self.texto(categoria), [])
+            categorias[categoria].append(carta_id)
+            if rol not in roles:
+                roles[rol] = cartas_por_rol.setdefault(self.texto(rol), [])
+            roles[rol].append(carta_id)
+        return {
+            'cartas_por_tier': cartas_por_tier,
+            'cartas_por_categoria': cartas_por_categoria,
+            'cartas_por_rol': cartas_por_rol,
+        }
+
+    # === MAPPING ===
+
+    def registro(self, fila: int) -> Dict[str, Any]:
+        """Reconstruye el dict de la carta en la fila dada"""
+        columnas = self._columnas
+        carta = {nombre: columnas[nombre][fila] for nombre, (_, grupo, _) in _ENTEROS.items() if grupo is None}
+        for nombre in _TEXTOS:
+            carta[nombre] = self.texto(columnas[nombre][fila])
+        carta['stats'] = {nombre: columnas[nombre][fila] for nombre in _STATS}
+        inicio, fin = columnas['habilidades_inicio'][fila], columnas['habilidades_inicio'][fila + 1]
+        carta['habilidades'] = [json.loads(self.texto(columnas['habilidades'][i])) for i in range(inicio, fin)]
+
+        extras = columnas['extras'][fila]
+        if extras:
+            extras = json.loads(self.texto(extras))
+            carta['stats'].update(extras.pop('stats', {}))
+            carta.update(extras)
+        return carta
+
+    def __getitem__(self, carta_id: int) -> Dict[str, Any]:
+        fila = self.fila_de(carta_id)
+        if fila is None:
+            raise KeyError(carta_id)
+        return self.registro(fila)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._columnas['id'])
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __contains__(self, carta_id) -> bool:
+        return isinstance(carta_id, int) and self.fila_de(carta_id) is not None
+
+
+def abrir_catalogo_columnar(ruta_json: str, ruta_columnar: Optional[str] = None) -> Optional[CatalogoColumnar]:
+    """
+    Abre el catálogo columnar de `ruta_json`, regenerándolo si el JSON cambió
+    (misma validación por mtime, tamaño y hash que el catálogo compilado).
+    """
+    ruta_columnar = ruta_columnar or ruta_columnar_de(ruta_json)
+    try:
+        stat = os.stat(ruta_json)
+    except OSError:
+        log_evento(f"❌ Archivo no encontrado: {ruta_json}", "ERROR")
+        return None
+
+    hash_json = None
+    try:
+        catalogo = CatalogoColumnar(ruta_columnar)
+        cabecera = catalogo.cabecera
+        if (cabecera.get('mtime_ns'), cabecera.get('tamano')) == (stat.st_mtime_ns, stat.st_size):
+            return catalogo
+        hash_json = hash_archivo(ruta_json)
+        if cabecera.get('hash') == hash_json:
+            return catalogo
+        catalogo.cerrar()
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log_evento(f"⚠️ Catálogo columnar inválido ({e}), se regenera", "WARNING")
+
+    datos = cargar_json(ruta_json)
+    if not datos:
+        return None
+    cabecera = {'mtime_ns': stat.st_mtime_ns, 'tamano': stat.st_size,
+                'hash': hash_json or hash_archivo(ruta_json)}
+    try:
+        cantidad = escribir_catalogo_columnar(datos, ruta_columnar, cabecera)
+    except OSError as e:
+        log_evento(f"❌ No se pudo escribir el catálogo columnar {ruta_columnar}: {e}", "ERROR")
+        return None
+    log_evento(f"🛠️ Catálogo columnar generado: {cantidad} cartas → {ruta_columnar}")
+    return CatalogoColumnar(ruta_columnar)
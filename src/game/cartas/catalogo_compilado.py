@@ -0,0 +1,130 @@
+"""
+Catálogo de cartas compilado
+El JSON del catálogo se parsea e indexa (por tier, categoría y rol) una sola
+vez y el resultado se guarda en un pickle junto al JSON. Las cargas siguientes
+(arranque en frío, procesos trabajadores) solo validan la cabecera contra el
+JSON: con mtime y tamaño iguales se usa directamente; si cambiaron se compara
+el hash del contenido y, si también difiere, se recompila.
+"""
+
+import hashlib
+import os
+import pickle
+from typing import Any, Dict, Optional
+
+from src.utils.helpers import cargar_json, log_evento
+
+VERSION_CATALOGO = 1
+EXTENSION_CACHE = ".catalogo.pickle"
+TIERS = (1, 2, 3)
+
+
+def ruta_cache_de(ruta_json: str) -> str:
+    return os.path.splitext(ruta_json)[0] + EXTENSION_CACHE
+
+
+def compilar_catalogo(datos: list) -> Dict[str, Any]:
+    """Registros por id e índices por tier, categoría y rol (mismo orden que el JSON)"""
+    datos_cartas = {}
+    cartas_por_tier = {tier: [] for tier in TIERS}
+    cartas_por_categoria = {}
+    cartas_por_rol = {}
+
+    for carta_data in datos:
+        carta_id = carta_data.get('id')
+        if carta_id is None:
+            log_evento(f"⚠️ Carta sin ID encontrada: {carta_data.get('nombre', 'Sin nombre')}", "WARNING")
+            continue
+
+        datos_cartas[carta_id] = carta_data
+        tier = carta_data.get('tier', 1)
+        if tier in cartas_por_tier:
+            cartas_por_tier[tier].append(carta_id)
+        cartas_por_categoria.setdefault(carta_data.get('categoria', 'general'), []).append(carta_id)
+        cartas_por_rol.setdefault(carta_data.get('rol', 'basico'), []).append(carta_id)
+
+    return {
+        'datos_cartas': datos_cartas,
+        'cartas_por_tier': cartas_por_tier,
+        'cartas_por_categoria': cartas_por_categoria,
+        'cartas_por_rol': cartas_por_rol,
+    }
+
+
+def hash_archivo(ruta: str) -> str:
+    with open(ruta, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _leer_cabecera(archivo) -> Optional[Dict[str, Any]]:
+    try:
+        cabecera = pickle.load(archivo)
+    except Exception:
+        return None
+    if not isinstance(cabecera, dict) or cabecera.get('version') != VERSION_CATALOGO:
+        return None
+    return cabecera
+
+
+def _guardar_cache(ruta_cache: str, cabecera: Dict[str, Any], catalogo: Dict[str, Any]):
+    """Escritura atómica: cabecera y cuerpo en un temporal que reemplaza al anterior"""
+    temporal = f"{ruta_cache}.{os.getpid()}.tmp"
+    try:
+        with open(temporal, 'wb') as f:
+            pickle.dump(cabecera, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(catalogo, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, ruta_cache)
+    except OSError as e:
+        log_evento(f"⚠️ No se pudo guardar el catálogo compilado en {ruta_cache}: {e}", "WARNING")
+        if os.path.exists(temporal):
+            os.remove(temporal)
+
+
+def cargar_catalogo(ruta_json: str, ruta_cache: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Catálogo compilado de `ruta_json`, desde el cache si sigue siendo válido.
+    Retorna None si el JSON no existe o no se puede parsear.
+    """
+    ruta_cache = ruta_cache or ruta_cache_de(ruta_json)
+    try:
+        stat = os.stat(ruta_json)
+    except OSError:
+        log_evento(f"❌ Archivo no encontrado: {ruta_json}", "ERROR")
+        return None
+
+    hash_json = None
+    try:
+        with open(ruta_cache, 'rb') as f:
+            cabecera = _leer_cabecera(f)
+            if cabecera is not None:
+                vigente = (cabecera['mtime_ns'], cabecera['tamano']) == (stat.st_mtime_ns, stat.st_size)
+                if not vigente:
+                    # Tocado pero quizá sin cambios (checkout, copia): decide el contenido
+                    hash_json = hash_archivo(ruta_json)
+                    vigente = cabecera['hash'] == hash_json
+                if vigente:
+                    catalogo = pickle.load(f)
+                    log_evento(lambda: f"📦 Catálogo compilado cargado desde {ruta_cache}", "DEBUG")
+                    if hash_json is not None:
+                        # Actualizar mtime en la cabecera para no volver a hashear
+                        _guardar_cache(ruta_cache, dict(cabecera, mtime_ns=stat.st_mtime_ns,
+                                                        tamano=stat.st_size), catalogo)
+                    return catalogo
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log_evento(f"⚠️ Catálogo compilado inválido ({e}), se recompila", "WARNING")
+
+    datos = cargar_json(ruta_json)
+    if not datos:
+        return None
+    catalogo = compilar_catalogo(datos)
+    cabecera = {
+        'version': VERSION_CATALOGO,
+        'mtime_ns': stat.st_mtime_ns,
+        'tamano': stat.st_size,
+        'hash': hash_json or hash_archivo(ruta_json),
+    }
+    _guardar_cache(ruta_cache, cabecera, catalogo)
+    log_evento(f"🛠️ Catálogo compilado: {len(catalogo['datos_cartas'])} cartas → {ruta_cache}")
+    return catalogo
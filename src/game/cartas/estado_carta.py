@@ -3,33 +3,89 @@
 from src.game.cartas.carta_base import CartaBase
 from src.utils.helpers import log_evento
 
+# Margen para que la suma de deltas flotantes no retrase un ataque un tick completo
+_TOLERANCIA_COOLDOWN = 1e-9
+
+
+def _campo(columna: str, privado: str) -> property:
+    """Atributo que vive en el objeto o, si el estado está en un AlmacenCombate, en su columna"""
+    def leer(self):
+        almacen = self._almacen
+        if almacen is None:
+            return getattr(self, privado)
+        return getattr(almacen, columna)[self._slot]
+
+    def escribir(self, valor):
+        almacen = self._almacen
+        if almacen is None:
+            setattr(self, privado, valor)
+        else:
+            getattr(almacen, columna)[self._slot] = valor
+
+    return property(leer, escribir)
+
 
 class EstadoCarta:
     """
     Representa el estado de combate de una carta en tiempo real.
     Mantiene información dinámica como vida actual, cooldowns, etc.
+    Registrado en un AlmacenCombate pasa a ser una vista sobre sus columnas.
     """
 
+    __slots__ = ('id_carta', 'nombre', 'carta', '_almacen', '_slot',
+                 '_vida_actual', '_cooldown_ataque', '_intervalo_ataque', '_viva',
+                 '_dano_base', '_defensa_fisica', '_defensa_magica', '_bonus_dano_fisico', '_bonus_dano_magico')
+
     def __init__(self, carta: CartaBase):
+        self._almacen = None
+        self._slot = -1
+
         self.id_carta: int = carta.id
         self.nombre: str = carta.nombre
         self.carta: CartaBase = carta
 
         self.vida_actual: int = carta.vida_actual
         self.cooldown_ataque: float = 0.0
-        self.estado: str = "activo"  # o "muerta"
+        self.intervalo_ataque: float = getattr(carta, 'intervalo_ataque', 1.5)  # segundos entre ataques
+        self._viva = True
 
         # Stats relevantes
         self.dano_base: int = carta.dano_fisico_actual
-        self.defensa: int = carta.defensa_fisica_actual
         self.defensa_fisica_actual: int = carta.defensa_fisica_actual
         self.defensa_magica_actual: int = getattr(carta, 'defensa_magica_actual', 0)
+        # Bonus de daño por sinergias del equipo (lo escribe TablaSinergias)
+        self.bonus_dano_fisico: int = 0
+        self.bonus_dano_magico: int = 0
+
+    vida_actual = _campo('vida', '_vida_actual')
+    cooldown_ataque = _campo('cooldown', '_cooldown_ataque')
+    intervalo_ataque = _campo('intervalo', '_intervalo_ataque')
+    dano_base = _campo('dano', '_dano_base')
+    defensa_fisica_actual = _campo('defensa_fisica', '_defensa_fisica')
+    defensa_magica_actual = _campo('defensa_magica', '_defensa_magica')
+    defensa = defensa_fisica_actual
+    bonus_dano_fisico = _campo('bonus_fisico', '_bonus_dano_fisico')
+    bonus_dano_magico = _campo('bonus_magico', '_bonus_dano_magico')
+    _vivo = _campo('viva', '_viva')
+
+    @property
+    def estado(self) -> str:
+        return "activo" if self._vivo else "muerta"
+
+    @estado.setter
+    def estado(self, valor: str):
+        self._vivo = valor != "muerta"
+
+    @property
+    def almacen(self):
+        """AlmacenCombate que guarda los datos de este estado, o None"""
+        return self._almacen
 
     def recibir_dano(self, cantidad: int):
         """Aplica daño ya calculado al estado de la carta"""
         dano_real = max(0, cantidad)
         self.vida_actual -= dano_real
-        log_evento(f"💥 {self.nombre} recibe {dano_real} de daño")
+        log_evento(lambda: f"💥 {self.nombre} recibe {dano_real} de daño", "DEBUG")
 
         if self.vida_actual <= 0:
             self.vida_actual = 0
@@ -37,17 +93,20 @@ class EstadoCarta:
             log_evento(f"☠️ {self.nombre} ha sido derrotada")
 
     def esta_viva(self) -> bool:
-        return self.estado != "muerta"
+        return bool(self._vivo)
 
     def puede_actuar(self) -> bool:
-        return self.esta_viva() and self.cooldown_ataque <= 0.0
+        return self.esta_viva() and self.cooldown_ataque <= _TOLERANCIA_COOLDOWN
 
     def reducir_cooldowns(self, delta_time: float):
+        # Puede quedar negativo: el exceso del tick se descuenta del siguiente intervalo
         if self.cooldown_ataque > 0:
-            self.cooldown_ataque = max(0.0, self.cooldown_ataque - delta_time)
+            self.cooldown_ataque -= delta_time
 
-    def reiniciar_cooldown(self, velocidad_base: float = 1.5):
-        self.cooldown_ataque = velocidad_base
+    def reiniciar_cooldown(self, velocidad_base: float = None):
+        """Programa el próximo ataque; conservar el exceso hace la cadencia independiente del FPS"""
+        intervalo = self.intervalo_ataque if velocidad_base is None else velocidad_base
+        self.cooldown_ataque = max(0.0, intervalo + min(0.0, self.cooldown_ataque))
 
     def __str__(self):
         return f"EstadoCarta(id={self.id_carta}, vida={self.vida_actual}, estado={self.estado})"
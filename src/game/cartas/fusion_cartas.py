@@ -2,70 +2,187 @@
 Fusionador de Cartas - Detecta y aplica fusiones automáticas combinando tablero y banco
 """
 
-from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
 from src.utils.helpers import log_evento
 
+COPIAS_PARA_FUSIONAR = 3
+
+TABLERO = "tablero"
+BANCO = "banco"
+
+
+class IndiceFusiones:
+    """
+    Índice (nombre, tier) → ubicaciones de las cartas de un jugador en tablero y banco.
+    Se mantiene al entrar y salir cartas (el tablero avisa por observador_celdas),
+    así que detectar un candidato a fusión al insertar es O(1) y las fusiones en
+    cadena (tier 1 → 2 → 3) se resuelven en una pasada sin reescanear.
+    """
+
+    def __init__(self):
+        # (nombre, tier) → {(zona, id(carta)): carta}, en orden de llegada
+        self._grupos: Dict[Tuple[str, int], Dict[Tuple[str, int], object]] = {}
+        self._clave_de: Dict[Tuple[str, int], Tuple[str, int]] = {}  # (zona, id(carta)) → (nombre, tier)
+        self._candidatos: Dict[Tuple[str, int], None] = {}  # claves con copias suficientes (conjunto ordenado)
+        self.tablero = None
+
+    # === MANTENIMIENTO ===
+
+    def vincular_tablero(self, tablero):
+        """Sigue las escrituras de `tablero` (y deja de seguir al anterior)"""
+        if self.tablero is not None and self.tablero.observador_celdas == self._al_cambiar_celda:
+            self.tablero.observador_celdas = None
+        for ubicacion in [u for u in self._clave_de if u[0] == TABLERO]:
+            self._quitar_ubicacion(ubicacion)
+
+        self.tablero = tablero
+        if tablero is not None:
+            tablero.observador_celdas = self._al_cambiar_celda
+            for carta in tablero.celdas.values():
+                if carta is not None:
+                    self.agregar(carta, TABLERO)
+
+    def vincular_banco(self, banco: list):
+        """Reemplaza las entradas del banco por el contenido de `banco`"""
+        for ubicacion in [u for u in self._clave_de if u[0] == BANCO]:
+            self._quitar_ubicacion(ubicacion)
+        for carta in banco:
+            if carta is not None:
+                self.agregar(carta, BANCO)
+
+    def agregar(self, carta, zona: str) -> bool:
+        """Indexa la carta; retorna True si su grupo ya alcanza para fusionar"""
+        ubicacion = (zona, id(carta))
+        if ubicacion in self._clave_de:
+            return False
+        clave = (carta.nombre, carta.tier)
+        grupo = self._grupos.setdefault(clave, {})
+        grupo[ubicacion] = carta
+        self._clave_de[ubicacion] = clave
+        if len(grupo) >= COPIAS_PARA_FUSIONAR:
+            self._candidatos[clave] = None
+            return True
+        return False
+
+    def quitar(self, carta, zona: str):
+        self._quitar_ubicacion((zona, id(carta)))
+
+    def _quitar_ubicacion(self, ubicacion: Tuple[str, int]):
+        clave = self._clave_de.pop(ubicacion, None)
+        if clave is None:
+            return
+        grupo = self._grupos[clave]
+        del grupo[ubicacion]
+        if len(grupo) < COPIAS_PARA_FUSIONAR:
+            self._candidatos.pop(clave, None)
+        if not grupo:
+            del self._grupos[clave]
+
+    def _al_cambiar_celda(self, anterior, nueva):
+        if anterior is not None:
+            self.quitar(anterior, TABLERO)
+        if nueva is not None:
+            self.agregar(nueva, TABLERO)
+
+    # === CONSULTAS ===
+
+    def hay_candidatos(self) -> bool:
+        return bool(self._candidatos)
+
+    def contar(self, nombre: str, tier: int) -> int:
+        return len(self._grupos.get((nombre, tier), ()))
+
+    # === FUSIÓN ===
+
+    def resolver(self, banco: list, limite: Optional[int] = None) -> List[str]:
+        """Aplica las fusiones pendientes, incluidas las que encadena cada una (hasta `limite`)"""
+        eventos = []
+        while self._candidatos and (limite is None or len(eventos) < limite):
+            clave = next(iter(self._candidatos))
+            # Se conserva la ubicación de la primera carta del tablero (o del banco si no hay)
+            ubicaciones = sorted(self._grupos[clave], key=lambda u: u[0] != TABLERO)[:COPIAS_PARA_FUSIONAR]
+            eventos.append(self._fusionar(clave, ubicaciones, banco))
+        return eventos
+
+    def _fusionar(self, clave, ubicaciones, banco: list) -> str:
+        grupo = self._grupos[clave]
+        cartas = [grupo[u] for u in ubicaciones]
+        zona_final = ubicaciones[0][0]
+        carta_fusionada = cartas[0]
+
+        for (zona, _), carta in zip(ubicaciones[1:], cartas[1:]):
+            if zona == TABLERO:
+                coord = self.tablero.obtener_coordenada_de(carta)
+                if coord is not None:
+                    self.tablero.quitar_carta(coord)  # El observador la quita del índice
+            else:
+                indice = _indice_en_banco(banco, carta)
+                if indice is not None:
+                    banco[indice] = None
+            self.quitar(carta, zona)
+
+        # Reindexar la sobreviviente con su nuevo tier (puede habilitar la siguiente fusión)
+        self.quitar(carta_fusionada, zona_final)
+        coord_final = self.tablero.obtener_coordenada_de(carta_fusionada) if zona_final == TABLERO else None
+        if coord_final is not None:
+            # Reescribir la celda avisa al observador del tablero del cambio de tier
+            self.tablero.quitar_carta(coord_final)
+        _mejorar_carta(carta_fusionada)
+        if coord_final is not None:
+            self.tablero.colocar_carta(coord_final, carta_fusionada)
+        self.agregar(carta_fusionada, zona_final)
+
+        if zona_final == TABLERO:
+            ubicacion_final = (TABLERO, self.tablero.obtener_coordenada_de(carta_fusionada))
+        else:
+            ubicacion_final = (BANCO, _indice_en_banco(banco, carta_fusionada))
+
+        nombre = clave[0]
+        log_evento(f"✨ Fusión realizada: {nombre} → Estrella {carta_fusionada.tier}")
+        return f"{nombre} fusionado en {ubicacion_final} → tier {carta_fusionada.tier}"
+
+
+def _indice_en_banco(banco: list, carta) -> Optional[int]:
+    for indice, otra in enumerate(banco):
+        if otra is carta:
+            return indice
+    return None
+
+
+def _mejorar_carta(carta):
+    carta.tier += 1
+    carta.vida_maxima += 50
+    carta.vida_actual += 50
+    carta.dano_fisico_actual += 5
+    carta.dano_magico_actual += 5
+
 
 def aplicar_fusiones(tablero, banco: list, limite: int = 10) -> list[str]:
     """Realiza fusiones de cartas entre tablero y banco.
 
-    Ejecuta una sola fusión por iteración y vuelve a escanear el estado, lo que
-    evita bucles infinitos cuando las colecciones cambian durante el proceso.
+    Indexa una vez tablero y banco y resuelve las fusiones (también las
+    encadenadas) sin reescanear. Un Jugador mantiene su propio IndiceFusiones
+    y no necesita llamar a esta función en cada cambio; si el tablero ya tiene
+    observador, sigue recibiendo las escrituras durante la llamada.
     """
-    eventos = []
-    iteraciones = 0
-
-    while iteraciones < limite:
-        iteraciones += 1
-
-        # Recalcular agrupaciones en cada iteración
-        cartas_por_nombre = defaultdict(list)
-        for coord, carta in tablero.celdas.items():
-            if carta:
-                cartas_por_nombre[carta.nombre].append(("tablero", coord, carta))
-        for idx, carta in enumerate(banco):
-            if carta:
-                cartas_por_nombre[carta.nombre].append(("banco", idx, carta))
-
-        fusion_realizada = False
-        for nombre, grupo in cartas_por_nombre.items():
-            if len(grupo) >= 3:
-                seleccionadas = grupo[:3]
-                fuentes, ubicaciones, cartas = zip(*seleccionadas)
-
-                carta_fusionada = cartas[0]
-                carta_fusionada.tier += 1
-                carta_fusionada.vida_maxima += 50
-                carta_fusionada.vida_actual += 50
-                carta_fusionada.dano_fisico_actual += 5
-                carta_fusionada.dano_magico_actual += 5
-
-                for fuente, ubicacion in list(zip(fuentes, ubicaciones))[1:]:
-                    if fuente == "tablero":
-                        tablero.quitar_carta(ubicacion)
-                    else:
-                        banco[ubicacion] = None
-
-                ubicacion_final = (fuentes[0], ubicaciones[0])
-                if ubicacion_final[0] == "tablero":
-                    tablero.celdas[ubicacion_final[1]] = carta_fusionada
-                else:
-                    banco[ubicacion_final[1]] = carta_fusionada
-
-                log_evento(
-                    f"✨ Fusión realizada: {nombre} → Estrella {carta_fusionada.tier}"
-                )
-                eventos.append(
-                    f"{nombre} fusionado en {ubicacion_final} → tier {carta_fusionada.tier}"
-                )
-
-                fusion_realizada = True
-                break
-
-        if not fusion_realizada:
-            break
-
-    if iteraciones >= limite and fusion_realizada:
-        log_evento("⚠️ Límite de iteraciones de fusión alcanzado")
+    observador_previo = tablero.observador_celdas
+    indice = IndiceFusiones()
+    indice.vincular_tablero(tablero)
+    indice.vincular_banco(banco)
+    if observador_previo is not None:
+        propio = tablero.observador_celdas
+
+        def encadenado(anterior, nueva):
+            propio(anterior, nueva)
+            observador_previo(anterior, nueva)
 
+        tablero.observador_celdas = encadenado
+    try:
+        eventos = indice.resolver(banco, limite)
+    finally:
+        tablero.observador_celdas = observador_previo
+
+    if len(eventos) >= limite and indice.hay_candidatos():
+        log_evento("⚠️ Límite de iteraciones de fusión alcanzado")
     return eventos
@@ -6,6 +6,11 @@ import random
 from typing import List, Dict, Optional, Any
 
 from src.game.cartas.carta_base import CartaBase
+from src.game.cartas.catalogo_columnar import CatalogoColumnar, abrir_catalogo_columnar
+from src.game.cartas.catalogo_compilado import cargar_catalogo, compilar_catalogo
+from src.game.cartas.muestreo_pool import ArbolFenwick
+from src.game.cartas.plantilla_carta import PlantillaCarta
+from src.game.combate.calcular_dano.tabla_sinergias import bonus_sinergia, contar_sinergias
 from src.utils.helpers import cargar_json, log_evento
 
 
@@ -15,6 +20,7 @@ class ManagerCartas:
     def __init__(self):
         # Base de datos de cartas
         self.datos_cartas: Dict[int, Dict[str, Any]] = {}
+        self.plantillas: Dict[int, PlantillaCarta] = {}  # carta_id: prototipo compartido por sus copias
         self.cartas_por_tier: Dict[int, List[int]] = {1: [], 2: [], 3: []}
         self.cartas_por_categoria: Dict[str, List[int]] = {}
         self.cartas_por_rol: Dict[str, List[int]] = {}
@@ -27,14 +33,30 @@ class ManagerCartas:
         }
 
         # NUEVO: Pool mejorado con instancias únicas
-        self.pool_instancias: Dict[int, List[CartaBase]] = {}  # carta_id: [instancia1, instancia2, ...]
+        # Las copias son contadores: una instancia se crea la primera vez que su copia sale
+        # del pool y se recicla (con su estado reiniciado) cuando vuelve a salir
+        self.copias_totales: Dict[int, int] = {}  # carta_id: copias en el juego
+        self.pool_instancias: Dict[int, List[CartaBase]] = {}  # carta_id: instancias ya creadas
         self.pool_disponibles: Dict[int, int] = {}  # carta_id: cantidad_disponible
 
+        # Índices del pool para tomar/devolver en O(1)
+        self._libres: Dict[int, List[int]] = {}  # carta_id: pila de números de copia libres
+        self._instancias_por_id: Dict[str, CartaBase] = {}  # id de instancia ("1_001"): instancia
+        self._tier_de: Dict[int, int] = {}  # carta_id: tier
+        # Por tier, un árbol de Fenwick con las copias libres de cada carta (en el orden de cartas_por_tier)
+        self._ids_tier: Dict[int, List[int]] = {}
+        self._arboles_tier: Dict[int, ArbolFenwick] = {}
+        self._posicion_en_tier: Dict[int, int] = {}  # carta_id: índice en su árbol
+
         # Pool global de cartas disponibles (LEGACY - mantenido por compatibilidad)
         self.pool_global: Dict[int, int] = {}  # {carta_id: cantidad_disponible}
 
         # Configuración
         self.archivo_cartas = "src/data/cartas/personajes_historicos.json"
+        # Cargar desde el catálogo compilado junto al JSON (se rehace si el JSON cambia)
+        self.usar_cache_catalogo = True
+        # Catálogo columnar en mmap (compartido entre procesos) en lugar de los dicts del JSON
+        self.usar_catalogo_columnar = False
 
         # Estado de carga
         self.cartas_cargadas = False
@@ -42,43 +64,23 @@ class ManagerCartas:
     def cargar_cartas(self) -> bool:
         """Carga todas las cartas desde el archivo JSON y crea instancias múltiples"""
         try:
-            datos = cargar_json(self.archivo_cartas)
-            if not datos:
+            if self.usar_catalogo_columnar:
+                catalogo = self._abrir_catalogo_columnar()
+            elif self.usar_cache_catalogo:
+                catalogo = cargar_catalogo(self.archivo_cartas)
+            else:
+                datos = cargar_json(self.archivo_cartas)
+                catalogo = compilar_catalogo(datos) if datos else None
+            if not catalogo:
                 log_evento("❌ No se pudieron cargar los datos de cartas", "ERROR")
                 return False
 
-            # Limpiar datos anteriores
-            self.datos_cartas.clear()
-            self.cartas_por_tier = {1: [], 2: [], 3: []}
-            self.cartas_por_categoria.clear()
-            self.cartas_por_rol.clear()
-
-            # Procesar cada carta
-            for carta_data in datos:
-                carta_id = carta_data.get('id')
-                if carta_id is None:
-                    log_evento(f"⚠️ Carta sin ID encontrada: {carta_data.get('nombre', 'Sin nombre')}", "WARNING")
-                    continue
-
-                # Guardar datos de la carta
-                self.datos_cartas[carta_id] = carta_data
-
-                # Organizar por tier
-                tier = carta_data.get('tier', 1)
-                if tier in self.cartas_por_tier:
-                    self.cartas_por_tier[tier].append(carta_id)
-
-                # Organizar por categoría
-                categoria = carta_data.get('categoria', 'general')
-                if categoria not in self.cartas_por_categoria:
-                    self.cartas_por_categoria[categoria] = []
-                self.cartas_por_categoria[categoria].append(carta_id)
-
-                # Organizar por rol
-                rol = carta_data.get('rol', 'basico')
-                if rol not in self.cartas_por_rol:
-                    self.cartas_por_rol[rol] = []
-                self.cartas_por_rol[rol].append(carta_id)
+            # Registros e índices ya construidos (desde el catálogo compilado si está vigente)
+            self.datos_cartas = catalogo['datos_cartas']
+            self.plantillas.clear()
+            self.cartas_por_tier = catalogo['cartas_por_tier']
+            self.cartas_por_categoria = catalogo['cartas_por_categoria']
+            self.cartas_por_rol = catalogo['cartas_por_rol']
 
             # Inicializar pools (nuevo y legacy)
             self._inicializar_pool_instancias()
@@ -92,9 +94,9 @@ class ManagerCartas:
             log_evento(f"   Categorías: {len(self.cartas_por_categoria)}")
             log_evento(f"   Roles: {len(self.cartas_por_rol)}")
 
-            # Mostrar estadísticas de instancias creadas
+            # Mostrar estadísticas de copias registradas
             stats_pool = self.obtener_estadisticas_pool()
-            log_evento(f"   📦 Total instancias creadas: {stats_pool['total_instancias_creadas']}")
+            log_evento(f"   📦 Total copias en el pool: {stats_pool['total_instancias_creadas']}")
             log_evento(
                 f"   📊 Por tier: T1={stats_pool['cartas_por_tier_total'][1]}, T2={stats_pool['cartas_por_tier_total'][2]}, T3={stats_pool['cartas_por_tier_total'][3]}")
 
@@ -104,48 +106,105 @@ class ManagerCartas:
             log_evento(f"❌ Error cargando cartas: {e}", "ERROR")
             return False
 
+    def _abrir_catalogo_columnar(self) -> Optional[Dict[str, Any]]:
+        """Registros como vista columnar sobre el mmap e índices leídos de sus columnas"""
+        if isinstance(self.datos_cartas, CatalogoColumnar):
+            self.datos_cartas.cerrar()
+            self.datos_cartas = {}
+        columnar = abrir_catalogo_columnar(self.archivo_cartas)
+        if columnar is None:
+            return None
+        return dict(columnar.indices(), datos_cartas=columnar)
+
+    def _tiers_del_catalogo(self):
+        """(carta_id, tier) de cada carta; el catálogo columnar los lee sin armar registros"""
+        if isinstance(self.datos_cartas, CatalogoColumnar):
+            return self.datos_cartas.tiers()
+        return ((carta_id, datos.get('tier', 1)) for carta_id, datos in self.datos_cartas.items())
+
     def _inicializar_pool_instancias(self):
-        """Inicializa el pool de instancias únicas para cada carta"""
+        """Registra las copias de cada carta como contadores (las instancias se crean al sacarlas)"""
+        self.copias_totales.clear()
         self.pool_instancias.clear()
         self.pool_disponibles.clear()
+        self._instancias_por_id.clear()
+        self._tier_de.clear()
+
+        log_evento("🏭 Registrando copias de cartas...")
+
+        for carta_id, tier in self._tiers_del_catalogo():
+            self.copias_totales[carta_id] = self.copias_por_tier.get(tier, 1)
+            self.pool_instancias[carta_id] = []
+            self._tier_de[carta_id] = tier
+
+        self._reconstruir_libres()
+
+    def _reconstruir_libres(self):
+        """Rehace pilas de libres, contadores y árboles de muestreo desde las marcas _en_uso"""
+        self._libres = {}
+        for carta_id, total in self.copias_totales.items():
+            en_uso = {instancia.numero_copia for instancia in self.pool_instancias.get(carta_id, ())
+                      if getattr(instancia, '_en_uso', False)}
+            # Invertidas para que pop() entregue primero la copia de menor número
+            libres = [copia for copia in range(total - 1, -1, -1) if copia not in en_uso]
+            self._libres[carta_id] = libres
+            self.pool_disponibles[carta_id] = len(libres)
+
+        self._ids_tier = {}
+        self._arboles_tier = {}
+        self._posicion_en_tier = {}
+        for tier, ids in self.cartas_por_tier.items():
+            self._ids_tier[tier] = list(ids)
+            self._posicion_en_tier.update((carta_id, i) for i, carta_id in enumerate(ids))
+            self._arboles_tier[tier] = ArbolFenwick([len(self._libres.get(carta_id, ())) for carta_id in ids])
+
+    def _materializar_copia(self, carta_id: int, copia: int) -> Optional[CartaBase]:
+        """Instancia de la copia: la ya creada con su estado reiniciado, o una nueva"""
+        id_unico = f"{carta_id}_{copia:03d}"  # Formato: 1_001, 1_002, etc.
+        instancia = self._instancias_por_id.get(id_unico)
+        try:
+            if instancia is not None:
+                instancia.reiniciar_estado()
+                return instancia
 
-        log_evento("🏭 Creando instancias múltiples de cartas...")
+            instancia = CartaBase(self.obtener_plantilla(carta_id))
+        except Exception as e:
+            log_evento(f"❌ Error creando instancia {id_unico}: {e}", "ERROR")
+            return None
 
-        for carta_id, carta_data in self.datos_cartas.items():
-            tier = carta_data.get('tier', 1)
-            cantidad_copias = self.copias_por_tier.get(tier, 1)
-
-            # Crear múltiples instancias de la misma carta
-            instancias = []
-            for copia in range(cantidad_copias):
-                # Crear instancia única con ID compuesto
-                carta_data_copia = carta_data.copy()
-                id_unico = f"{carta_id}_{copia:03d}"  # Formato: 1_001, 1_002, etc.
-                carta_data_copia['id'] = id_unico
-                carta_data_copia['carta_base_id'] = carta_id  # Referencia al ID original
-                carta_data_copia['numero_copia'] = copia
-
-                try:
-                    instancia = CartaBase(carta_data_copia)
-                    instancia._en_uso = False  # Marcar como disponible
-                    instancias.append(instancia)
-                except Exception as e:
-                    log_evento(f"❌ Error creando instancia {id_unico}: {e}", "ERROR")
-
-            self.pool_instancias[carta_id] = instancias
-            self.pool_disponibles[carta_id] = len(instancias)
-
-            log_evento(f"   📦 {carta_data['nombre']}: {len(instancias)} copias (Tier {tier})")
+        instancia.id = id_unico
+        instancia.carta_base_id = carta_id  # Referencia al ID original
+        instancia.numero_copia = copia
+        self._instancias_por_id[id_unico] = instancia
+        self.pool_instancias[carta_id].append(instancia)
+        return instancia
+
+    def _actualizar_copias_libres(self, carta_id: int, delta: int):
+        posicion = self._posicion_en_tier.get(carta_id)
+        if posicion is not None:
+            self._arboles_tier[self._tier_de[carta_id]].actualizar(posicion, delta)
+
+    @property
+    def disponibles_por_tier(self) -> Dict[int, int]:
+        """Copias libres por tier"""
+        return {tier: arbol.total for tier, arbol in self._arboles_tier.items()}
 
     def _inicializar_pool_global(self):
         """Inicializa el pool global (legacy) para compatibilidad"""
         self.pool_global.clear()
 
-        for carta_id, carta_data in self.datos_cartas.items():
-            tier = carta_data.get('tier', 1)
+        for carta_id, tier in self._tier_de.items():
             cantidad = self.copias_por_tier.get(tier, 1)
             self.pool_global[carta_id] = cantidad
 
+    def obtener_plantilla(self, carta_id: int) -> PlantillaCarta:
+        """Plantilla compartida de una carta del catálogo (se construye la primera vez que se pide)"""
+        plantilla = self.plantillas.get(carta_id)
+        if plantilla is None:
+            plantilla = PlantillaCarta(self.datos_cartas[carta_id])
+            self.plantillas[carta_id] = plantilla
+        return plantilla
+
     def obtener_carta_por_id(self, carta_id: int) -> Optional[CartaBase]:
         """Retorna una instancia nueva de carta por su ID (legacy method)"""
         if not self.cartas_cargadas:
@@ -157,8 +216,7 @@ class ManagerCartas:
             return None
 
         try:
-            carta_data = self.datos_cartas[carta_id]
-            carta = CartaBase(carta_data)
+            carta = CartaBase(self.obtener_plantilla(carta_id))
             return carta
         except Exception as e:
             log_evento(f"❌ Error creando carta {carta_id}: {e}", "ERROR")
@@ -178,40 +236,11 @@ class ManagerCartas:
             f"   Probabilidades: T1={probabilidades[1]:.0%}, T2={probabilidades[2]:.0%}, T3={probabilidades[3]:.0%}")
 
         for i in range(cantidad):
-            tier_elegido = self._seleccionar_tier_aleatorio(probabilidades)
-
-            # Obtener cartas disponibles de ese tier
-            cartas_disponibles = [
-                carta_id for carta_id in self.cartas_por_tier[tier_elegido]
-                if self.pool_disponibles.get(carta_id, 0) > 0
-            ]
-
-            if cartas_disponibles:
-                carta_id = random.choice(cartas_disponibles)
-                instancia = self._tomar_instancia_del_pool(carta_id)
-
-                if instancia:
-                    cartas_seleccionadas.append(instancia)
-                    log_evento(f"   ✅ Carta {i + 1}: {instancia.nombre} (Tier {instancia.tier}, ID: {instancia.id})")
-                else:
-                    log_evento(f"   ❌ Error tomando instancia de carta {carta_id}")
-            else:
-                log_evento(f"   ⚠️ No hay cartas disponibles de tier {tier_elegido}")
-                # Intentar con otro tier si hay cartas disponibles
-                for tier_alternativo in [1, 2, 3]:
-                    if tier_alternativo != tier_elegido:
-                        cartas_alt = [
-                            cid for cid in self.cartas_por_tier[tier_alternativo]
-                            if self.pool_disponibles.get(cid, 0) > 0
-                        ]
-                        if cartas_alt:
-                            carta_id = random.choice(cartas_alt)
-                            instancia = self._tomar_instancia_del_pool(carta_id)
-                            if instancia:
-                                cartas_seleccionadas.append(instancia)
-                                log_evento(
-                                    f"   🔄 Carta {i + 1} (tier alternativo): {instancia.nombre} (Tier {instancia.tier})")
-                                break
+            instancia = self._sortear_carta(probabilidades)
+            if instancia is None:
+                break
+            cartas_seleccionadas.append(instancia)
+            log_evento(lambda: f"   ✅ Carta {i + 1}: {instancia.nombre} (Tier {instancia.tier}, ID: {instancia.id})", "DEBUG")
 
         log_evento(f"   📊 Total generadas: {len(cartas_seleccionadas)}/{cantidad}")
 
@@ -223,56 +252,96 @@ class ManagerCartas:
 
         return cartas_seleccionadas
 
+    def obtener_cartas_para_tiendas(self, niveles: List[int], cantidad: int = 5) -> List[List[CartaBase]]:
+        """
+        Sortea las tiendas de todos los jugadores en una sola llamada
+        Las ranuras se reparten por turnos (la primera de cada tienda, luego la
+        segunda, ...) para que ningún jugador acapare el pool cuando escasean copias.
+        """
+        if not self.cartas_cargadas:
+            log_evento("⚠️ Cartas no cargadas, retornando tiendas vacías")
+            return [[] for _ in niveles]
+
+        probabilidades_por_nivel = {}
+        probabilidades = []
+        for nivel in niveles:
+            if nivel not in probabilidades_por_nivel:
+                probabilidades_por_nivel[nivel] = self._obtener_probabilidades_tier(nivel)
+            probabilidades.append(probabilidades_por_nivel[nivel])
+
+        tiendas = [[] for _ in niveles]
+        agotado = False
+        for _ in range(cantidad):
+            for tienda, probabilidades_jugador in zip(tiendas, probabilidades):
+                instancia = self._sortear_carta(probabilidades_jugador)
+                if instancia is None:
+                    agotado = True
+                    break
+                tienda.append(instancia)
+            if agotado:
+                break
+
+        generadas = sum(len(tienda) for tienda in tiendas)
+        log_evento(f"🎲 Generadas {generadas}/{cantidad * len(niveles)} cartas para {len(niveles)} tiendas")
+        if agotado:
+            log_evento(f"   ⚠️ Pool agotado: quedan {sum(self.pool_disponibles.values())} cartas", "WARNING")
+
+        return tiendas
+
+    def _sortear_carta(self, probabilidades: Dict[int, float]) -> Optional[CartaBase]:
+        """Elige tier según las probabilidades y, dentro del tier, una carta ponderada por sus copias libres"""
+        tier = self._seleccionar_tier_aleatorio(probabilidades)
+        if tier is None:
+            return None
+
+        posicion = self._arboles_tier[tier].sortear()
+        return self._tomar_instancia_del_pool(self._ids_tier[tier][posicion])
+
     def _tomar_instancia_del_pool(self, carta_id: int) -> Optional[CartaBase]:
         """Toma una instancia específica del pool y la marca como usada"""
-        if carta_id not in self.pool_instancias or self.pool_disponibles.get(carta_id, 0) <= 0:
+        libres = self._libres.get(carta_id)
+        if not libres:
             return None
 
-        # Buscar primera instancia disponible
-        for instancia in self.pool_instancias[carta_id]:
-            if not getattr(instancia, '_en_uso', False):
-                instancia._en_uso = True
-                self.pool_disponibles[carta_id] -= 1
+        instancia = self._materializar_copia(carta_id, libres[-1])
+        if instancia is None:
+            return None
 
-                # También actualizar pool legacy
-                if carta_id in self.pool_global:
-                    self.pool_global[carta_id] = max(0, self.pool_global[carta_id] - 1)
+        libres.pop()
+        instancia._en_uso = True
+        self.pool_disponibles[carta_id] -= 1
+        self._actualizar_copias_libres(carta_id, -1)
 
-                return instancia
+        # También actualizar pool legacy
+        if carta_id in self.pool_global:
+            self.pool_global[carta_id] = max(0, self.pool_global[carta_id] - 1)
 
-        return None
+        return instancia
 
     def devolver_carta_al_pool(self, carta: CartaBase):
         """Devuelve una carta al pool marcándola como disponible"""
         try:
-            # Obtener el ID base de la carta
-            if hasattr(carta, 'carta_base_id'):
-                carta_base_id = carta.carta_base_id
-            else:
-                # Fallback para cartas sin el nuevo sistema
-                carta_id_str = str(carta.id)
-                if '_' in carta_id_str:
-                    carta_base_id = int(carta_id_str.split('_')[0])
-                else:
-                    carta_base_id = carta.id
-
-            if carta_base_id in self.pool_instancias:
-                # Buscar la instancia específica
-                for instancia in self.pool_instancias[carta_base_id]:
-                    if instancia.id == carta.id:
-                        instancia._en_uso = False
-                        self.pool_disponibles[carta_base_id] += 1
-
-                        # También actualizar pool legacy
-                        if carta_base_id in self.pool_global:
-                            self.pool_global[carta_base_id] += 1
-
-                        log_evento(f"🔄 {carta.nombre} (ID: {carta.id}) devuelta al pool")
-                        return
-
+            instancia = self._instancias_por_id.get(carta.id)
+            if instancia is None:
                 log_evento(f"⚠️ No se encontró la instancia específica de {carta.nombre} para devolver")
-            else:
-                log_evento(f"⚠️ Carta base ID {carta_base_id} no encontrada en pool de instancias")
+                return
+
+            if not getattr(instancia, '_en_uso', False):
+                # Devolverla dos veces duplicaría copias en el pool
+                log_evento(f"⚠️ {carta.nombre} (ID: {carta.id}) ya estaba en el pool", "WARNING")
+                return
+
+            carta_base_id = instancia.carta_base_id
+            instancia._en_uso = False
+            self._libres[carta_base_id].append(instancia.numero_copia)
+            self.pool_disponibles[carta_base_id] += 1
+            self._actualizar_copias_libres(carta_base_id, 1)
+
+            # También actualizar pool legacy
+            if carta_base_id in self.pool_global:
+                self.pool_global[carta_base_id] += 1
+
+            log_evento(lambda: f"🔄 {carta.nombre} (ID: {carta.id}) devuelta al pool", "DEBUG")
 
         except Exception as e:
             log_evento(f"❌ Error devolviendo carta al pool: {e}")
@@ -291,17 +360,25 @@ class ManagerCartas:
         else:  # nivel 9-10
             return {1: 0.10, 2: 0.40, 3: 0.50}
 
-    def _seleccionar_tier_aleatorio(self, probabilidades: Dict[int, float]) -> int:
-        """Selecciona un tier aleatoriamente según probabilidades"""
-        rand = random.random()
+    def _seleccionar_tier_aleatorio(self, probabilidades: Dict[int, float]) -> Optional[int]:
+        """Selecciona un tier según probabilidades entre los que aún tienen copias libres"""
+        arboles = self._arboles_tier
+        pesos = {tier: prob for tier, prob in probabilidades.items()
+                 if prob > 0 and tier in arboles and arboles[tier].total > 0}
+        if not pesos:
+            # Ningún tier permitido por el nivel tiene copias: se usa cualquiera que tenga
+            pesos = {tier: arbol.total for tier, arbol in arboles.items() if arbol.total > 0}
+            if not pesos:
+                return None
+
+        rand = random.random() * sum(pesos.values())
         acumulado = 0.0
-
-        for tier, prob in probabilidades.items():
-            acumulado += prob
-            if rand <= acumulado:
+        for tier, peso in pesos.items():
+            acumulado += peso
+            if rand < acumulado:
                 return tier
 
-        return 1  # Fallback tier 1
+        return tier  # Redondeo: el último tier con peso
 
     def obtener_cartas_por_categoria(self, categoria: str) -> List[int]:
         """Retorna lista de IDs de cartas de una categoría específica"""
@@ -312,78 +389,26 @@ class ManagerCartas:
         return self.cartas_por_rol.get(rol, []).copy()
 
     def calcular_sinergias(self, cartas: List[CartaBase]) -> Dict[str, int]:
-        """Calcula las sinergias activas entre un grupo de cartas"""
-        if not cartas:
-            return {}
-
-        # Contar por categoría
-        categorias = {}
-        roles = {}
-
-        for carta in cartas:
-            if carta.esta_viva():
-                # Contar categorías
-                if carta.categoria not in categorias:
-                    categorias[carta.categoria] = 0
-                categorias[carta.categoria] += 1
-
-                # Contar roles
-                if carta.rol not in roles:
-                    roles[carta.rol] = 0
-                roles[carta.rol] += 1
-
-        # Calcular bonificaciones de sinergia
-        sinergias_activas = {}
-
-        # Sinergias por categoría (necesita al menos 2 de la misma)
-        for categoria, cantidad in categorias.items():
-            if cantidad >= 2:
-                sinergias_activas[f"categoria_{categoria}"] = cantidad
-
-        # Sinergias por rol (necesita al menos 2 del mismo)
-        for rol, cantidad in roles.items():
-            if cantidad >= 2:
-                sinergias_activas[f"rol_{rol}"] = cantidad
-
-        return sinergias_activas
+        """Calcula las sinergias activas entre un grupo de cartas (reglas en tabla_sinergias)"""
+        return contar_sinergias([carta for carta in cartas if carta.esta_viva()])
 
     def aplicar_sinergias(self, cartas: List[CartaBase], sinergias: Dict[str, int]):
-        """Aplica bonificaciones de sinergia a las cartas"""
+        """Aplica bonificaciones de sinergia a las cartas (las mismas que usa TablaSinergias en combate)"""
         for carta in cartas:
             if not carta.esta_viva():
                 continue
 
-            # Bonificaciones por categoría
-            clave_categoria = f"categoria_{carta.categoria}"
-            if clave_categoria in sinergias:
-                nivel_sinergia = sinergias[clave_categoria]
-                # Bonificación: +5 vida y +2 daño por cada carta adicional de la categoría
-                bonus_vida = (nivel_sinergia - 1) * 5
-                bonus_dano = (nivel_sinergia - 1) * 2
-
-                carta.vida_maxima += bonus_vida
-                carta.vida_actual += bonus_vida
-                carta.aplicar_modificador_stat('dano_fisico', bonus_dano, False)
-                carta.aplicar_modificador_stat('dano_magico', bonus_dano, False)
-
-            # Bonificaciones por rol
-            clave_rol = f"rol_{carta.rol}"
-            if clave_rol in sinergias:
-                nivel_sinergia = sinergias[clave_rol]
-                # Bonificación específica por rol
-                if carta.rol == 'lider':
-                    # Líderes dan bonificación a todos los aliados
-                    bonus_defensa = nivel_sinergia * 3
-                    carta.aplicar_modificador_stat('defensa_fisica', bonus_defensa, False)
-                elif carta.rol == 'especialista':
-                    # Especialistas ganan daño mágico extra
-                    bonus_magico = nivel_sinergia * 8
-                    carta.aplicar_modificador_stat('dano_magico', bonus_magico, False)
-                # ... más bonificaciones por rol según necesidad
+            bonus = bonus_sinergia(carta, sinergias)
+            if bonus['vida']:
+                carta.vida_maxima += bonus['vida']
+                carta.vida_actual += bonus['vida']
+            for stat in ('dano_fisico', 'dano_magico', 'defensa_fisica'):
+                if bonus[stat]:
+                    carta.aplicar_modificador_stat(stat, bonus[stat], False)
 
     def obtener_estadisticas_pool(self) -> Dict[str, Any]:
         """Retorna estadísticas completas del pool de instancias"""
-        total_instancias = sum(len(instancias) for instancias in self.pool_instancias.values())
+        total_instancias = sum(self.copias_totales.values())
         total_disponibles = sum(self.pool_disponibles.values())
         total_en_uso = total_instancias - total_disponibles
 
@@ -391,11 +416,10 @@ class ManagerCartas:
         cartas_por_tier_total = {1: 0, 2: 0, 3: 0}
         cartas_por_tier_en_uso = {1: 0, 2: 0, 3: 0}
 
-        for carta_id, instancias in self.pool_instancias.items():
-            if carta_id in self.datos_cartas:
-                tier = self.datos_cartas[carta_id].get('tier', 1)
+        for carta_id, total_carta in self.copias_totales.items():
+            if carta_id in self._tier_de:
+                tier = self._tier_de[carta_id]
                 disponibles = self.pool_disponibles.get(carta_id, 0)
-                total_carta = len(instancias)
                 en_uso = total_carta - disponibles
 
                 cartas_por_tier_disponibles[tier] += disponibles
@@ -404,6 +428,7 @@ class ManagerCartas:
 
         return {
             'total_instancias_creadas': total_instancias,
+            'instancias_materializadas': len(self._instancias_por_id),
             'total_disponibles': total_disponibles,
             'total_en_uso': total_en_uso,
             'cartas_por_tier_disponibles': cartas_por_tier_disponibles,
@@ -429,10 +454,10 @@ class ManagerCartas:
         log_evento("🔄 Reseteando pools de cartas...")
 
         # Marcar todas las instancias como disponibles
-        for carta_id, instancias in self.pool_instancias.items():
+        for instancias in self.pool_instancias.values():
             for instancia in instancias:
                 instancia._en_uso = False
-            self.pool_disponibles[carta_id] = len(instancias)
+        self._reconstruir_libres()
 
         # Resetear pool legacy
         self._inicializar_pool_global()
@@ -449,7 +474,7 @@ class ManagerCartas:
         cartas_info = []
         for carta_id, carta_data in self.datos_cartas.items():
             disponibles = self.pool_disponibles.get(carta_id, 0)
-            total_instancias = len(self.pool_instancias.get(carta_id, []))
+            total_instancias = self.copias_totales.get(carta_id, 0)
             en_uso = total_instancias - disponibles
 
             info_basica = {
@@ -482,15 +507,22 @@ class ManagerCartas:
         errores = []
 
         for carta_id, instancias in self.pool_instancias.items():
-            # Contar instancias marcadas como en uso
-            en_uso_real = sum(1 for inst in instancias if getattr(inst, '_en_uso', False))
-            disponibles_real = len(instancias) - en_uso_real
+            # Contar instancias marcadas como en uso (las copias nunca creadas están libres)
+            en_uso = {inst.numero_copia for inst in instancias if getattr(inst, '_en_uso', False)}
+            disponibles_real = self.copias_totales.get(carta_id, 0) - len(en_uso)
             disponibles_registradas = self.pool_disponibles.get(carta_id, 0)
 
             if disponibles_real != disponibles_registradas:
                 errores.append(
                     f"Carta {carta_id}: disponibles_real={disponibles_real}, registradas={disponibles_registradas}")
 
+            libres = self._libres.get(carta_id, [])
+            if len(libres) != disponibles_real or en_uso.intersection(libres):
+                errores.append(f"Carta {carta_id}: pila de libres inconsistente ({len(libres)} copias)")
+            posicion = self._posicion_en_tier.get(carta_id)
+            if posicion is not None and self._arboles_tier[self._tier_de[carta_id]].pesos[posicion] != len(libres):
+                errores.append(f"Carta {carta_id}: árbol de muestreo inconsistente")
+
         if errores:
             log_evento("❌ Errores de integridad en pool:")
             for error in errores:
@@ -501,7 +533,7 @@ class ManagerCartas:
             return True
 
     def __str__(self):
-        return f"ManagerCartas({len(self.datos_cartas)} tipos, {sum(len(inst) for inst in self.pool_instancias.values())} instancias)"
+        return f"ManagerCartas({len(self.datos_cartas)} tipos, {sum(self.copias_totales.values())} copias)"
 
     def __repr__(self):
         stats = self.obtener_estadisticas_pool()
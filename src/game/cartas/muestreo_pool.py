@@ -0,0 +1,64 @@
+"""
+Muestreo ponderado sobre el pool compartido de cartas
+Un árbol de Fenwick por tier guarda las copias libres de cada carta: tomar o
+devolver una copia es una actualización O(log n) y sortear una carta con
+probabilidad proporcional a sus copias restantes es una búsqueda O(log n).
+"""
+
+import random
+from typing import List, Optional, Sequence
+
+
+class ArbolFenwick:
+    """Sumas acumuladas de pesos enteros no negativos con actualización y búsqueda O(log n)"""
+
+    def __init__(self, pesos: Sequence[int] = ()):
+        self.pesos: List[int] = list(pesos)
+        self.tamano = len(self.pesos)
+        self.total = sum(self.pesos)
+
+        # Construcción O(n): cada nodo suma su tramo y lo propaga a su padre
+        self.arbol = [0] + self.pesos
+        for i in range(1, self.tamano + 1):
+            padre = i + (i & -i)
+            if padre <= self.tamano:
+                self.arbol[padre] += self.arbol[i]
+
+    def actualizar(self, indice: int, delta: int):
+        """Suma delta al peso del índice (base 0)"""
+        self.pesos[indice] += delta
+        self.total += delta
+        i = indice + 1
+        while i <= self.tamano:
+            self.arbol[i] += delta
+            i += i & -i
+
+    def suma_acumulada(self, fin: int) -> int:
+        """Suma de los pesos[0:fin]"""
+        suma = 0
+        i = fin
+        while i > 0:
+            suma += self.arbol[i]
+            i -= i & -i
+        return suma
+
+    def buscar(self, objetivo: int) -> int:
+        """Índice (base 0) donde cae el objetivo, con 0 <= objetivo < total"""
+        posicion = 0
+        paso = 1 << self.tamano.bit_length()
+        while paso:
+            siguiente = posicion + paso
+            if siguiente <= self.tamano and self.arbol[siguiente] <= objetivo:
+                posicion = siguiente
+                objetivo -= self.arbol[siguiente]
+            paso >>= 1
+        return posicion
+
+    def sortear(self, rng=random) -> Optional[int]:
+        """Índice elegido con probabilidad proporcional a su peso, o None si no queda peso"""
+        if self.total <= 0:
+            return None
+        return self.buscar(rng.randrange(self.total))
+
+    def __len__(self):
+        return self.tamano
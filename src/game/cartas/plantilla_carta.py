@@ -0,0 +1,111 @@
+"""
+Plantillas inmutables de cartas
+Los datos estáticos de cada entrada del catálogo (textos, stats base y
+habilidades) se construyen una vez y se comparten entre todas sus copias;
+cada CartaBase guarda solo el estado que cambia durante la partida.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Tuple
+
+# Campos de habilidad con atributo propio; el resto va a `propiedades`
+_CAMPOS_HABILIDAD = ('nombre', 'tipo', 'descripcion', 'costo_mana', 'cooldown',
+                     'rango', 'duracion', 'trigger', 'area')
+_CAMPOS_CARTA = ('id', 'nombre', 'descripcion', 'tier', 'costo', 'rol', 'categoria')
+# Campos que en el JSON van dentro de "stats"
+_STATS_CARTA = ('vida', 'dano_fisico', 'dano_magico', 'defensa_fisica', 'defensa_magica',
+                'rango_movimiento', 'rango_ataque', 'intervalo_ataque')
+
+
+class _Inmutable:
+    """Base para objetos de solo lectura: los campos se fijan una vez en __init__"""
+    __slots__ = ()
+
+    def _fijar(self, nombre: str, valor):
+        object.__setattr__(self, nombre, valor)
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError(f"{type(self).__name__} es inmutable")
+
+    def __delattr__(self, nombre):
+        raise AttributeError(f"{type(self).__name__} es inmutable")
+
+    def __reduce__(self):
+        # Se reconstruye desde sus campos en formato JSON (setattr no está disponible al deserializar)
+        return type(self), (self.como_datos(),)
+
+
+class PlantillaHabilidad(_Inmutable):
+    """Datos estáticos de una habilidad"""
+    __slots__ = _CAMPOS_HABILIDAD + ('propiedades',)
+
+    def __init__(self, datos_habilidad: Dict[str, Any]):
+        self._fijar('nombre', datos_habilidad.get('nombre', 'Habilidad Sin Nombre'))
+        self._fijar('tipo', datos_habilidad.get('tipo', 'pasiva'))  # 'activa' o 'pasiva'
+        self._fijar('descripcion', datos_habilidad.get('descripcion', ''))
+
+        # Propiedades para habilidades activas
+        self._fijar('costo_mana', datos_habilidad.get('costo_mana', 0))
+        self._fijar('cooldown', datos_habilidad.get('cooldown', 0))
+        self._fijar('rango', datos_habilidad.get('rango', 1))
+        self._fijar('duracion', datos_habilidad.get('duracion', 0))
+
+        # Propiedades para habilidades pasivas
+        self._fijar('trigger', datos_habilidad.get('trigger', 'permanente'))
+        self._fijar('area', datos_habilidad.get('area', 'single'))
+
+        # Propiedades especiales
+        self._fijar('propiedades', MappingProxyType(
+            {k: v for k, v in datos_habilidad.items() if k not in _CAMPOS_HABILIDAD}
+        ))
+
+    def como_datos(self) -> Dict[str, Any]:
+        """Datos de la habilidad en el formato del JSON"""
+        datos = {campo: getattr(self, campo) for campo in _CAMPOS_HABILIDAD}
+        datos.update(self.propiedades)
+        return datos
+
+    def __repr__(self):
+        return f"PlantillaHabilidad(nombre='{self.nombre}', tipo='{self.tipo}')"
+
+
+class PlantillaCarta(_Inmutable):
+    """Prototipo compartido de una entrada del catálogo"""
+    __slots__ = _CAMPOS_CARTA + _STATS_CARTA + ('habilidades',)
+
+    def __init__(self, datos_carta: Dict[str, Any]):
+        self._fijar('id', datos_carta.get('id', 0))
+        self._fijar('nombre', datos_carta.get('nombre', 'Carta Sin Nombre'))
+        self._fijar('descripcion', datos_carta.get('descripcion', ''))
+
+        # Metadatos
+        self._fijar('tier', datos_carta.get('tier', 1))
+        self._fijar('costo', datos_carta.get('costo', 1))
+        self._fijar('rol', datos_carta.get('rol', 'basico'))
+        self._fijar('categoria', datos_carta.get('categoria', 'general'))
+
+        # Stats base (de los datos JSON)
+        stats_data = datos_carta.get('stats', {})
+        self._fijar('vida', stats_data.get('vida', 100))
+        self._fijar('dano_fisico', stats_data.get('dano_fisico', 10))
+        self._fijar('dano_magico', stats_data.get('dano_magico', 0))
+        self._fijar('defensa_fisica', stats_data.get('defensa_fisica', 0))
+        self._fijar('defensa_magica', stats_data.get('defensa_magica', 0))
+        self._fijar('rango_movimiento', stats_data.get('rango_movimiento', 1))
+        self._fijar('rango_ataque', stats_data.get('rango_ataque', 1))
+        self._fijar('intervalo_ataque', stats_data.get('intervalo_ataque', 1.5))  # segundos entre ataques
+
+        habilidades: Tuple[PlantillaHabilidad, ...] = tuple(
+            PlantillaHabilidad(hab_data) for hab_data in datos_carta.get('habilidades', [])
+        )
+        self._fijar('habilidades', habilidades)
+
+    def como_datos(self) -> Dict[str, Any]:
+        """Datos de la carta en el formato del JSON"""
+        datos = {campo: getattr(self, campo) for campo in _CAMPOS_CARTA}
+        datos['stats'] = {campo: getattr(self, campo) for campo in _STATS_CARTA}
+        datos['habilidades'] = [habilidad.como_datos() for habilidad in self.habilidades]
+        return datos
+
+    def __repr__(self):
+        return f"PlantillaCarta(id={self.id}, nombre='{self.nombre}', tier={self.tier})"
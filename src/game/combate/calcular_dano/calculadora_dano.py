@@ -1,18 +1,37 @@
 # calculadora_dano.py
 
-from src.game.combate.calcular_dano.modificadores_basicos import aplicar_defensas
-from src.game.combate.calcular_dano.sinergias_dano import aplicar_bonus_sinergia
-from src.game.combate.calcular_dano.efectos_especiales import aplicar_efectos_especiales
+from array import array
+from typing import Optional, Sequence
+
+from src.game.combate.calcular_dano.modificadores_basicos import (
+    aplicar_defensas_lote, codigo_tipo_dano, reunir_defensas
+)
+from src.game.combate.calcular_dano.sinergias_dano import aplicar_bonus_sinergia_lote
+from src.game.combate.calcular_dano.efectos_especiales import aplicar_efectos_especiales_lote
+
 
 def calcular_dano(fuente, objetivo, interaccion) -> int:
     """
     Calcula el daño final a aplicar a un objetivo, considerando todas las capas de modificadores.
     """
     base = interaccion.metadata.get("dano_base", fuente.dano_base)
-    tipo_dano = interaccion.metadata.get("tipo_dano", "fisico")
+    tipo_dano = codigo_tipo_dano(interaccion.metadata.get("tipo_dano", "fisico"))
+    return calcular_dano_lote((fuente, objetivo), [0], [1], [base], [tipo_dano], [interaccion])[0]
+
 
-    dano_post_defensa = aplicar_defensas(base, objetivo, tipo_dano)
-    dano_con_bonus = aplicar_bonus_sinergia(fuente, objetivo, dano_post_defensa)
-    dano_final = aplicar_efectos_especiales(fuente, objetivo, interaccion, dano_con_bonus)
+def calcular_dano_lote(estados, fuentes: Sequence[int], objetivos: Sequence[int],
+                       danos_base: Sequence[int], tipos_dano: Sequence[int],
+                       interacciones: Optional[Sequence] = None) -> array:
+    """
+    Calcula el daño final de todos los golpes resueltos en un tick.
+    Los golpes se describen con arrays paralelos: ids de atacante y objetivo,
+    daño base y código de tipo (ver codigo_tipo_dano). `estados` resuelve los
+    ids: un AlmacenCombate (ids = slots) o un mapeo/secuencia id → estado.
+    Cada capa de modificadores se aplica una vez sobre el lote completo.
+    """
+    danos = aplicar_bonus_sinergia_lote(estados, fuentes, tipos_dano, danos_base)
+    defensas = reunir_defensas(estados, objetivos, tipos_dano)
+    danos = aplicar_defensas_lote(danos, defensas)
+    danos = aplicar_efectos_especiales_lote(estados, fuentes, objetivos, interacciones, danos)
 
-    return max(1, int(dano_final))  # Nunca menos de 1 de daño
+    return array('q', [max(1, int(dano)) for dano in danos])  # Nunca menos de 1 de daño
@@ -1,9 +1,9 @@
 # efectos_especiales.py
 
-def aplicar_efectos_especiales(fuente, objetivo, interaccion, dano_actual: float) -> float:
+def aplicar_efectos_especiales_lote(estados, fuentes, objetivos, interacciones, danos):
     """
-    Aplica efectos contextuales: críticos, buffs, habilidades especiales, etc.
+    Aplica efectos contextuales (críticos, buffs, habilidades especiales, etc.) a cada
+    golpe del lote, modificando `danos` en sitio y retornándolo.
     Por ahora devuelve el daño tal cual, pero permite futura extensión.
     """
-    # TODO: aplicar modificadores por habilidades, buffs, estados especiales, etc.
-    return dano_actual
+    return danos
@@ -1,14 +1,46 @@
 # modificadores_basicos.py
 
-def aplicar_defensas(dano_base: int, objetivo, tipo_dano: str = "fisico") -> float:
+from array import array
+
+# Códigos de tipo de daño para las operaciones por lote
+TIPO_FISICO = 0
+TIPO_MAGICO = 1
+TIPO_VERDADERO = 2  # Ignora defensas (cualquier tipo desconocido se trata igual)
+
+_CODIGOS_TIPO = {"fisico": TIPO_FISICO, "magico": TIPO_MAGICO}
+
+
+def codigo_tipo_dano(tipo_dano: str) -> int:
+    """Traduce el nombre del tipo de daño a su código numérico"""
+    return _CODIGOS_TIPO.get(tipo_dano, TIPO_VERDADERO)
+
+
+def reunir_defensas(estados, objetivos, tipos) -> array:
     """
-    Resta defensa al daño base según el tipo (físico o mágico).
+    Defensa que aplica a cada golpe del lote según su tipo.
+    `estados` es un AlmacenCombate (los ids son slots y se leen sus columnas)
+    o cualquier mapeo/secuencia id → estado.
     """
-    if tipo_dano == "fisico":
-        defensa = objetivo.defensa_fisica_actual
-    elif tipo_dano == "magico":
-        defensa = objetivo.defensa_magica_actual
-    else:
-        defensa = 0
-
-    return max(1, dano_base - defensa)
+    fisica = getattr(estados, "defensa_fisica", None)
+    magica = getattr(estados, "defensa_magica", None)
+    if fisica is None or magica is None:
+        fisica = [0] * len(objetivos)
+        magica = [0] * len(objetivos)
+        for i, objetivo_id in enumerate(objetivos):
+            objetivo = estados[objetivo_id]
+            fisica[i] = objetivo.defensa_fisica_actual
+            magica[i] = objetivo.defensa_magica_actual
+        objetivos = range(len(objetivos))
+
+    defensas = array('q', bytes(8 * len(tipos)))
+    for i, (objetivo_id, tipo) in enumerate(zip(objetivos, tipos)):
+        if tipo == TIPO_FISICO:
+            defensas[i] = fisica[objetivo_id]
+        elif tipo == TIPO_MAGICO:
+            defensas[i] = magica[objetivo_id]
+    return defensas
+
+
+def aplicar_defensas_lote(danos_base, defensas) -> array:
+    """Resta a cada golpe la defensa de su tipo (ver reunir_defensas): max(1, daño - defensa)"""
+    return array('d', [max(1, dano - defensa) for dano, defensa in zip(danos_base, defensas)])
@@ -1,11 +1,33 @@
 # sinergias_dano.py
 
-def aplicar_bonus_sinergia(fuente, objetivo, dano_actual: float) -> float:
+from array import array
+
+from src.game.combate.calcular_dano.modificadores_basicos import TIPO_FISICO, TIPO_MAGICO
+
+
+def aplicar_bonus_sinergia_lote(estados, fuentes, tipos, danos_base) -> array:
     """
-    Aumenta el daño según las sinergias activas del atacante.
-    Esta función es un stub: deberá expandirse para soportar categorías y roles.
+    Suma al daño base de cada golpe el bonus de sinergia de su atacante según el
+    tipo de daño. Es un bonus de stat (como en ManagerCartas.aplicar_sinergias),
+    así que se aplica antes de las defensas. Los bonus los precalcula
+    TablaSinergias al congelar el tablero; con un AlmacenCombate se leen sus
+    columnas por slot.
     """
-    # TODO: Implementar bonificaciones reales por sinergia
-    # Por ejemplo: +10% si fuente tiene sinergia activa con su rol
+    danos = array('q', danos_base)
+    fisico = getattr(estados, "bonus_fisico", None)
+    magico = getattr(estados, "bonus_magico", None)
+    if fisico is None or magico is None:
+        fisico = [0] * len(fuentes)
+        magico = [0] * len(fuentes)
+        for i, fuente_id in enumerate(fuentes):
+            fuente = estados[fuente_id]
+            fisico[i] = getattr(fuente, "bonus_dano_fisico", 0)
+            magico[i] = getattr(fuente, "bonus_dano_magico", 0)
+        fuentes = range(len(fuentes))
 
-    return dano_actual
+    for i, (fuente_id, tipo) in enumerate(zip(fuentes, tipos)):
+        if tipo == TIPO_FISICO:
+            danos[i] += fisico[fuente_id]
+        elif tipo == TIPO_MAGICO:
+            danos[i] += magico[fuente_id]
+    return danos
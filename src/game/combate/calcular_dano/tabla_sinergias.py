@@ -0,0 +1,137 @@
+"""
+Tabla de sinergias de combate
+Las reglas de sinergia (conteo por categoría y rol, y bonus de stats por
+carta) viven aquí y las usan tanto ManagerCartas como el combate. Al congelar
+el tablero al inicio del combate se cuentan una vez las sinergias de cada
+equipo; al morir una unidad solo se recalculan los grupos (categoría y rol de
+su equipo) a los que pertenecía. Cada unidad guarda su bonus de daño en su
+EstadoCarta (o en las columnas del AlmacenCombate) para que el pipeline de
+daño lo lea sin recalcular nada por golpe.
+"""
+
+from typing import Dict, Iterable, Mapping, Tuple
+
+from src.utils.helpers import log_evento
+
+# Mínimo de cartas vivas de la misma categoría/rol para activar la sinergia
+UMBRAL_SINERGIA = 2
+# Categoría: +5 vida y +2 daño (físico y mágico) por cada carta adicional
+VIDA_POR_CATEGORIA = 5
+DANO_POR_CATEGORIA = 2
+# Rol: los líderes ganan +3 defensa física y los especialistas +8 daño mágico por carta del rol
+DEFENSA_POR_LIDER = 3
+MAGIA_POR_ESPECIALISTA = 8
+
+_SIN_BONUS = {'vida': 0, 'dano_fisico': 0, 'dano_magico': 0, 'defensa_fisica': 0}
+
+
+def claves_sinergia(carta) -> Tuple[str, str]:
+    """Claves de los grupos de sinergia de una carta"""
+    return f"categoria_{carta.categoria}", f"rol_{carta.rol}"
+
+
+def contar_sinergias(cartas: Iterable) -> Dict[str, int]:
+    """Sinergias activas de un grupo de cartas: clave → cantidad de cartas del grupo"""
+    categorias: Dict[str, int] = {}
+    roles: Dict[str, int] = {}
+    for carta in cartas:
+        categoria, rol = claves_sinergia(carta)
+        categorias[categoria] = categorias.get(categoria, 0) + 1
+        roles[rol] = roles.get(rol, 0) + 1
+
+    return {clave: cantidad for conteo in (categorias, roles)
+            for clave, cantidad in conteo.items() if cantidad >= UMBRAL_SINERGIA}
+
+
+def bonus_sinergia(carta, sinergias: Mapping[str, int]) -> Dict[str, int]:
+    """Bonus de stats de una carta según los conteos de su equipo (los grupos bajo el umbral no suman)"""
+    bonus = dict(_SIN_BONUS)
+    categoria, rol = claves_sinergia(carta)
+
+    nivel = sinergias.get(categoria, 0)
+    if nivel >= UMBRAL_SINERGIA:
+        bonus['vida'] += (nivel - 1) * VIDA_POR_CATEGORIA
+        bonus['dano_fisico'] += (nivel - 1) * DANO_POR_CATEGORIA
+        bonus['dano_magico'] += (nivel - 1) * DANO_POR_CATEGORIA
+
+    nivel = sinergias.get(rol, 0)
+    if nivel >= UMBRAL_SINERGIA:
+        if carta.rol == 'lider':
+            bonus['defensa_fisica'] += nivel * DEFENSA_POR_LIDER
+        elif carta.rol == 'especialista':
+            bonus['dano_magico'] += nivel * MAGIA_POR_ESPECIALISTA
+    return bonus
+
+
+class TablaSinergias:
+    """Conteos de sinergia por equipo y bonus aplicado a cada unidad (se congela una vez por combate)"""
+
+    def __init__(self):
+        self.conteos: Dict[object, Dict[str, int]] = {}  # equipo → clave → unidades vivas
+        self._miembros: Dict[Tuple[object, str], set] = {}  # (equipo, clave) → estados vivos
+        self._grupos: Dict[int, Tuple[object, str, str]] = {}  # id(estado) → (equipo, categoria, rol)
+        self._bonus: Dict[int, Dict[str, int]] = {}  # id(estado) → bonus aplicado
+
+    def congelar(self, estados: Iterable):
+        """Cuenta las sinergias de las unidades vivas y aplica el bonus de cada una"""
+        self.conteos.clear()
+        self._miembros.clear()
+        self._grupos.clear()
+        self._bonus.clear()
+
+        vivos = [estado for estado in estados if estado.esta_viva()]
+        for estado in vivos:
+            equipo = getattr(estado.carta, 'duenio', None)
+            categoria, rol = claves_sinergia(estado.carta)
+            self._grupos[id(estado)] = (equipo, categoria, rol)
+            conteo = self.conteos.setdefault(equipo, {})
+            for clave in (categoria, rol):
+                conteo[clave] = conteo.get(clave, 0) + 1
+                self._miembros.setdefault((equipo, clave), set()).add(estado)
+
+        for estado in vivos:
+            # La vida extra se otorga una sola vez, al inicio del combate
+            self._actualizar_bonus(estado, otorgar_vida=True)
+        log_evento(lambda: f"🔗 Sinergias congeladas: {self.conteos}", "DEBUG")
+
+    def registrar_muerte(self, estado):
+        """Descuenta la unidad de sus grupos y recalcula solo a sus compañeros de grupo"""
+        grupo = self._grupos.pop(id(estado), None)
+        if grupo is None:
+            return
+        equipo, categoria, rol = grupo
+        conteo = self.conteos[equipo]
+        afectados = set()
+        for clave in (categoria, rol):
+            conteo[clave] -= 1
+            miembros = self._miembros[(equipo, clave)]
+            miembros.discard(estado)
+            afectados |= miembros
+        self._bonus.pop(id(estado), None)
+        estado.bonus_dano_fisico = 0
+        estado.bonus_dano_magico = 0
+
+        for companero in afectados:
+            self._actualizar_bonus(companero)
+
+    def bonus(self, estado) -> Dict[str, int]:
+        """Bonus de sinergia vigente de una unidad"""
+        return dict(self._bonus.get(id(estado), _SIN_BONUS))
+
+    def sinergias_activas(self, equipo) -> Dict[str, int]:
+        """Sinergias activas de un equipo con su nivel (mismo formato que ManagerCartas.calcular_sinergias)"""
+        return {clave: cantidad for clave, cantidad in self.conteos.get(equipo, {}).items()
+                if cantidad >= UMBRAL_SINERGIA}
+
+    def _actualizar_bonus(self, estado, otorgar_vida: bool = False):
+        equipo = self._grupos[id(estado)][0]
+        bonus = bonus_sinergia(estado.carta, self.conteos[equipo])
+        anterior = self._bonus.get(id(estado), _SIN_BONUS)
+
+        if otorgar_vida:
+            estado.vida_actual += bonus['vida']
+        # La defensa se ajusta por diferencia con el bonus ya aplicado
+        estado.defensa_fisica_actual += bonus['defensa_fisica'] - anterior['defensa_fisica']
+        estado.bonus_dano_fisico = bonus['dano_fisico']
+        estado.bonus_dano_magico = bonus['dano_magico']
+        self._bonus[id(estado)] = bonus
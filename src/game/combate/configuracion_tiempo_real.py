@@ -3,9 +3,10 @@ Configuración centralizada para el sistema de tiempo real
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
 import os
+import threading
 from src.utils.helpers import log_evento, cargar_json, guardar_json
 
 
@@ -18,6 +19,7 @@ class ConfiguracionMotor:
     timeout_hilo_segundos: float = 2.0
     intervalo_stats_segundos: float = 1.0
     max_errores_por_componente: int = 5
+    intervalo_recarga_segundos: float = 1.0  # Cada cuánto los motores revisan si el archivo cambió
 
 
 @dataclass
@@ -42,23 +44,43 @@ class ConfiguracionTurnos:
 class ConfiguradorTiempoReal:
     """Manejador de configuración para el sistema de tiempo real"""
 
-    def __init__(self, archivo_config: str = "config/tiempo_real.json"):
+    def __init__(self, archivo_config: str = "config/tiempo_real.json", cargar: bool = True):
         self.archivo_config = archivo_config
         self.motor = ConfiguracionMotor()
         self.componentes = ConfiguracionComponentes()
         self.turnos = ConfiguracionTurnos()
 
+        # Se incrementa en cada carga: los motores la comparan para aplicar cambios en caliente
+        self.version = 0
+        self._mtime_cargado: Optional[int] = None
+        self._lock = threading.Lock()
+
         # Intentar cargar configuración existente
-        self.cargar_configuracion()
+        if cargar:
+            self.cargar_configuracion()
+
+    def recargar_si_cambio(self) -> bool:
+        """Vuelve a cargar el archivo si su mtime cambió desde la última carga; True si recargó"""
+        try:
+            mtime = os.stat(self.archivo_config).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self._mtime_cargado:
+            return False
+        with self._lock:
+            if mtime == self._mtime_cargado:
+                return False
+            return self.cargar_configuracion()
 
     def cargar_configuracion(self) -> bool:
-        """Carga configuración desde archivo"""
+        """Carga configuración desde archivo (sin archivo se usan los valores por defecto)"""
         try:
             if not os.path.exists(self.archivo_config):
                 log_evento(f"📋 Archivo de config no existe, usando valores por defecto")
-                self.guardar_configuracion()  # Crear archivo con defaults
                 return True
 
+            mtime = os.stat(self.archivo_config).st_mtime_ns
+
             datos = cargar_json(self.archivo_config)
             if not datos:
                 log_evento(f"⚠️ Error cargando configuración, usando defaults")
@@ -77,6 +99,8 @@ class ConfiguradorTiempoReal:
                                                                      self.motor.intervalo_stats_segundos)
                 self.motor.max_errores_por_componente = motor_data.get('max_errores_por_componente',
                                                                        self.motor.max_errores_por_componente)
+                self.motor.intervalo_recarga_segundos = motor_data.get('intervalo_recarga_segundos',
+                                                                       self.motor.intervalo_recarga_segundos)
 
             # Cargar configuración de componentes
             if 'componentes' in datos:
@@ -104,6 +128,8 @@ class ConfiguradorTiempoReal:
                 self.turnos.fps_durante_transicion = turnos_data.get('fps_durante_transicion',
                                                                      self.turnos.fps_durante_transicion)
 
+            self._mtime_cargado = mtime
+            self.version += 1
             log_evento(f"✅ Configuración cargada desde {self.archivo_config}")
             return True
 
@@ -121,7 +147,8 @@ class ConfiguradorTiempoReal:
                     'max_eventos_programados': self.motor.max_eventos_programados,
                     'timeout_hilo_segundos': self.motor.timeout_hilo_segundos,
                     'intervalo_stats_segundos': self.motor.intervalo_stats_segundos,
-                    'max_errores_por_componente': self.motor.max_errores_por_componente
+                    'max_errores_por_componente': self.motor.max_errores_por_componente,
+                    'intervalo_recarga_segundos': self.motor.intervalo_recarga_segundos
                 },
                 'componentes': {
                     'intervalo_minimo_default': self.componentes.intervalo_minimo_default,
@@ -205,7 +232,8 @@ class ConfiguradorTiempoReal:
                 'max_eventos_programados': self.motor.max_eventos_programados,
                 'timeout_hilo_segundos': self.motor.timeout_hilo_segundos,
                 'intervalo_stats_segundos': self.motor.intervalo_stats_segundos,
-                'max_errores_por_componente': self.motor.max_errores_por_componente
+                'max_errores_por_componente': self.motor.max_errores_por_componente,
+                'intervalo_recarga_segundos': self.motor.intervalo_recarga_segundos
             },
             'componentes': {
                 'intervalo_minimo_default': self.componentes.intervalo_minimo_default,
@@ -258,5 +286,5 @@ class ConfiguradorTiempoReal:
             return False
 
 
-# Instancia global del configurador (singleton)
-configurador_tiempo_real = ConfiguradorTiempoReal()
\ No newline at end of file
+# Instancia global del configurador (singleton); el archivo se lee en la primera recargar_si_cambio()
+configurador_tiempo_real = ConfiguradorTiempoReal(cargar=False)
@@ -0,0 +1,52 @@
+# ia_instantanea.py
+from typing import Dict, Iterable, List, Optional
+
+
+class InstantaneaTablero:
+    """
+    Vista del tablero congelada para un tick de IA.
+    Calcula una sola vez las posiciones y los enemigos en rango de todas las
+    cartas que van a decidir, y el resto de consultas se delegan al tablero.
+    """
+
+    def __init__(self, tablero, cartas: Iterable):
+        self.tablero = tablero
+        self.coordenadas: Dict[int, object] = {}  # id(carta) → coordenada
+        self.enemigos: Dict[int, List] = {}  # id(carta) → enemigos en rango
+        self._calcular(list(cartas))
+
+    def _calcular(self, cartas: List):
+        tablero = self.tablero
+        # Con bitboard cada carta resuelve sus enemigos con un AND de máscaras
+        usar_mascaras = hasattr(tablero, "mascara_rango")
+
+        for carta in cartas:
+            coord = tablero.obtener_coordenada_de(carta)
+            self.coordenadas[id(carta)] = coord
+            if coord is None:
+                self.enemigos[id(carta)] = []
+                continue
+
+            rango = getattr(carta, "rango_ataque_actual", 1)
+            if usar_mascaras:
+                mascara = tablero.mascara_rango(coord, rango) & tablero.mascara_enemigos(carta)
+                self.enemigos[id(carta)] = [otra for _, otra in tablero.obtener_cartas_de_mascara(mascara)]
+            else:
+                # Tablero de diccionario: la consulta recorre ocupadas o la tupla de rango cacheada
+                self.enemigos[id(carta)] = [
+                    otra for _, otra in tablero.obtener_cartas_en_rango(coord, rango)
+                    if otra is not carta and not carta.es_aliado_de(otra)
+                ]
+
+    def enemigos_en_rango_de(self, carta) -> Optional[List]:
+        """Enemigos precalculados de la carta, o None si no formó parte de la instantánea"""
+        return self.enemigos.get(id(carta))
+
+    def obtener_coordenada_de(self, carta):
+        if id(carta) in self.coordenadas:
+            return self.coordenadas[id(carta)]
+        return self.tablero.obtener_coordenada_de(carta)
+
+    def __getattr__(self, nombre):
+        # Cualquier otra consulta va al tablero real
+        return getattr(self.tablero, nombre)
@@ -0,0 +1,36 @@
+# ia_objetivos.py
+from typing import Callable, Dict, List
+
+from src.utils.helpers import log_evento
+
+
+def objetivo_menor_vida(candidatos: List) -> List:
+    """Concentra el ataque en el enemigo con menos vida actual"""
+    return [min(candidatos, key=lambda estado: estado.vida_actual)]
+
+
+def objetivo_primero(candidatos: List) -> List:
+    """Ataca al primer enemigo que reportó la IA"""
+    return candidatos[:1]
+
+
+def todos_los_objetivos(candidatos: List) -> List:
+    """Ataca a todos los enemigos en rango (comportamiento original)"""
+    return list(candidatos)
+
+
+POLITICAS_OBJETIVO: Dict[str, Callable[[List], List]] = {
+    "menor_vida": objetivo_menor_vida,
+    "primero": objetivo_primero,
+    "todos": todos_los_objetivos,
+}
+
+
+def obtener_politica_objetivo(politica) -> Callable[[List], List]:
+    """Acepta el nombre de una política registrada o una función propia"""
+    if callable(politica):
+        return politica
+    if politica not in POLITICAS_OBJETIVO:
+        log_evento(f"⚠️ Política de objetivo desconocida '{politica}', se usa 'menor_vida'")
+        return objetivo_menor_vida
+    return POLITICAS_OBJETIVO[politica]
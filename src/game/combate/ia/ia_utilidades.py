@@ -1,4 +1,6 @@
 # ia_utilidades.py
+from src.game.combate.ia.ia_instantanea import InstantaneaTablero
+
 
 def obtener_info_entorno(carta, tablero):
     """
@@ -11,6 +13,16 @@ def obtener_info_entorno(carta, tablero):
         }
     """
     coord = tablero.obtener_coordenada_de(carta)
+
+    # Con una instantánea del tick los enemigos ya vienen calculados en lote
+    if isinstance(tablero, InstantaneaTablero):
+        enemigos = tablero.enemigos_en_rango_de(carta)
+        if enemigos is not None:
+            return {
+                "coordenada_actual": coord,
+                "enemigos_en_rango": enemigos
+            }
+
     enemigos = []
 
     rango = getattr(carta, "rango_ataque_actual", 1)
@@ -1,11 +1,17 @@
 # interacciones/gestor_interacciones.py
 
+from array import array
 from typing import List
 from src.game.cartas.estado_carta import EstadoCarta  # Cada carta tiene un estado de combate
-from src.game.combate.calcular_dano.calculadora_dano import calcular_dano
+from src.game.combate.calcular_dano.calculadora_dano import calcular_dano_lote
+from src.game.combate.calcular_dano.modificadores_basicos import codigo_tipo_dano
+from src.game.combate.calcular_dano.tabla_sinergias import TablaSinergias
+from src.game.combate.ia.ia_instantanea import InstantaneaTablero
 from src.game.combate.ia.ia_motor import generar_interacciones_para
+from src.game.combate.ia.ia_objetivos import obtener_politica_objetivo
 from src.game.combate.interacciones.interaccion_modelo import Interaccion, TipoInteraccion
 from src.utils.helpers import log_evento
+from src.utils.registro_estructurado import CodigoEvento
 
 
 class GestorInteracciones:
@@ -14,62 +20,172 @@ class GestorInteracciones:
     Se ejecuta como componente dentro del motor de tiempo real.
     """
 
-    def __init__(self, tablero=None):
+    def __init__(self, tablero=None, politica_objetivo="menor_vida", eventos=None, almacen=None):
         self.interacciones_pendientes: List[Interaccion] = []
         self.estados_cartas: dict[int, EstadoCarta] = {}  # ID de carta → EstadoCarta
         self.tablero = tablero
+        # Cómo elige la IA entre los enemigos en rango ("menor_vida", "primero", "todos" o una función)
+        self.seleccionar_objetivos = obtener_politica_objetivo(politica_objetivo)
+        # RegistroEstructurado opcional: ataques y muertes como eventos numéricos por tick
+        self.eventos = eventos
+        self.ticks = 0
+        # AlmacenCombate opcional: los estados registrados pasan a ser vistas sobre sus columnas
+        # y los cooldowns de todas las unidades se avanzan en un solo recorrido
+        self.almacen = almacen
+        # TablaSinergias del combate en curso (ver congelar_sinergias)
+        self.sinergias = None
+
     def registrar_estado_carta(self, estado: EstadoCarta):
+        anterior = self.estados_cartas.get(estado.id_carta)
         self.estados_cartas[estado.id_carta] = estado
+        if self.almacen is not None:
+            if anterior is not None and anterior is not estado:
+                self.almacen.liberar(anterior)
+            self.almacen.registrar(estado)
+
+    def preparar_combate(self, cartas) -> TablaSinergias:
+        """Registra un EstadoCarta por carta del tablero congelado y calcula sus sinergias"""
+        for carta in cartas:
+            self.registrar_estado_carta(EstadoCarta(carta))
+        return self.congelar_sinergias()
+
+    def congelar_sinergias(self) -> TablaSinergias:
+        """Cuenta una vez las sinergias de cada equipo; las muertes las actualizan de forma incremental"""
+        self.sinergias = TablaSinergias()
+        self.sinergias.congelar(self.estados_cartas.values())
+        return self.sinergias
 
     def registrar_interaccion(self, interaccion: Interaccion):
-        log_evento(f"📨 Interacción registrada: {interaccion}")
+        log_evento(lambda: f"📨 Interacción registrada: {interaccion}", "DEBUG")
         self.interacciones_pendientes.append(interaccion)
 
     def procesar_tick(self, delta_time: float) -> bool:
-        # 🔁 Generar interacciones automáticas de cartas activas
-        for estado in self.estados_cartas.values():
-            carta = estado.carta
-            puede_actuar = getattr(carta, "puede_actuar", True)
-            if callable(puede_actuar):
-                puede_actuar = puede_actuar()
-            if hasattr(carta, "esta_viva"):
-                esta_viva = carta.esta_viva()
-            else:
-                esta_viva = True
-            puede_orden = getattr(carta, "tiene_orden_manual", lambda: False)
-            if self.tablero and esta_viva and puede_actuar and not puede_orden():
-                nuevas = generar_interacciones_para(carta, self.tablero)
-                self.interacciones_pendientes.extend(nuevas)
+        self.ticks += 1
+        if self.eventos is not None:
+            self.eventos.tick = self.ticks
+
+        # ⏱️ Avanzar los temporizadores de ataque con el tiempo transcurrido, no con los ticks
+        if self.almacen is not None:
+            estados = self.almacen.estados
+            candidatas = [estados[slot] for slot in self.almacen.avanzar_cooldowns(delta_time)]
+        else:
+            for estado in self.estados_cartas.values():
+                estado.reducir_cooldowns(delta_time)
+            candidatas = None
+
+        # 🔁 Generar interacciones automáticas de cartas cuyo ataque ya está listo
+        if self.tablero:
+            if candidatas is None:
+                candidatas = [estado for estado in self.estados_cartas.values() if estado.puede_actuar()]
+            listas = [estado for estado in candidatas if self._decide_por_ia(estado.carta)]
+            if listas:
+                # Posiciones y enemigos en rango de todas las cartas se calculan una vez por tick
+                instantanea = InstantaneaTablero(self.tablero, [estado.carta for estado in listas])
+                for estado in listas:
+                    nuevas = self._filtrar_objetivos(generar_interacciones_para(estado.carta, instantanea))
+                    if nuevas:
+                        estado.reiniciar_cooldown()
+                        self.interacciones_pendientes.extend(nuevas)
 
         if not self.interacciones_pendientes:
             return True
 
+        ataques = []
         for interaccion in self.interacciones_pendientes:
             fuente = self.estados_cartas.get(interaccion.fuente_id)
             objetivo = self.estados_cartas.get(interaccion.objetivo_id)
 
             if not fuente or not objetivo:
                 continue
-
             if interaccion.tipo == TipoInteraccion.ATAQUE:
-                self._procesar_ataque(interaccion, fuente, objetivo)
+                ataques.append((interaccion, fuente, objetivo))
+
+        # 🧮 Defensas y sinergias se toman al inicio del tick: el daño de todos los ataques se calcula en lote
+        danos = self._calcular_danos(ataques)
+        for (interaccion, fuente, objetivo), dano in zip(ataques, danos):
+            if not fuente.esta_viva() or not objetivo.esta_viva():
+                continue
+            self._procesar_ataque(interaccion, fuente, objetivo, dano)
 
         self.interacciones_pendientes.clear()
         return True
 
-    def _procesar_ataque(self, interaccion: Interaccion, fuente: EstadoCarta, objetivo: EstadoCarta):
+    def _calcular_danos(self, ataques) -> array:
+        """Arma los arrays del lote (slots del almacén o índices locales) y calcula el daño final"""
+        if not ataques:
+            return array('q')
+        danos_base = array('q', bytes(8 * len(ataques)))
+        tipos = array('b', bytes(len(ataques)))
+        interacciones = []
+        for i, (interaccion, fuente, _) in enumerate(ataques):
+            metadata = interaccion.metadata
+            danos_base[i] = metadata.get("dano_base", fuente.dano_base)
+            tipos[i] = codigo_tipo_dano(metadata.get("tipo_dano", "fisico"))
+            interacciones.append(interaccion)
+
+        if self.almacen is not None:
+            estados = self.almacen
+            fuentes = array('q', [fuente._slot for _, fuente, _ in ataques])
+            objetivos = array('q', [objetivo._slot for _, _, objetivo in ataques])
+        else:
+            estados = [estado for _, fuente, objetivo in ataques for estado in (fuente, objetivo)]
+            fuentes = range(0, 2 * len(ataques), 2)
+            objetivos = range(1, 2 * len(ataques), 2)
+        return calcular_dano_lote(estados, fuentes, objetivos, danos_base, tipos, interacciones)
+
+    @staticmethod
+    def _decide_por_ia(carta) -> bool:
+        """La carta está viva, puede actuar y no tiene una orden manual pendiente"""
+        puede_actuar = getattr(carta, "puede_actuar", True)
+        if callable(puede_actuar):
+            puede_actuar = puede_actuar()
+        if not puede_actuar:
+            return False
+        if hasattr(carta, "esta_viva") and not carta.esta_viva():
+            return False
+        tiene_orden_manual = getattr(carta, "tiene_orden_manual", None)
+        return not (tiene_orden_manual and tiene_orden_manual())
+
+    def _filtrar_objetivos(self, interacciones: List[Interaccion]) -> List[Interaccion]:
+        """Aplica la política de objetivo a los ataques de la IA (descarta objetivos ya derrotados)"""
+        ataques = {}
+        otras = []
+        for interaccion in interacciones:
+            objetivo = self.estados_cartas.get(interaccion.objetivo_id)
+            if interaccion.tipo != TipoInteraccion.ATAQUE:
+                otras.append(interaccion)
+            elif objetivo is not None and objetivo.esta_viva():
+                ataques.setdefault(id(objetivo), (interaccion, objetivo))
+
+        if not ataques:
+            return otras
+
+        por_estado = {id(estado): interaccion for interaccion, estado in ataques.values()}
+        elegidos = self.seleccionar_objetivos([estado for _, estado in ataques.values()])
+        return otras + [por_estado[id(estado)] for estado in elegidos]
+
+    def _procesar_ataque(self, interaccion: Interaccion, fuente: EstadoCarta, objetivo: EstadoCarta, dano: int):
         # Registrar en log
-        log_evento(f"⚔️ {fuente.nombre} ataca a {objetivo.nombre}")
+        log_evento(lambda: f"⚔️ {fuente.nombre} ataca a {objetivo.nombre}", "DEBUG")
 
         # Aplicar daño
-        dano = calcular_dano(fuente, objetivo, interaccion)
         objetivo.recibir_dano(dano)
+        if self.sinergias is not None and not objetivo.esta_viva():
+            self.sinergias.registrar_muerte(objetivo)
 
+        eventos = self.eventos
+        if eventos is not None:
+            id_fuente = eventos.texto(fuente.id_carta)
+            id_objetivo = eventos.texto(objetivo.id_carta)
+            eventos.registrar(CodigoEvento.ATAQUE, id_fuente, id_objetivo, dano, objetivo.vida_actual)
+            if not objetivo.esta_viva():
+                eventos.registrar(CodigoEvento.MUERTE, id_objetivo, id_fuente)
 
     def obtener_estadisticas(self):
         return {
             "interacciones_en_cola": len(self.interacciones_pendientes),
-            "cartas_registradas": len(self.estados_cartas)
+            "cartas_registradas": len(self.estados_cartas),
+            "ticks": self.ticks
         }
 
     def obtener_id_componente(self) -> str:
@@ -1,6 +1,7 @@
 from .zona_mapa import ZonaMapa
 from .utilidades_mapa import generar_hexagonos_contiguos
 from src.game.tablero.tablero_hexagonal import CoordenadaHexagonal
+from src.utils.helpers import log_evento
 import random
 
 class GeneradorMapa:
@@ -16,7 +17,11 @@ class GeneradorMapa:
         usadas = set()
 
         for pareja_id in range(self.cantidad_parejas):
-            origen = random.choice(list(coordenadas_disponibles - usadas))
+            libres = coordenadas_disponibles - usadas
+            if not libres:
+                log_evento(f"⚠️ Sin celdas libres para la pareja de zonas {pareja_id}")
+                break
+            origen = random.choice(list(libres))
             zona_roja_coords = generar_hexagonos_contiguos(
                 origen, self.celdas_por_zona, disponibles=coordenadas_disponibles
             )
@@ -38,7 +43,11 @@ class GeneradorMapa:
                     break
 
             if not origen_azul:
-                origen_azul = random.choice(list(coordenadas_disponibles - usadas))
+                libres = coordenadas_disponibles - usadas
+                if not libres:
+                    log_evento(f"⚠️ Sin celdas libres para la zona azul de la pareja {pareja_id}")
+                    break
+                origen_azul = random.choice(list(libres))
 
             zona_azul_coords = generar_hexagonos_contiguos(
                 origen_azul, self.celdas_por_zona, disponibles=coordenadas_disponibles
@@ -1,14 +1,16 @@
 from typing import Dict, Optional
 from src.game.tablero.coordenada import CoordenadaHexagonal
-from src.game.tablero.tablero_hexagonal import TableroHexagonal
+from src.game.tablero.tablero_bitboard import TableroBitboard
 from src.game.combate.mapa.zona_mapa import ZonaMapa
 from src.game.combate.mapa.generador_mapa import GeneradorMapa
 from src.utils.helpers import log_evento
 
 
 class MapaGlobal:
-    def __init__(self, radio: int = 4, celdas_por_zona: int = 19, cantidad_parejas: int = 3):
-        self.tablero = TableroHexagonal(radio=radio)
+    def __init__(self, radio: int = 4, celdas_por_zona: int = 19, cantidad_parejas: int = 3,
+                 clase_tablero=TableroBitboard):
+        # El mapa de combate usa bitboards para que radios grandes no encarezcan las consultas de rango
+        self.tablero = clase_tablero(radio=radio)
         self.celdas: Dict[CoordenadaHexagonal, Optional[object]] = self.tablero.celdas
         self.zonas_rojas: list[ZonaMapa] = []
         self.zonas_azules: list[ZonaMapa] = []
@@ -42,7 +44,7 @@ class MapaGlobal:
                 if coord:
                     carta.coordenada = coord
                     self.tablero.colocar_carta(coord, carta)
-                    log_evento(f"   📍 {carta.nombre} colocada en {coord}")
+                    log_evento(lambda: f"   📍 {carta.nombre} colocada en {coord}", "DEBUG")
                     cartas_colocadas += 1
                 else:
                     break
@@ -0,0 +1,209 @@
+"""
+Anfitrión de partidas: multiplexa muchos MotorTiempoReal en un único hilo
+Cada partida conserva su propio motor (componentes, eventos y estadísticas),
+pero ninguna necesita un hilo de sistema propio.
+"""
+
+import math
+import threading
+from typing import Callable, Dict, List, Optional, Any
+
+from src.game.combate.motor.motor_tiempo_real import MotorTiempoReal, EstadoMotor
+from src.game.combate.motor.reloj import RelojSistema
+from src.utils.helpers import log_evento
+
+
+class AnfitrionPartidas:
+    """Procesa los motores de muchas partidas en un solo loop a tick rate estable"""
+
+    def __init__(self, fps_objetivo: int = 20, reloj=None):
+        self.fps_objetivo = fps_objetivo
+        self.intervalo_tick = 1.0 / fps_objetivo
+        self.reloj = reloj or RelojSistema()
+
+        # Partidas hospedadas: id_partida → motor
+        self.motores: Dict[str, MotorTiempoReal] = {}
+        # id_partida → instante en que le toca el próximo tick (avanza de a intervalos enteros)
+        self._proximo_tick: Dict[str, float] = {}
+        self.contador_partidas = 0
+
+        # Threading
+        self.ejecutando = False
+        self.hilo: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+        # Estadísticas globales
+        self.stats = {
+            'ticks_procesados': 0,
+            'ticks_partidas': 0,
+            'partidas_agregadas': 0,
+            'partidas_finalizadas': 0,
+            'partidas_con_error': 0
+        }
+
+    def agregar_motor(self, motor: MotorTiempoReal, id_partida: str = None) -> Optional[str]:
+        """
+        Hospeda un motor ya configurado (componentes y eventos) en este anfitrión
+
+        Returns:
+            str: ID de la partida, o None si no pudo agregarse
+        """
+        if motor.reloj is not self.reloj and (motor.reloj.paso_fijo or self.reloj.paso_fijo):
+            log_evento("❌ El motor debe compartir el reloj virtual del anfitrión")
+            return None
+
+        with self.lock:
+            if id_partida is None:
+                self.contador_partidas += 1
+                id_partida = f"partida_{self.contador_partidas}"
+
+            if id_partida in self.motores:
+                log_evento(f"⚠️ Partida {id_partida} ya está hospedada")
+                return None
+
+            if not motor.iniciar_hospedado(self):
+                return None
+
+            self.motores[id_partida] = motor
+            self._proximo_tick[id_partida] = motor.ultimo_tick + motor.intervalo_tick
+            self.stats['partidas_agregadas'] += 1
+
+        log_evento(f"➕ Partida hospedada: {id_partida}")
+        return id_partida
+
+    def remover_motor(self, id_partida: str) -> bool:
+        """Deja de procesar una partida (detiene su motor si sigue activo)"""
+        with self.lock:
+            motor = self.motores.pop(id_partida, None)
+            self._proximo_tick.pop(id_partida, None)
+
+        if motor is None:
+            return False
+
+        motor.detener()
+        motor.anfitrion = None
+        self.stats['partidas_finalizadas'] += 1
+        return True
+
+    def iniciar(self) -> bool:
+        """Inicia el hilo único que procesa todas las partidas"""
+        if self.ejecutando:
+            log_evento("⚠️ Anfitrión ya está ejecutándose")
+            return False
+
+        self.ejecutando = True
+        self.hilo = threading.Thread(target=self._loop_principal, daemon=True)
+        self.hilo.start()
+
+        log_evento(f"🚀 Anfitrión de partidas iniciado ({self.fps_objetivo} FPS)")
+        return True
+
+    def detener(self):
+        """Detiene el loop y todas las partidas que siguen hospedadas"""
+        self.ejecutando = False
+
+        if self.hilo and self.hilo.is_alive() and self.hilo is not threading.current_thread():
+            self.hilo.join(timeout=2.0)
+
+        for id_partida in self.obtener_partidas():
+            self.remover_motor(id_partida)
+
+        log_evento(f"✅ Anfitrión detenido. Total ticks: {self.stats['ticks_procesados']}")
+
+    def ejecutar_hasta(self, condicion: Callable[[], bool], max_ticks: int = 1_000_000) -> int:
+        """Ejecuta el loop en el hilo actual hasta que se cumpla la condición"""
+        ticks = 0
+        while ticks < max_ticks and not condicion():
+            self._ejecutar_tick_controlado()
+            ticks += 1
+        return ticks
+
+    def _loop_principal(self):
+        """Loop del anfitrión (ejecutado en hilo separado)"""
+        try:
+            while self.ejecutando:
+                self._ejecutar_tick_controlado()
+        except Exception as e:
+            log_evento(f"❌ Error en loop del anfitrión: {e}")
+
+    def _ejecutar_tick_controlado(self):
+        """Procesa un tick y espera lo necesario para respetar el FPS objetivo"""
+        inicio_tick = self.reloj.ahora()
+
+        self.procesar_tick()
+
+        if self.reloj.paso_fijo:
+            self.reloj.avanzar(self.intervalo_tick)
+        else:
+            tiempo_procesamiento = self.reloj.ahora() - inicio_tick
+            self.reloj.dormir(self.intervalo_tick - tiempo_procesamiento)
+
+    def procesar_tick(self):
+        """Procesa un tick de cada partida cuyo intervalo propio ya venció"""
+        ahora = self.reloj.ahora()
+
+        with self.lock:
+            partidas = list(self.motores.items())
+
+        terminadas = []
+        for id_partida, motor in partidas:
+            if motor.estado != EstadoMotor.EJECUTANDO:
+                if motor.estado != EstadoMotor.PAUSADO:
+                    terminadas.append(id_partida)
+                continue
+
+            # Cada partida respeta su propio FPS (tolerancia para el reloj virtual). Se agenda
+            # contra el `ahora` del anfitrión y no contra el ultimo_tick que el motor toma al
+            # procesar, que llega siempre algo más tarde y haría perder un tick de cada dos
+            proximo = self._proximo_tick.get(id_partida, ahora)
+            if ahora < proximo - 1e-9:
+                continue
+            intervalo = motor.intervalo_tick
+            proximo += intervalo
+            if proximo <= ahora:
+                # Atrasada más de un intervalo: se saltean los ticks perdidos en lugar de encadenarlos
+                proximo += math.floor((ahora - proximo) / intervalo + 1) * intervalo
+            self._proximo_tick[id_partida] = proximo
+
+            try:
+                motor.procesar_tick_hospedado()
+                self.stats['ticks_partidas'] += 1
+            except Exception as e:
+                # Un error en una partida no afecta al resto
+                log_evento(f"❌ Error en partida {id_partida}: {e}")
+                motor.estado = EstadoMotor.ERROR
+                self.stats['partidas_con_error'] += 1
+                terminadas.append(id_partida)
+
+        for id_partida in terminadas:
+            with self.lock:
+                motor = self.motores.pop(id_partida, None)
+                self._proximo_tick.pop(id_partida, None)
+            if motor is not None:
+                motor.anfitrion = None
+                self.stats['partidas_finalizadas'] += 1
+
+        self.stats['ticks_procesados'] += 1
+
+    def obtener_partidas(self) -> List[str]:
+        """Obtiene la lista de IDs de partidas hospedadas"""
+        with self.lock:
+            return list(self.motores.keys())
+
+    def obtener_estadisticas(self) -> Dict[str, Any]:
+        """Estadísticas globales del anfitrión y de cada partida hospedada"""
+        with self.lock:
+            partidas = list(self.motores.items())
+
+        return {
+            'fps_objetivo': self.fps_objetivo,
+            'partidas_activas': len(partidas),
+            'stats_detalladas': self.stats.copy(),
+            'partidas': {id_partida: motor.obtener_estadisticas() for id_partida, motor in partidas}
+        }
+
+    def __str__(self):
+        return f"AnfitrionPartidas(partidas={len(self.motores)}, fps={self.fps_objetivo})"
+
+    def __repr__(self):
+        return f"AnfitrionPartidas(fps_objetivo={self.fps_objetivo}, ticks={self.stats['ticks_procesados']})"
@@ -3,12 +3,14 @@ Motor de tiempo real para procesamiento continuo de componentes
 Maneja tick rate, callbacks programados y componentes activos
 """
 
+import heapq
 import time
 import threading
 from typing import Dict, List, Optional, Callable, Any, Protocol
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from src.game.combate.motor.reloj import RelojSistema
 from src.utils.helpers import log_evento
 
 
@@ -55,11 +57,35 @@ class ComponenteTiempoReal(Protocol):
 class MotorTiempoReal:
     """Motor principal para procesamiento continuo en tiempo real"""
 
-    def __init__(self, fps_objetivo: int = 10):
+    def __init__(self, fps_objetivo: int = None, reloj=None, configurador=None, leer_fps=None):
+        """
+        Args:
+            fps_objetivo: FPS fijo; si es None se toma del configurador (o 10 sin configurador)
+            configurador: ConfiguradorTiempoReal opcional. Con él se aplican los límites de
+                componentes y eventos, el presupuesto de tiempo por componente y el máximo de
+                errores, y los cambios del archivo se recogen en caliente.
+            leer_fps: función configurador → FPS (por defecto configurador.motor.fps_objetivo)
+        """
+        self.configurador = configurador
+        self.leer_fps = leer_fps or (lambda config: config.motor.fps_objetivo)
+        self._fps_fijo = fps_objetivo is not None
+        self._version_config = None
+        self._proxima_revision_config = 0.0
+
         # Configuración básica
+        if configurador is not None:
+            configurador.recargar_si_cambio()
+        if fps_objetivo is None:
+            fps_objetivo = self.leer_fps(configurador) if configurador is not None else 10
         self.fps_objetivo = fps_objetivo
         self.intervalo_tick = 1.0 / fps_objetivo
 
+        # Reloj inyectable: RelojSistema (pared) o RelojVirtual (paso fijo, sin esperas)
+        self.reloj = reloj or RelojSistema()
+
+        # AnfitrionPartidas que procesa este motor en su propio loop (sin hilo propio)
+        self.anfitrion = None
+
         # Estado del motor
         self.estado = EstadoMotor.DETENIDO
         self.ejecutando = False
@@ -75,6 +101,15 @@ class MotorTiempoReal:
         self.componentes_activos: Dict[str, ComponenteTiempoReal] = {}
         self.eventos_programados: Dict[str, EventoProgramado] = {}
         self.contador_eventos = 0
+        # Min-heap de (tiempo_ejecucion, secuencia, evento). Las cancelaciones son
+        # perezosas: la entrada queda en el heap y se descarta al extraerla.
+        self.cola_eventos: List[tuple] = []
+        self._secuencia_eventos = 0
+
+        # Presupuestos por componente: los que se exceden esperan al siguiente tick
+        # acumulando su delta; los errores se toleran hasta max_errores_por_componente
+        self._errores_componente: Dict[str, int] = {}
+        self._delta_diferido: Dict[str, float] = {}
 
         # Threading
         self.hilo_motor: Optional[threading.Thread] = None
@@ -86,9 +121,17 @@ class MotorTiempoReal:
             'componentes_procesados': 0,
             'eventos_ejecutados': 0,
             'tiempo_total_ejecucion': 0.0,
-            'promedio_fps': 0.0
+            'promedio_fps': 0.0,
+            'componentes_rechazados': 0,
+            'eventos_rechazados': 0,
+            'excesos_presupuesto': 0,
+            'errores_componentes': 0,
+            'recargas_config': 0
         }
 
+        if configurador is not None:
+            self._aplicar_configuracion()
+
     def iniciar(self) -> bool:
         """Inicia el motor de tiempo real"""
         if self.estado == EstadoMotor.EJECUTANDO:
@@ -99,8 +142,7 @@ class MotorTiempoReal:
             self.estado = EstadoMotor.EJECUTANDO
             self.ejecutando = True
             self.pausado = False
-            self.tiempo_inicio = time.time()
-            self.ultimo_tick = self.tiempo_inicio
+            self._reiniciar_tiempos()
 
             # Iniciar hilo de procesamiento
             self.hilo_motor = threading.Thread(target=self._loop_principal, daemon=True)
@@ -114,6 +156,19 @@ class MotorTiempoReal:
             log_evento(f"❌ Error iniciando motor: {e}")
             return False
 
+    def iniciar_hospedado(self, anfitrion) -> bool:
+        """Marca el motor como ejecutándose dentro del loop de un AnfitrionPartidas"""
+        if self.estado == EstadoMotor.EJECUTANDO:
+            log_evento("⚠️ Motor ya está ejecutándose")
+            return False
+
+        self.anfitrion = anfitrion
+        self.estado = EstadoMotor.EJECUTANDO
+        self.ejecutando = True
+        self.pausado = False
+        self._reiniciar_tiempos()
+        return True
+
     def detener(self):
         """Detiene el motor de tiempo real"""
         if self.estado != EstadoMotor.EJECUTANDO:
@@ -124,9 +179,11 @@ class MotorTiempoReal:
         self.ejecutando = False
         self.estado = EstadoMotor.DETENIDO
 
-        # Esperar que termine el hilo
-        if self.hilo_motor and self.hilo_motor.is_alive():
-            self.hilo_motor.join(timeout=2.0)
+        # Esperar que termine el hilo (salvo que se detenga desde el propio hilo)
+        if (self.hilo_motor and self.hilo_motor.is_alive()
+                and self.hilo_motor is not threading.current_thread()):
+            timeout = self.configurador.motor.timeout_hilo_segundos if self.configurador else 2.0
+            self.hilo_motor.join(timeout=timeout)
 
         self._actualizar_estadisticas_finales()
         log_evento(f"✅ Motor detenido. Total ticks: {self.stats['ticks_procesados']}")
@@ -143,7 +200,7 @@ class MotorTiempoReal:
         if self.estado == EstadoMotor.PAUSADO:
             self.pausado = False
             self.estado = EstadoMotor.EJECUTANDO
-            self.ultimo_tick = time.time()  # Resetear tiempo para evitar salto grande
+            self.ultimo_tick = self.reloj.ahora()  # Resetear tiempo para evitar salto grande
             log_evento("▶️ Motor reanudado")
 
     def agregar_componente(self, componente: ComponenteTiempoReal) -> bool:
@@ -156,6 +213,12 @@ class MotorTiempoReal:
                     log_evento(f"⚠️ Componente {id_componente} ya existe")
                     return False
 
+                limite = self._limite('max_componentes')
+                if limite is not None and len(self.componentes_activos) >= limite:
+                    self.stats['componentes_rechazados'] += 1
+                    log_evento(f"⚠️ Componente {id_componente} rechazado: límite de {limite} componentes", "WARNING")
+                    return False
+
                 self.componentes_activos[id_componente] = componente
 
             log_evento(f"➕ Componente agregado: {id_componente}")
@@ -170,6 +233,8 @@ class MotorTiempoReal:
         with self.lock:
             if id_componente in self.componentes_activos:
                 del self.componentes_activos[id_componente]
+                self._errores_componente.pop(id_componente, None)
+                self._delta_diferido.pop(id_componente, None)
                 log_evento(f"➖ Componente removido: {id_componente}")
                 return True
 
@@ -190,12 +255,19 @@ class MotorTiempoReal:
             intervalo: Intervalo entre repeticiones (solo si recurrente=True)
 
         Returns:
-            str: ID del evento programado
+            str: ID del evento programado, o None si se alcanzó max_eventos_programados
         """
+        limite = self._limite('max_eventos_programados')
+        if limite is not None and len(self.eventos_programados) >= limite:
+            # Contrapresión: quien programa decide si reintenta o descarta
+            self.stats['eventos_rechazados'] += 1
+            log_evento(f"⚠️ Evento rechazado: límite de {limite} eventos programados", "WARNING")
+            return None
+
         self.contador_eventos += 1
         id_evento = f"evento_{self.contador_eventos}"
 
-        tiempo_ejecucion = time.time() + delay_segundos
+        tiempo_ejecucion = self.reloj.ahora() + delay_segundos
 
         evento = EventoProgramado(
             id_evento=id_evento,
@@ -208,16 +280,19 @@ class MotorTiempoReal:
 
         with self.lock:
             self.eventos_programados[id_evento] = evento
+            self._encolar_evento(evento)
 
-        log_evento(f"⏰ Evento programado: {id_evento} (en {delay_segundos}s)")
+        log_evento(lambda: f"⏰ Evento programado: {id_evento} (en {delay_segundos}s)", "DEBUG")
         return id_evento
 
     def cancelar_evento(self, id_evento: str) -> bool:
         """Cancela un evento programado"""
         with self.lock:
-            if id_evento in self.eventos_programados:
-                self.eventos_programados[id_evento].activo = False
-                log_evento(f"🚫 Evento cancelado: {id_evento}")
+            evento = self.eventos_programados.pop(id_evento, None)
+            if evento is not None:
+                evento.activo = False
+                self._compactar_cola_eventos()
+                log_evento(lambda: f"🚫 Evento cancelado: {id_evento}", "DEBUG")
                 return True
 
         return False
@@ -228,34 +303,113 @@ class MotorTiempoReal:
 
         try:
             while self.ejecutando:
-                inicio_tick = time.time()
-
                 if not self.pausado:
-                    self._procesar_tick()
+                    self._ejecutar_tick_controlado()
                 else:
                     # Si está pausado, esperar un poco y continuar
                     time.sleep(0.1)
-                    continue
 
-                # Control de frame rate
-                tiempo_procesamiento = time.time() - inicio_tick
-                tiempo_espera = max(0, self.intervalo_tick - tiempo_procesamiento)
+        except Exception as e:
+            log_evento(f"❌ Error en loop principal: {e}")
+            self.estado = EstadoMotor.ERROR
+
+        log_evento("🏁 Loop principal terminado")
+
+    def ejecutar_hasta(self, condicion: Callable[[], bool], max_ticks: int = 1_000_000) -> int:
+        """
+        Ejecuta el motor en el hilo actual hasta que se cumpla la condición
+
+        Con un RelojVirtual no hay esperas: cada tick avanza el reloj un
+        delta_time fijo, por lo que una fase completa se resuelve en el
+        tiempo de CPU que cueste procesarla.
 
-                if tiempo_espera > 0:
-                    time.sleep(tiempo_espera)
+        Args:
+            condicion: Función que retorna True cuando debe detenerse
+            max_ticks: Límite de seguridad de ticks a ejecutar
 
-                # Actualizar estadísticas de FPS
-                self._actualizar_fps()
+        Returns:
+            int: Cantidad de ticks ejecutados
+        """
+        if self.estado == EstadoMotor.EJECUTANDO:
+            log_evento("⚠️ Motor ya está ejecutándose")
+            return 0
 
+        self.estado = EstadoMotor.EJECUTANDO
+        self.ejecutando = True
+        self.pausado = False
+        self._reiniciar_tiempos()
+
+        ticks = 0
+        try:
+            while self.ejecutando and ticks < max_ticks and not condicion():
+                self._ejecutar_tick_controlado()
+                ticks += 1
         except Exception as e:
-            log_evento(f"❌ Error en loop principal: {e}")
+            log_evento(f"❌ Error en ejecución sincrónica: {e}")
             self.estado = EstadoMotor.ERROR
 
-        log_evento("🏁 Loop principal terminado")
+        if ticks >= max_ticks and not condicion():
+            log_evento(f"⚠️ Límite de {max_ticks} ticks alcanzado sin cumplir la condición")
+
+        self.ejecutando = False
+        if self.estado == EstadoMotor.EJECUTANDO:
+            self.estado = EstadoMotor.DETENIDO
+        self._actualizar_estadisticas_finales()
+        return ticks
+
+    def _reiniciar_tiempos(self):
+        """Toma el instante actual del reloj como inicio de la ejecución"""
+        self.tiempo_inicio = self.reloj.ahora()
+        self.ultimo_tick = self.tiempo_inicio
+
+    def _ejecutar_tick_controlado(self):
+        """Procesa un tick y espera lo necesario para respetar el FPS objetivo"""
+        inicio_tick = self.reloj.ahora()
+
+        self._procesar_tick()
+
+        # Control de frame rate (con reloj virtual no se espera)
+        if not self.reloj.paso_fijo:
+            tiempo_procesamiento = self.reloj.ahora() - inicio_tick
+            self.reloj.dormir(self.intervalo_tick - tiempo_procesamiento)
+
+        # Actualizar estadísticas de FPS
+        self._actualizar_fps()
+
+    def _limite(self, campo: str) -> Optional[int]:
+        """Límite del configurador (None sin configurador)"""
+        if self.configurador is None:
+            return None
+        return getattr(self.configurador.motor, campo)
+
+    def _vigilar_configuracion(self):
+        """Revisa cada intervalo_recarga_segundos si el archivo de configuración cambió"""
+        ahora = time.monotonic()
+        if ahora < self._proxima_revision_config:
+            return
+        self._proxima_revision_config = ahora + self.configurador.motor.intervalo_recarga_segundos
+        self.configurador.recargar_si_cambio()
+        if self.configurador.version != self._version_config:
+            self._aplicar_configuracion()
+            self.stats['recargas_config'] += 1
+
+    def _aplicar_configuracion(self):
+        """Aplica los valores actuales del configurador (el FPS solo si no se fijó al crear el motor)"""
+        self._version_config = self.configurador.version
+        if not self._fps_fijo:
+            fps = self.leer_fps(self.configurador)
+            if fps != self.fps_objetivo:
+                self.configurar_fps(fps)
 
     def _procesar_tick(self):
         """Procesa un tick completo del sistema"""
-        tiempo_actual = time.time()
+        if self.configurador is not None:
+            self._vigilar_configuracion()
+
+        # Un motor hospedado comparte el reloj del anfitrión, que es quien lo avanza
+        if self.reloj.paso_fijo and self.anfitrion is None:
+            self.reloj.avanzar(self.intervalo_tick)
+        tiempo_actual = self.reloj.ahora()
         delta_time = tiempo_actual - self.ultimo_tick
         self.ultimo_tick = tiempo_actual
 
@@ -276,19 +430,49 @@ class MotorTiempoReal:
         with self.lock:
             componentes = list(self.componentes_activos.items())
 
+        configurador = self.configurador
+        # El presupuesto se mide en tiempo de pared: con reloj virtual diferir dependería de la CPU
+        if configurador is None or self.reloj.paso_fijo:
+            presupuesto = None
+        else:
+            presupuesto = configurador.componentes.timeout_procesamiento_segundos
+        diferido = self._delta_diferido
+
         for id_componente, componente in componentes:
+            if id_componente in diferido:
+                # Se pasó de presupuesto en el tick anterior: recibe este delta en el siguiente
+                if diferido[id_componente] is None:
+                    diferido[id_componente] = delta_time
+                    continue
+                delta_componente = delta_time + diferido.pop(id_componente)
+            else:
+                delta_componente = delta_time
+
             try:
                 # Procesar componente
-                sigue_activo = componente.procesar_tick(delta_time)
+                inicio = time.perf_counter()
+                sigue_activo = componente.procesar_tick(delta_componente)
+                duracion = time.perf_counter() - inicio
+                # El límite cuenta errores consecutivos: un tick correcto lo reinicia
+                self._errores_componente.pop(id_componente, None)
 
                 if not sigue_activo:
                     componentes_a_remover.append(id_componente)
+                elif presupuesto is not None and duracion > presupuesto:
+                    self.stats['excesos_presupuesto'] += 1
+                    diferido[id_componente] = None
+                    log_evento(lambda: f"🐢 {id_componente} excede su presupuesto "
+                                       f"({duracion * 1000:.1f} ms > {presupuesto * 1000:.1f} ms)", "DEBUG")
 
                 self.stats['componentes_procesados'] += 1
 
             except Exception as e:
                 log_evento(f"❌ Error procesando componente {id_componente}: {e}")
-                componentes_a_remover.append(id_componente)
+                self.stats['errores_componentes'] += 1
+                errores = self._errores_componente.get(id_componente, 0) + 1
+                self._errores_componente[id_componente] = errores
+                if configurador is None or errores >= configurador.motor.max_errores_por_componente:
+                    componentes_a_remover.append(id_componente)
 
         # Remover componentes inactivos
         for id_componente in componentes_a_remover:
@@ -296,50 +480,65 @@ class MotorTiempoReal:
 
     def _procesar_eventos(self):
         """Procesa eventos programados que deben ejecutarse"""
-        tiempo_actual = time.time()
-        eventos_a_remover = []
-        eventos_a_reprogramar = []
+        tiempo_actual = self.reloj.ahora()
+        eventos_vencidos = []
 
+        # Extraer solo los eventos vencidos; el resto del heap no se toca
         with self.lock:
-            eventos = list(self.eventos_programados.items())
+            while self.cola_eventos and self.cola_eventos[0][0] <= tiempo_actual:
+                _, _, evento = heapq.heappop(self.cola_eventos)
+                if evento.activo:
+                    eventos_vencidos.append(evento)
 
-        for id_evento, evento in eventos:
+        for evento in eventos_vencidos:
+            # Pudo ser cancelado por un callback anterior de este mismo tick
             if not evento.activo:
-                eventos_a_remover.append(id_evento)
                 continue
 
-            if tiempo_actual >= evento.tiempo_ejecucion:
-                try:
-                    # Ejecutar callback
-                    evento.callback(**evento.parametros)
-                    self.stats['eventos_ejecutados'] += 1
-
-                    if evento.recurrente and evento.intervalo > 0:
-                        # Reprogramar evento recurrente
-                        evento.tiempo_ejecucion = tiempo_actual + evento.intervalo
-                        eventos_a_reprogramar.append(evento)
-                    else:
-                        eventos_a_remover.append(id_evento)
-
-                except Exception as e:
-                    log_evento(f"❌ Error ejecutando evento {id_evento}: {e}")
-                    eventos_a_remover.append(id_evento)
+            try:
+                evento.callback(**evento.parametros)
+                self.stats['eventos_ejecutados'] += 1
+            except Exception as e:
+                log_evento(f"❌ Error ejecutando evento {evento.id_evento}: {e}")
+                self._descartar_evento(evento)
+                continue
 
-        # Limpiar eventos completados
+            if evento.recurrente and evento.intervalo > 0 and evento.activo:
+                # Reprogramar evento recurrente
+                evento.tiempo_ejecucion = tiempo_actual + evento.intervalo
+                with self.lock:
+                    self._encolar_evento(evento)
+            else:
+                self._descartar_evento(evento)
+
+    def _encolar_evento(self, evento: EventoProgramado):
+        """Inserta un evento en el heap (llamar con el lock tomado)"""
+        # La secuencia desempata eventos con el mismo tiempo y respeta el orden de alta
+        self._secuencia_eventos += 1
+        heapq.heappush(self.cola_eventos, (evento.tiempo_ejecucion, self._secuencia_eventos, evento))
+
+    def _compactar_cola_eventos(self):
+        """Reconstruye el heap si acumula demasiados eventos cancelados (llamar con el lock tomado)"""
+        if len(self.cola_eventos) > 2 * len(self.eventos_programados) + 64:
+            self.cola_eventos = [entrada for entrada in self.cola_eventos if entrada[2].activo]
+            heapq.heapify(self.cola_eventos)
+
+    def _descartar_evento(self, evento: EventoProgramado):
+        """Quita un evento ya ejecutado del registro de eventos programados"""
+        evento.activo = False
         with self.lock:
-            for id_evento in eventos_a_remover:
-                self.eventos_programados.pop(id_evento, None)
+            self.eventos_programados.pop(evento.id_evento, None)
 
     def _actualizar_fps(self):
         """Actualiza las estadísticas de FPS"""
         if self.total_ticks % 10 == 0:  # Actualizar cada 10 ticks
-            tiempo_transcurrido = time.time() - self.tiempo_inicio
+            tiempo_transcurrido = self.reloj.ahora() - self.tiempo_inicio
             if tiempo_transcurrido > 0:
                 self.fps_actual = self.total_ticks / tiempo_transcurrido
 
     def _actualizar_estadisticas_finales(self):
         """Actualiza estadísticas finales al detener el motor"""
-        tiempo_total = time.time() - self.tiempo_inicio
+        tiempo_total = self.reloj.ahora() - self.tiempo_inicio
         self.stats['tiempo_total_ejecucion'] = tiempo_total
 
         if tiempo_total > 0:
@@ -347,7 +546,7 @@ class MotorTiempoReal:
 
     def obtener_estadisticas(self) -> Dict[str, Any]:
         """Obtiene estadísticas actuales del motor"""
-        tiempo_ejecucion = time.time() - self.tiempo_inicio if self.tiempo_inicio > 0 else 0
+        tiempo_ejecucion = self.reloj.ahora() - self.tiempo_inicio if self.total_ticks > 0 else 0
 
         return {
             'estado': self.estado.value,
@@ -378,12 +577,17 @@ class MotorTiempoReal:
     def obtener_eventos_programados(self) -> List[str]:
         """Obtiene lista de IDs de eventos programados"""
         with self.lock:
-            return [id_evento for id_evento, evento in self.eventos_programados.items()
-                    if evento.activo]
+            return list(self.eventos_programados.keys())
 
     def tick(self):
         """Ejecuta un ciclo de actualización manual (solo para testing)."""
         self._procesar_tick()
+
+    def procesar_tick_hospedado(self):
+        """Ejecuta un tick invocado desde el loop de un AnfitrionPartidas"""
+        self._procesar_tick()
+        self._actualizar_fps()
+
     def __str__(self):
         return f"MotorTiempoReal(estado={self.estado.value}, fps={self.fps_actual:.1f}, componentes={len(self.componentes_activos)})"
 
@@ -0,0 +1,46 @@
+"""
+Relojes inyectables para el motor de tiempo real
+Permiten ejecutar el motor contra el reloj de pared o contra un tiempo virtual
+"""
+
+import time
+
+
+class RelojSistema:
+    """Reloj de pared: usa time.time() y duerme de verdad"""
+
+    paso_fijo = False
+
+    def ahora(self) -> float:
+        return time.time()
+
+    def dormir(self, segundos: float):
+        if segundos > 0:
+            time.sleep(segundos)
+
+
+class RelojVirtual:
+    """
+    Reloj simulado que solo avanza cuando el motor procesa un tick.
+    Con este reloj el motor trabaja en paso fijo (delta_time constante)
+    y sin esperas, tan rápido como lo permita la CPU.
+    """
+
+    paso_fijo = True
+
+    def __init__(self, tiempo_inicial: float = 0.0):
+        self.tiempo = tiempo_inicial
+
+    def ahora(self) -> float:
+        return self.tiempo
+
+    def avanzar(self, segundos: float):
+        # Redondear evita que la suma de deltas flotantes retrase eventos un tick
+        self.tiempo = round(self.tiempo + segundos, 9)
+
+    def dormir(self, segundos: float):
+        # El tiempo virtual solo avanza por ticks, nunca se espera
+        pass
+
+    def __repr__(self):
+        return f"RelojVirtual(tiempo={self.tiempo:.3f})"
@@ -2,14 +2,14 @@ from src.game.tienda.tienda_individual import TiendaIndividual
 from src.game.tienda.sistema_subastas import SistemaSubastas
 from src.utils.helpers import log_evento
 from src.game.cartas.manager_cartas import manager_cartas
-from src.data.config.game_config import GameConfig
+from src.data.config.game_config import obtener_config
 
 
 class ControladorFasePreparacion:
     def __init__(self, jugadores: list, motor=None, config=None):
         self.jugadores = jugadores
         self.motor = motor
-        self.config = config or GameConfig()
+        self.config = config or obtener_config()
         self.tiendas_individuales = {}
         self.subastas = None
         self.finalizada = False
@@ -25,11 +25,15 @@ class ControladorFasePreparacion:
             jugador.oro += self.config.oro_por_ronda
             log_evento(f"💰 {jugador.nombre} recibe {self.config.oro_por_ronda} de oro (Total: {jugador.oro})")
 
-        # 2. Crear tiendas individuales
-        for jugador in self.jugadores:
-            tienda = TiendaIndividual(jugador, cantidad_cartas=5)  # Forzar 5 cartas
+        # 2. Crear tiendas individuales (las de una ronda anterior devuelven sus cartas primero)
+        self.cerrar_tiendas()
+        lotes = manager_cartas.obtener_cartas_para_tiendas(
+            [jugador.nivel for jugador in self.jugadores], cantidad=5  # Forzar 5 cartas
+        )
+        for jugador, cartas in zip(self.jugadores, lotes):
+            tienda = TiendaIndividual(jugador, cantidad_cartas=5, cartas=cartas)
             self.tiendas_individuales[jugador.id] = tienda
-            log_evento(f"🛒 Tienda creada para {jugador.nombre}")
+            log_evento(f"🛒 Tienda creada para {jugador.nombre} ({len(cartas)} cartas)")
 
         # 3. Crear subasta pública - CORREGIDO
         cartas_subasta = max(2, len(self.jugadores))  # Mínimo 2 cartas, o 1 por jugador
@@ -132,9 +136,8 @@ class ControladorFasePreparacion:
         log_evento("🏪 Cerrando tiendas individuales...")
 
         for jugador_id, tienda in self.tiendas_individuales.items():
-            # Las cartas no compradas se devuelven automáticamente al pool
-            # cuando la tienda se destruye (esto debería estar en el destructor de TiendaIndividual)
-            cartas_no_compradas = len(tienda.cartas_disponibles)
+            # Las cartas no compradas vuelven al pool compartido
+            cartas_no_compradas = tienda.devolver_cartas()
             if cartas_no_compradas > 0:
                 log_evento(f"   🔄 {cartas_no_compradas} cartas no compradas devueltas al pool")
 
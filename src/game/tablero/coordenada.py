@@ -1,11 +1,39 @@
-from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Tuple
 
 
-@dataclass(frozen=True)
 class CoordenadaHexagonal:
-    q: int
-    r: int
+    """
+    Coordenada axial (q, r) inmutable e internada: coordenadas iguales son el
+    mismo objeto, así que las búsquedas en dicts y sets se resuelven por identidad.
+    """
+
+    __slots__ = ("q", "r", "_s", "_hash")
+
+    # Tabla de internado (q, r) → coordenada; crece con las celdas distintas usadas
+    _internadas: Dict[Tuple[int, int], "CoordenadaHexagonal"] = {}
+
+    def __new__(cls, q: int, r: int):
+        clave = (q, r)
+        coord = cls._internadas.get(clave)
+        if coord is not None:
+            return coord
+
+        coord = object.__new__(cls)
+        object.__setattr__(coord, "q", q)
+        object.__setattr__(coord, "r", r)
+        object.__setattr__(coord, "_s", -q - r)
+        object.__setattr__(coord, "_hash", hash(clave))
+        return cls._internadas.setdefault(clave, coord)
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError(f"CoordenadaHexagonal es inmutable: no se puede asignar '{nombre}'")
+
+    def __delattr__(self, nombre):
+        raise AttributeError(f"CoordenadaHexagonal es inmutable: no se puede borrar '{nombre}'")
+
+    def __reduce__(self):
+        # Pickle/copy vuelven a pasar por __new__ y reutilizan la instancia internada
+        return (CoordenadaHexagonal, (self.q, self.r))
 
     def __add__(self, otro: "CoordenadaHexagonal") -> "CoordenadaHexagonal":
         return CoordenadaHexagonal(self.q + otro.q, self.r + otro.r)
@@ -14,18 +42,18 @@ class CoordenadaHexagonal:
         return CoordenadaHexagonal(self.q - otro.q, self.r - otro.r)
 
     def s(self) -> int:
-        return -self.q - self.r
+        return self._s
 
     def distancia(self, otra: "CoordenadaHexagonal") -> int:
         """Devuelve la distancia hexagonal entre dos coordenadas."""
-        return int((abs(self.q - otra.q) + abs(self.r - otra.r) + abs(self.s() - otra.s())) / 2)
+        return (abs(self.q - otra.q) + abs(self.r - otra.r) + abs(self._s - otra._s)) // 2
 
     def distancia_a(self, otra: "CoordenadaHexagonal") -> int:
         """Otra forma de calcular la distancia, usando max de diferencias."""
         return max(
             abs(self.q - otra.q),
             abs(self.r - otra.r),
-            abs(self.s() - otra.s())
+            abs(self._s - otra._s)
         )
 
     def obtener_area(self, radio: int) -> List["CoordenadaHexagonal"]:
@@ -46,8 +74,15 @@ class CoordenadaHexagonal:
             for dq, dr in direcciones
         ]
 
+    def __eq__(self, otra):
+        if self is otra:
+            return True
+        if not isinstance(otra, CoordenadaHexagonal):
+            return NotImplemented
+        return self.q == otra.q and self.r == otra.r
+
     def __hash__(self):
-        return hash((self.q, self.r))
+        return self._hash
 
     def __repr__(self):
         return f"({self.q}, {self.r})"
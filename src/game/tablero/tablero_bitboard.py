@@ -0,0 +1,173 @@
+"""
+Tablero hexagonal respaldado por bitboards.
+Cada celda recibe un índice denso y la ocupación (total y por equipo) se guarda
+en máscaras de bits enteras, de modo que rango, densidad y "enemigos en rango"
+se resuelven con operaciones AND/OR sobre el tablero completo.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.game.tablero.coordenada import CoordenadaHexagonal
+from src.game.tablero.tablero_hexagonal import TableroHexagonal
+
+
+def _iterar_bits(mascara: int) -> Iterator[int]:
+    """Índices de los bits encendidos de la máscara, de menor a mayor"""
+    while mascara:
+        bit_bajo = mascara & -mascara
+        yield bit_bajo.bit_length() - 1
+        mascara ^= bit_bajo
+
+
+class TableroBitboard(TableroHexagonal):
+    """
+    Mismo API público que TableroHexagonal con ocupación en máscaras de bits.
+    Las máscaras de rango se calculan por celda la primera vez que se consultan,
+    así que el costo de memoria crece solo con las celdas que realmente se usan.
+    El equipo de una carta (su duenio) se toma al colocarla.
+    """
+
+    def __init__(self, radio: int = 2):
+        self._coordenadas: List[CoordenadaHexagonal] = []  # índice → coordenada
+        self._indices: Dict[CoordenadaHexagonal, int] = {}  # coordenada → índice
+        self._mascaras_rango: Dict[int, List[int]] = {}  # índice → máscara por rango
+        self._ocupacion = 0
+        self._equipos: Dict[object, int] = {}  # duenio → máscara de sus cartas
+        super().__init__(radio)
+
+    # === TABLAS ===
+
+    def _tabular_vecindades(self):
+        """Asigna índices densos y recalcula las máscaras a partir de las celdas ocupadas"""
+        super()._tabular_vecindades()
+        self._coordenadas = list(self.celdas)
+        self._indices = self._orden_celda
+        self._mascaras_rango = {}
+
+        self._ocupacion = 0
+        self._equipos = {}
+        for coord in self._ocupadas:
+            self._marcar(self._indices[coord], self.celdas[coord])
+
+    def mascara_rango(self, origen: CoordenadaHexagonal, rango: int) -> Optional[int]:
+        """Máscara de las celdas a distancia <= rango del origen, o None si el origen no es una celda"""
+        self._asegurar_tablas()
+
+        indice = self._indices.get(origen)
+        if indice is None:
+            return None
+        if rango < 0:
+            return 0
+
+        mascaras = self._mascaras_rango.get(indice)
+        if mascaras is None:
+            mascaras = []
+            for j, coord in enumerate(self._coordenadas):
+                distancia = origen.distancia(coord)
+                while len(mascaras) <= distancia:
+                    mascaras.append(0)
+                mascaras[distancia] |= 1 << j
+
+            # Acumular: la máscara del rango r incluye todas las distancias menores
+            for r in range(1, len(mascaras)):
+                mascaras[r] |= mascaras[r - 1]
+            self._mascaras_rango[indice] = mascaras
+
+        return mascaras[rango] if rango < len(mascaras) else mascaras[-1]
+
+    # === MANTENIMIENTO DE MÁSCARAS ===
+
+    def _marcar(self, indice: int, carta):
+        bit = 1 << indice
+        self._ocupacion |= bit
+        equipo = getattr(carta, 'duenio', None)
+        self._equipos[equipo] = self._equipos.get(equipo, 0) | bit
+
+    def _desmarcar(self, indice: int):
+        limpiar = ~(1 << indice)
+        self._ocupacion &= limpiar
+        for equipo in self._equipos:
+            self._equipos[equipo] &= limpiar
+
+    def _asignar(self, coordenada: CoordenadaHexagonal, carta):
+        self._asegurar_tablas()
+        indice = self._indices[coordenada]
+
+        if self.celdas[coordenada] is not None:
+            self._desmarcar(indice)
+
+        super()._asignar(coordenada, carta)
+
+        if carta is not None:
+            self._marcar(indice, carta)
+
+    def limpiar_tablero(self):
+        super().limpiar_tablero()
+        self._ocupacion = 0
+        self._equipos = {}
+
+    # === CONSULTAS ===
+
+    def _ocupadas_en_orden(self) -> List[CoordenadaHexagonal]:
+        self._asegurar_tablas()
+        return [self._coordenadas[i] for i in _iterar_bits(self._ocupacion)]
+
+    def obtener_cartas_de_mascara(self, mascara: int) -> List[Tuple[CoordenadaHexagonal, object]]:
+        """Tuplas (coordenada, carta) de las celdas marcadas en la máscara"""
+        coordenadas = self._coordenadas
+        celdas = self.celdas
+        return [(coordenadas[i], celdas[coordenadas[i]]) for i in _iterar_bits(mascara)]
+
+    def obtener_cartas_en_rango(self, origen, rango: int):
+        """
+        Retorna una lista de tuplas (coordenada, carta) dentro del rango especificado.
+        """
+        mascara = self.mascara_rango(origen, rango)
+        if mascara is None:
+            return super().obtener_cartas_en_rango(origen, rango)
+        return self.obtener_cartas_de_mascara(mascara & self._ocupacion)
+
+    def mascara_enemigos(self, carta) -> int:
+        """Máscara de las cartas del tablero que no son aliadas de la carta"""
+        self._asegurar_tablas()
+
+        equipo = getattr(carta, 'duenio', None)
+        if equipo is None:
+            # Sin dueño no hay aliados: todo salvo la propia carta
+            coord = self._posiciones.get(id(carta))
+            propia = 1 << self._indices[coord] if coord is not None else 0
+            return self._ocupacion & ~propia
+        return self._ocupacion & ~self._equipos.get(equipo, 0)
+
+    def enemigos_en_rango_de_todas(self, rango: Optional[int] = None) -> Dict[CoordenadaHexagonal, List[Tuple[CoordenadaHexagonal, object]]]:
+        """
+        Enemigos en rango de cada carta del tablero (un AND de máscaras por carta)
+
+        Args:
+            rango: Rango común; si es None se usa el rango de ataque de cada carta
+        """
+        self._asegurar_tablas()
+
+        resultado = {}
+        for coord in self._ocupadas_en_orden():
+            carta = self.celdas[coord]
+            alcance = rango if rango is not None else getattr(carta, 'rango_ataque_actual', 1)
+            mascara = self.mascara_rango(coord, alcance) & self.mascara_enemigos(carta)
+            resultado[coord] = self.obtener_cartas_de_mascara(mascara)
+        return resultado
+
+    def obtener_densidad_area(self, centro: CoordenadaHexagonal, radio: int) -> float:
+        """Calcula la densidad de cartas en un área específica"""
+        mascara = self.mascara_rango(centro, radio)
+        if mascara is None:
+            return super().obtener_densidad_area(centro, radio)
+
+        total = mascara.bit_count()
+        if not total:
+            return 0.0
+        return (mascara & self._ocupacion).bit_count() / total
+
+    def coordenadas_libres(self) -> List[CoordenadaHexagonal]:
+        self._asegurar_tablas()
+        libres = ((1 << len(self._coordenadas)) - 1) & ~self._ocupacion
+        return [self._coordenadas[i] for i in _iterar_bits(libres)]
@@ -1,13 +1,77 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set, Tuple
 from src.game.tablero.coordenada import CoordenadaHexagonal
 from src.utils.helpers import log_evento
 
 
+class _Celdas(dict):
+    """
+    Dict coordenada → carta que cuenta los cambios de su conjunto de claves.
+    Agregar o quitar celdas (también escribiendo el dict directamente) sube
+    `version`, y las tablas precalculadas del tablero se rehacen al notarlo.
+    """
+    __slots__ = ('version',)
+
+    def __init__(self):
+        super().__init__()
+        self.version = 0
+
+    def __setitem__(self, coord, carta):
+        if coord not in self:
+            self.version += 1
+        super().__setitem__(coord, carta)
+
+    def __delitem__(self, coord):
+        super().__delitem__(coord)
+        self.version += 1
+
+    def setdefault(self, coord, carta=None):
+        if coord not in self:
+            self.version += 1
+        return super().setdefault(coord, carta)
+
+    def pop(self, *args):
+        tamano = len(self)
+        resultado = super().pop(*args)
+        if len(self) != tamano:
+            self.version += 1
+        return resultado
+
+    def popitem(self):
+        resultado = super().popitem()
+        self.version += 1
+        return resultado
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def __ior__(self, otro):
+        self.update(otro)
+        return self
+
+
 class TableroHexagonal:
     def __init__(self, radio: int = 2):
         self.radio = radio
         self.centro = CoordenadaHexagonal(0, 0)
-        self.celdas: Dict[CoordenadaHexagonal, Optional[any]] = {}
+        self.celdas: Dict[CoordenadaHexagonal, Optional[any]] = _Celdas()
+
+        # Índices inversos mantenidos por los métodos de escritura (no escribir celdas[...] con cartas directamente)
+        self._posiciones: Dict[int, CoordenadaHexagonal] = {}  # id(carta) → coordenada
+        self._ocupadas: Set[CoordenadaHexagonal] = set()
+        # Callable opcional (anterior, nueva) avisado en cada escritura de celda (p. ej. IndiceFusiones)
+        self.observador_celdas = None
+
+        # Tablas por celda; las de rango se arman en la primera consulta: _rangos[(coord, r)] = celdas a distancia <= r
+        self._rangos: Dict[Tuple[CoordenadaHexagonal, int], Tuple[CoordenadaHexagonal, ...]] = {}
+        self._vecinos: Dict[CoordenadaHexagonal, Tuple[CoordenadaHexagonal, ...]] = {}
+        self._orden_celda: Dict[CoordenadaHexagonal, int] = {}  # coordenada → posición en el orden del tablero
+        self._celdas_tabuladas = -1  # celdas.version con la que se armaron las tablas
+
         self._generar_celdas()
 
     def _generar_celdas(self):
@@ -17,42 +81,120 @@ class TableroHexagonal:
         for coord in coordenadas:
             self.celdas[coord] = None  # Inicialmente vacías
 
-        log_evento(f"Tablero generado: {len(self.celdas)} celdas")
+        log_evento(lambda: f"Tablero generado: {len(self.celdas)} celdas", "DEBUG")
+
+    def _tabular_vecindades(self):
+        """Precalcula los vecinos de cada celda y reinicia las tablas de rango (se rehace si cambian las celdas)"""
+        self._vecinos = {
+            coord: tuple(v for v in coord.vecinos() if v in self.celdas)
+            for coord in self.celdas
+        }
+        self._orden_celda = {coord: i for i, coord in enumerate(self.celdas)}
+        self._rangos = {}
+        self._celdas_tabuladas = self.celdas.version
+
+    def _asegurar_tablas(self):
+        if self._celdas_tabuladas != self.celdas.version:
+            self._tabular_vecindades()
+
+    def _ocupadas_en_orden(self) -> List[CoordenadaHexagonal]:
+        """Celdas ocupadas en el orden del tablero (el set de ocupadas no tiene orden estable)"""
+        self._asegurar_tablas()
+        return sorted(self._ocupadas, key=self._orden_celda.__getitem__)
+
+    def _celdas_en_rango(self, origen: CoordenadaHexagonal, rango: int) -> Optional[Tuple[CoordenadaHexagonal, ...]]:
+        """Tupla cacheada de celdas del tablero a distancia <= rango (en el orden del tablero), o None si el origen no es una celda"""
+        self._asegurar_tablas()
+
+        if origen not in self.celdas:
+            return None
+        if rango < 0:
+            return ()
+
+        # Solo se tabulan los pares (origen, rango) que se consultan
+        clave = (origen, rango)
+        celdas_en_rango = self._rangos.get(clave)
+        if celdas_en_rango is None:
+            celdas_en_rango = tuple(c for c in self.celdas if origen.distancia(c) <= rango)
+            self._rangos[clave] = celdas_en_rango
+        return celdas_en_rango
+
+    def obtener_vecinos(self, coordenada: CoordenadaHexagonal) -> Tuple[CoordenadaHexagonal, ...]:
+        """Vecinos de la celda que pertenecen al tablero"""
+        self._asegurar_tablas()
+
+        vecinos = self._vecinos.get(coordenada)
+        if vecinos is None:
+            return tuple(v for v in coordenada.vecinos() if v in self.celdas)
+        return vecinos
 
     def obtener_celda(self, coordenada: CoordenadaHexagonal):
         return self.celdas.get(coordenada)
 
+    def _asignar(self, coordenada: CoordenadaHexagonal, carta):
+        """Escribe una celda existente manteniendo los índices inversos"""
+        anterior = self.celdas[coordenada]
+        if anterior is not None:
+            self._posiciones.pop(id(anterior), None)
+
+        self.celdas[coordenada] = carta
+        if carta is None:
+            self._ocupadas.discard(coordenada)
+        else:
+            self._posiciones[id(carta)] = coordenada
+            self._ocupadas.add(coordenada)
+
+        if self.observador_celdas is not None and anterior is not carta:
+            self.observador_celdas(anterior, carta)
+
     def colocar_carta(self, coordenada: CoordenadaHexagonal, carta):
         # Permitir argumentos en orden inverso para compatibilidad
         if not isinstance(coordenada, CoordenadaHexagonal) and isinstance(carta, CoordenadaHexagonal):
             coordenada, carta = carta, coordenada
 
         if coordenada in self.celdas:
-            self.celdas[coordenada] = carta
-            log_evento(f"✅ Carta colocada en {coordenada}")
+            # Una carta ocupa una sola celda: si ya estaba en el tablero se libera su celda anterior
+            previa = self._posiciones.get(id(carta)) if carta is not None else None
+            if previa is not None and previa != coordenada:
+                self._asignar(previa, None)
+
+            self._asignar(coordenada, carta)
+            log_evento(lambda: f"✅ Carta colocada en {coordenada}", "DEBUG")
+            return True
         else:
             log_evento(f"❌ Coordenada {coordenada} no existe en el tablero")
+            return False
 
     def obtener_cartas_en_rango(self, origen, rango: int):
         """
         Retorna una lista de tuplas (coordenada, carta) dentro del rango especificado.
+        Recorre las celdas ocupadas o la tupla precalculada del rango, la que sea menor.
         """
-        celdas_en_rango = origen.obtener_area(rango)
-        resultado = []
+        celdas = self.celdas
+        celdas_en_rango = self._celdas_en_rango(origen, rango)
+
+        if celdas_en_rango is None:
+            # Origen fuera del tablero: cálculo geométrico directo
+            celdas_en_rango = [c for c in origen.obtener_area(rango) if c in celdas]
+        elif len(self._ocupadas) < len(celdas_en_rango):
+            q, r = origen.q, origen.r
+            resultado = []
+            for coord in self._ocupadas_en_orden():
+                dq = coord.q - q
+                dr = coord.r - r
+                if abs(dq) + abs(dr) + abs(dq + dr) <= 2 * rango:
+                    resultado.append((coord, celdas[coord]))
+            return resultado
 
+        resultado = []
         for coord in celdas_en_rango:
-            if coord in self.celdas:
-                carta = self.celdas[coord]
-                if carta is not None:
-                    resultado.append((coord, carta))
-
+            carta = celdas[coord]
+            if carta is not None:
+                resultado.append((coord, carta))
         return resultado
 
     def obtener_coordenada_de(self, carta) -> Optional[CoordenadaHexagonal]:
-        for coord, obj in self.celdas.items():
-            if obj is carta:
-                return coord
-        return None
+        return self._posiciones.get(id(carta))
 
     def obtener_cartas(self) -> List:
         return [carta for carta in self.celdas.values() if carta is not None]
@@ -61,7 +203,7 @@ class TableroHexagonal:
         return self.celdas.get(coordenada)
 
     def coordenadas_ocupadas(self) -> List[CoordenadaHexagonal]:
-        return [coord for coord, carta in self.celdas.items() if carta is not None]
+        return self._ocupadas_en_orden()
 
     def coordenadas_libres(self) -> List[CoordenadaHexagonal]:
         return [coord for coord, carta in self.celdas.items() if carta is None]
@@ -73,21 +215,26 @@ class TableroHexagonal:
         return coord in self.celdas
 
     def limpiar_tablero(self):
-        for coord in self.celdas:
+        for coord in self._ocupadas:
+            if self.observador_celdas is not None:
+                self.observador_celdas(self.celdas[coord], None)
             self.celdas[coord] = None
+        self._ocupadas.clear()
+        self._posiciones.clear()
+
     def quitar_carta(self, coordenada):
         """Remueve y retorna la carta en la coordenada dada"""
         if coordenada in self.celdas:
             carta = self.celdas[coordenada]
-            self.celdas[coordenada] = None
+            self._asignar(coordenada, None)
             if carta:
-                log_evento(f"🗑️ Carta removida de {coordenada}")
+                log_evento(lambda: f"🗑️ Carta removida de {coordenada}", "DEBUG")
             return carta
         return None
 
     def contar_cartas(self) -> int:
         """Cuenta el número total de cartas en el tablero"""
-        return len([carta for carta in self.celdas.values() if carta is not None])
+        return len(self._ocupadas)
 
     def obtener_coordenadas_disponibles(self) -> List[CoordenadaHexagonal]:
         """Alias para coordenadas_libres() - mantiene compatibilidad con jugador.py"""
@@ -112,9 +259,9 @@ class TableroHexagonal:
             return False
 
         # Realizar el movimiento
-        self.celdas[desde] = None
-        self.celdas[hacia] = carta
-        log_evento(f"↔️ Carta movida: {desde} → {hacia}")
+        self._asignar(desde, None)
+        self._asignar(hacia, carta)
+        log_evento(lambda: f"↔️ Carta movida: {desde} → {hacia}", "DEBUG")
         return True
 
     def obtener_estadisticas(self) -> Dict[str, any]:
@@ -150,31 +297,26 @@ class TableroHexagonal:
         carta1 = self.celdas[coord1]
         carta2 = self.celdas[coord2]
 
-        self.celdas[coord1] = carta2
-        self.celdas[coord2] = carta1
+        self._asignar(coord1, None)
+        self._asignar(coord2, carta1)
+        self._asignar(coord1, carta2)
 
-        log_evento(f"🔄 Cartas intercambiadas: {coord1} ↔ {coord2}")
+        log_evento(lambda: f"🔄 Cartas intercambiadas: {coord1} ↔ {coord2}", "DEBUG")
         return True
 
     def obtener_cartas_con_posiciones(self) -> List[tuple]:
         """Retorna lista de tuplas (coordenada, carta) para todas las cartas en el tablero"""
-        resultado = []
-        for coord, carta in self.celdas.items():
-            if carta is not None:
-                resultado.append((coord, carta))
-        return resultado
+        return [(coord, self.celdas[coord]) for coord in self._ocupadas_en_orden()]
 
     def buscar_carta(self, carta_objetivo) -> Optional[CoordenadaHexagonal]:
         """Busca una carta específica y retorna su coordenada"""
-        for coord, carta in self.celdas.items():
-            if carta is carta_objetivo:
-                return coord
-        return None
+        return self._posiciones.get(id(carta_objetivo))
 
     def obtener_densidad_area(self, centro: CoordenadaHexagonal, radio: int) -> float:
         """Calcula la densidad de cartas en un área específica"""
-        celdas_area = centro.obtener_area(radio)
-        celdas_validas = [c for c in celdas_area if c in self.celdas]
+        celdas_validas = self._celdas_en_rango(centro, radio)
+        if celdas_validas is None:
+            celdas_validas = [c for c in centro.obtener_area(radio) if c in self.celdas]
 
         if not celdas_validas:
             return 0.0
@@ -8,11 +8,15 @@ from src.utils.helpers import log_evento
 
 
 class TiendaIndividual:
-    def __init__(self, jugador, cantidad_cartas: int = 5):
+    def __init__(self, jugador, cantidad_cartas: int = 5, cartas: Optional[List] = None):
         self.jugador = jugador
         self.cantidad_cartas = cantidad_cartas
         self.cartas_disponibles: List = []
-        self.generar_tienda()
+        if cartas is None:
+            self.generar_tienda()
+        else:
+            # Cartas ya sorteadas para todas las tiendas (ver ManagerCartas.obtener_cartas_para_tiendas)
+            self.cartas_disponibles = list(cartas)
 
     def generar_tienda(self):
         """Genera nuevas cartas según el nivel del jugador"""
@@ -78,3 +82,11 @@ class TiendaIndividual:
         )
         self.cartas_disponibles.extend(nuevas)
         log_evento(f"🛒 {self.jugador.nombre} recibe {faltantes} cartas nuevas en tienda")
+
+    def devolver_cartas(self) -> int:
+        """Devuelve al pool las cartas no compradas y vacía la tienda"""
+        cantidad = len(self.cartas_disponibles)
+        for carta in self.cartas_disponibles:
+            manager_cartas.devolver_carta_al_pool(carta)
+        self.cartas_disponibles.clear()
+        return cantidad
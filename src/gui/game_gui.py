@@ -21,7 +21,8 @@ from .board_widget import BoardWidget
 
 from src.core.jugador import Jugador
 from src.core.motor_juego import MotorJuego
-from src.utils.helpers import log_evento, set_log_callback
+from src.utils.helpers import log_evento
+from src.utils.registro import registro, SalidaBufferada
 
 
 class PlayerTab(QWidget):
@@ -132,7 +133,13 @@ class GameGUI(QMainWindow):
             tab = PlayerTab(j, self.motor)
             self.tabs.addTab(tab, j.nombre)
 
-        set_log_callback(self.agregar_log)
+        # El registro escribe desde su propio hilo: la GUI drena las líneas desde su timer
+        self.salida_log = SalidaBufferada()
+        registro.agregar_salida(self.salida_log)
+        self.timer_log = QTimer(self)
+        self.timer_log.setInterval(200)
+        self.timer_log.timeout.connect(self.drenar_log)
+        self.timer_log.start()
 
         # Actualizar interfaz periódicamente
         self.timer = QTimer(self)
@@ -146,6 +153,10 @@ class GameGUI(QMainWindow):
     def agregar_log(self, mensaje: str, _nivel: str):
         self.log_view.append(mensaje)
 
+    def drenar_log(self):
+        for mensaje, nivel in self.salida_log.drenar():
+            self.agregar_log(mensaje, nivel)
+
     # ------------------------------------------------------------------
     def actualizar(self):
         fase = self.motor.fase_actual
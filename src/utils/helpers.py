@@ -3,17 +3,26 @@ Funciones de utilidad general
 """
 
 import json
-import datetime
 import os
 
+from src.utils.registro import registro, SalidaCallback
+
 # Callback opcional para enviar los logs a una interfaz externa
 log_callback = None
+_salida_callback = None
 
 
 def set_log_callback(callback):
-    """Define una función que recibirá cada mensaje de log."""
-    global log_callback
+    """Define una función que recibirá cada mensaje de log (desde el hilo del registro)."""
+    global log_callback, _salida_callback
+    if _salida_callback is not None:
+        registro.remover_salida(_salida_callback)
+        _salida_callback = None
+
     log_callback = callback
+    if callback:
+        _salida_callback = SalidaCallback(callback)
+        registro.agregar_salida(_salida_callback)
 
 
 def cargar_json(ruta_archivo):
@@ -49,54 +58,15 @@ def guardar_json(datos, ruta_archivo):
 
 
 def log_evento(mensaje, nivel="INFO"):
-    """Registra un evento en consola y opcionalmente en archivo"""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    # Formatear mensaje según nivel
-    if nivel == "ERROR":
-        prefijo = "❌"
-    elif nivel == "WARNING":
-        prefijo = "⚠️"
-    elif nivel == "SUCCESS":
-        prefijo = "✅"
-    elif nivel == "DEBUG":
-        prefijo = "🔍"
-    else:  # INFO
-        prefijo = "ℹ️"
-
-    # Mensaje formateado
-    mensaje_completo = f"[{timestamp}] {prefijo} {mensaje}"
-
-    # Mostrar en consola
-    print(mensaje_completo)
-
-    # Enviar a la interfaz si existe
-    if log_callback:
-        try:
-            log_callback(mensaje_completo, nivel)
-        except Exception:
-            pass
-
-    # Opcionalmente guardar en archivo de log
-    # (descomenta si quieres logs persistentes)
-    # _guardar_log(mensaje_completo)
-
-
-def _guardar_log(mensaje):
-    """Guarda mensaje en archivo de log (función privada)"""
-    try:
-        fecha_hoy = datetime.datetime.now().strftime("%Y-%m-%d")
-        archivo_log = f"logs/game_{fecha_hoy}.log"
-
-        # Crear directorio logs si no existe
-        if not os.path.exists("logs"):
-            os.makedirs("logs")
-
-        with open(archivo_log, 'a', encoding='utf-8') as f:
-            f.write(mensaje + "\n")
-    except Exception:
-        # Si no puede escribir logs, no es crítico
-        pass
+    """
+    Registra un evento en las salidas configuradas (consola, archivo, GUI).
+
+    El nivel se filtra antes de formatear: en rutas calientes conviene pasar
+    una función (p. ej. lambda: f"...") con nivel "DEBUG" para no pagar el
+    formateo cuando ese nivel está desactivado. La escritura es asíncrona;
+    ver src/utils/registro.py.
+    """
+    registro.registrar(mensaje, nivel)
 
 
 def formatear_tiempo(segundos):
@@ -0,0 +1,311 @@
+"""
+Sistema de registro asíncrono
+El nivel se compara antes de formatear nada, los mensajes pueden ser funciones
+que solo se evalúan si el nivel está activo, y la escritura (consola, archivo,
+GUI) ocurre en un hilo aparte alimentado por una cola acotada.
+"""
+
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from typing import Callable, List, Optional, Union
+
+NIVELES = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+}
+
+PREFIJOS = {
+    "DEBUG": "🔍",
+    "INFO": "ℹ️",
+    "SUCCESS": "✅",
+    "WARNING": "⚠️",
+    "ERROR": "❌",
+}
+
+# Marca de fin para el hilo escritor
+_FIN = object()
+
+
+# === SALIDAS ===
+
+class SalidaConsola:
+    """Escribe en la salida estándar (resuelta en cada escritura para respetar redirecciones)"""
+
+    def escribir(self, linea: str, nivel: str):
+        print(linea)
+
+    def vaciar(self):
+        try:
+            sys.stdout.flush()
+        except Exception:
+            pass
+
+    def cerrar(self):
+        self.vaciar()
+
+
+class SalidaArchivoRotativo:
+    """Escribe en logs/<nombre>.log y rota a .1, .2, ... al superar el tamaño máximo"""
+
+    def __init__(self, directorio: str = "logs", nombre: str = "juego",
+                 max_bytes: int = 5 * 1024 * 1024, copias: int = 3):
+        self.ruta = os.path.join(directorio, f"{nombre}.log")
+        self.max_bytes = max_bytes
+        self.copias = copias
+        os.makedirs(directorio, exist_ok=True)
+        self.archivo = open(self.ruta, "a", encoding="utf-8")
+        self.bytes_escritos = self.archivo.tell()
+
+    def escribir(self, linea: str, nivel: str):
+        datos = linea + "\n"
+        self.archivo.write(datos)
+        self.bytes_escritos += len(datos.encode("utf-8"))
+        if self.bytes_escritos >= self.max_bytes:
+            self._rotar()
+
+    def _rotar(self):
+        self.archivo.close()
+        for i in range(self.copias - 1, 0, -1):
+            origen = f"{self.ruta}.{i}"
+            if os.path.exists(origen):
+                os.replace(origen, f"{self.ruta}.{i + 1}")
+        if self.copias > 0:
+            os.replace(self.ruta, f"{self.ruta}.1")
+        else:
+            os.remove(self.ruta)
+        self.archivo = open(self.ruta, "a", encoding="utf-8")
+        self.bytes_escritos = 0
+
+    def vaciar(self):
+        self.archivo.flush()
+
+    def cerrar(self):
+        self.archivo.close()
+
+
+class SalidaCallback:
+    """Reenvía cada línea a una función (línea, nivel); sus errores se ignoran"""
+
+    def __init__(self, callback: Callable[[str, str], None]):
+        self.callback = callback
+
+    def escribir(self, linea: str, nivel: str):
+        try:
+            self.callback(linea, nivel)
+        except Exception:
+            pass
+
+    def vaciar(self):
+        pass
+
+    def cerrar(self):
+        pass
+
+
+class SalidaBufferada:
+    """
+    Acumula las últimas líneas para que otro hilo (p. ej. el timer de la GUI)
+    las consuma con drenar(); así los widgets solo se tocan desde su propio hilo.
+    """
+
+    def __init__(self, max_lineas: int = 1000):
+        self.lineas = deque(maxlen=max_lineas)
+
+    def escribir(self, linea: str, nivel: str):
+        self.lineas.append((linea, nivel))
+
+    def drenar(self) -> List[tuple]:
+        resultado = []
+        while self.lineas:
+            resultado.append(self.lineas.popleft())
+        return resultado
+
+    def vaciar(self):
+        pass
+
+    def cerrar(self):
+        pass
+
+
+# === REGISTRO ===
+
+class Registro:
+    """Filtra por nivel en el hilo que registra y escribe en las salidas desde un hilo propio"""
+
+    def __init__(self, nivel: str = "INFO", asincrono: bool = True, max_cola: int = 10000):
+        self.umbral = NIVELES.get(nivel, NIVELES["INFO"])
+        self.asincrono = asincrono
+        self.max_cola = max_cola
+        self.salidas: list = [SalidaConsola()]
+        self.descartados = 0
+        self.cerrado = False
+
+        self._cola: Optional[queue.Queue] = None
+        self._hilo: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._segundo_formateado = None
+        self._marca_tiempo = ""
+
+    # --- configuración ---
+
+    def definir_nivel(self, nivel: str):
+        self.umbral = NIVELES.get(nivel, self.umbral)
+
+    def habilitado(self, nivel: str) -> bool:
+        return NIVELES.get(nivel, NIVELES["INFO"]) >= self.umbral
+
+    def agregar_salida(self, salida):
+        with self._lock:
+            self.salidas = self.salidas + [salida]
+
+    def remover_salida(self, salida):
+        with self._lock:
+            self.salidas = [s for s in self.salidas if s is not salida]
+
+    # --- registro ---
+
+    def registrar(self, mensaje: Union[str, Callable[[], str]], nivel: str = "INFO"):
+        """Registra un mensaje; si es una función solo se llama cuando el nivel está activo"""
+        if NIVELES.get(nivel, 20) < self.umbral:
+            return
+
+        if callable(mensaje):
+            try:
+                mensaje = mensaje()
+            except Exception as e:
+                mensaje = f"<error formateando mensaje: {e}>"
+
+        if not self.asincrono or self.cerrado:
+            self._escribir(time.time(), nivel, mensaje)
+            return
+
+        cola = self._cola if self._hilo is not None else self._iniciar_hilo()
+        try:
+            cola.put_nowait((time.time(), nivel, mensaje))
+        except queue.Full:
+            if NIVELES.get(nivel, 20) >= NIVELES["WARNING"]:
+                # Advertencias y errores nunca se pierden: se espera al escritor
+                cola.put((time.time(), nivel, mensaje))
+            else:
+                self.descartados += 1
+
+    def vaciar(self):
+        """Bloquea hasta que el hilo escritor procesó todo lo encolado"""
+        if self._cola is not None and self._hilo is not None:
+            self._cola.join()
+        for salida in self.salidas:
+            salida.vaciar()
+
+    def cerrar(self):
+        """Vacía la cola, detiene el hilo escritor y cierra las salidas"""
+        with self._lock:
+            # Lo que se registre después (p. ej. durante el apagado) se escribe en el acto
+            self.cerrado = True
+            hilo, cola = self._hilo, self._cola
+            self._hilo = None
+        if hilo is not None and hilo.is_alive():
+            cola.put(_FIN)
+            hilo.join(timeout=5.0)
+        for salida in self.salidas:
+            try:
+                salida.cerrar()
+            except Exception:
+                pass
+
+    # --- internos ---
+
+    def _iniciar_hilo(self) -> queue.Queue:
+        with self._lock:
+            if self._hilo is None:
+                self._cola = queue.Queue(maxsize=self.max_cola)
+                self._hilo = threading.Thread(target=self._loop_escritor, args=(self._cola,),
+                                              name="registro", daemon=True)
+                self._hilo.start()
+            return self._cola
+
+    def _loop_escritor(self, cola: queue.Queue):
+        while True:
+            elemento = cola.get()
+            try:
+                if elemento is _FIN:
+                    return
+                if self.descartados:
+                    descartados, self.descartados = self.descartados, 0
+                    self._escribir(time.time(), "WARNING", f"{descartados} mensajes descartados por cola llena")
+                self._escribir(*elemento)
+            finally:
+                cola.task_done()
+
+    def _escribir(self, instante: float, nivel: str, mensaje: str):
+        segundo = int(instante)
+        if segundo != self._segundo_formateado:
+            # La marca de tiempo tiene resolución de segundos: se formatea una vez por segundo
+            self._segundo_formateado = segundo
+            self._marca_tiempo = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(segundo))
+
+        linea = f"[{self._marca_tiempo}] {PREFIJOS.get(nivel, PREFIJOS['INFO'])} {mensaje}"
+        for salida in self.salidas:
+            try:
+                salida.escribir(linea, nivel)
+            except Exception:
+                # Una salida rota no debe detener el registro
+                pass
+
+    def _reiniciar_tras_fork(self):
+        # El hilo escritor no sobrevive a fork(): el proceso hijo crea el suyo al primer mensaje
+        self._lock = threading.Lock()
+        self._hilo = None
+        self._cola = None
+
+
+def _crear_registro_global() -> Registro:
+    nuevo = Registro(
+        nivel=os.environ.get("REGISTRO_NIVEL", "INFO").upper(),
+        asincrono=os.environ.get("REGISTRO_SINCRONO", "") not in ("1", "true", "si"),
+    )
+    if os.environ.get("REGISTRO_ARCHIVO", "") in ("1", "true", "si"):
+        nuevo.agregar_salida(SalidaArchivoRotativo())
+    return nuevo
+
+
+# Instancia global usada por log_evento
+registro = _crear_registro_global()
+atexit.register(registro.cerrar)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=registro._reiniciar_tras_fork)
+
+
+def configurar_registro(nivel: str = None, consola: bool = None, archivo: bool = None,
+                        asincrono: bool = None, directorio_logs: str = "logs"):
+    """Ajusta el registro global (nivel mínimo, salidas y modo de escritura)"""
+    if nivel is not None:
+        registro.definir_nivel(nivel.upper())
+    if asincrono is not None:
+        if not asincrono:
+            registro.vaciar()
+        registro.asincrono = asincrono
+    if consola is not None:
+        tiene_consola = any(isinstance(s, SalidaConsola) for s in registro.salidas)
+        if consola and not tiene_consola:
+            registro.agregar_salida(SalidaConsola())
+        elif not consola:
+            for salida in [s for s in registro.salidas if isinstance(s, SalidaConsola)]:
+                registro.remover_salida(salida)
+    if archivo is not None:
+        existentes = [s for s in registro.salidas if isinstance(s, SalidaArchivoRotativo)]
+        if archivo and not existentes:
+            registro.agregar_salida(SalidaArchivoRotativo(directorio=directorio_logs))
+        elif not archivo:
+            registro.vaciar()
+            for salida in existentes:
+                registro.remover_salida(salida)
+                salida.cerrar()
+    return registro
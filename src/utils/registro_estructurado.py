@@ -0,0 +1,249 @@
+"""
+Registro estructurado de eventos de combate
+Cada evento es una tupla compacta (tick, nivel, código, args numéricos) escrita
+en columnas array preasignadas que funcionan como buffer circular. Nada se
+formatea al registrar: el volcado a disco se hace por bloques, en binario
+columnar o NDJSON, y los textos (IDs de carta) se internan como enteros.
+"""
+
+import json
+import os
+import struct
+from array import array
+from enum import IntEnum
+from typing import Dict, List, Tuple
+
+NUM_ARGS = 4
+
+NIVEL_DEBUG = 10
+NIVEL_INFO = 20
+NIVEL_WARNING = 30
+NIVEL_ERROR = 40
+_NOMBRES_NIVEL = {NIVEL_DEBUG: "DEBUG", NIVEL_INFO: "INFO", NIVEL_WARNING: "WARNING", NIVEL_ERROR: "ERROR"}
+
+
+class CodigoEvento(IntEnum):
+    ATAQUE = 1          # fuente, objetivo, daño, vida restante del objetivo
+    MUERTE = 2          # carta, fuente del golpe final
+    INTERACCION = 3     # fuente, objetivo, tipo de interacción
+    INICIO_COMBATE = 4  # ronda, cartas registradas
+    FIN_COMBATE = 5     # ronda, cartas vivas
+
+
+# Nombre de cada argumento por código; los marcados con True son textos internados
+ESQUEMAS: Dict[int, Tuple[Tuple[str, bool], ...]] = {
+    CodigoEvento.ATAQUE: (("fuente", True), ("objetivo", True), ("dano", False), ("vida_restante", False)),
+    CodigoEvento.MUERTE: (("carta", True), ("fuente", True)),
+    CodigoEvento.INTERACCION: (("fuente", True), ("objetivo", True), ("tipo", False)),
+    CodigoEvento.INICIO_COMBATE: (("ronda", False), ("cartas", False)),
+    CodigoEvento.FIN_COMBATE: (("ronda", False), ("cartas_vivas", False)),
+}
+
+# Bloque binario: magia, registros, textos nuevos; luego textos y columnas
+_MAGIA = b"RGE1"
+_CABECERA = struct.Struct("<4sII")
+
+
+class RegistroEstructurado:
+    """
+    Buffer circular de eventos con volcado por lotes
+
+    Sin ruta conserva los últimos `capacidad` eventos (los más viejos se
+    sobrescriben). Con ruta, al llenarse vuelca el bloque completo a disco.
+    """
+
+    def __init__(self, capacidad: int = 65536, ruta: str = None, formato: str = "binario",
+                 nivel_minimo: int = NIVEL_DEBUG):
+        if formato not in ("binario", "ndjson"):
+            raise ValueError(f"Formato de registro desconocido: {formato}")
+
+        self.capacidad = capacidad
+        self.ruta = ruta
+        self.formato = formato
+        self.nivel_minimo = nivel_minimo
+        self.tick = 0  # lo actualiza quien registra (p. ej. el gestor en cada procesar_tick)
+
+        # Columnas preasignadas
+        self.ticks = array("q", bytes(8 * capacidad))
+        self.niveles = array("B", bytes(capacidad))
+        self.codigos = array("H", bytes(2 * capacidad))
+        self.args = [array("d", bytes(8 * capacidad)) for _ in range(NUM_ARGS)]
+
+        self.posicion = 0
+        self.dio_vuelta = False
+        self.total_registrados = 0
+        self.total_volcados = 0
+
+        # Textos internados: valor → índice (solo crece)
+        self.indices_texto: Dict[str, int] = {}
+        self.textos: List[str] = []
+        self._textos_volcados = 0
+
+    def texto(self, valor) -> int:
+        """Índice numérico estable para un texto (p. ej. el ID de una carta)"""
+        valor = str(valor)
+        indice = self.indices_texto.get(valor)
+        if indice is None:
+            indice = len(self.textos)
+            self.indices_texto[valor] = indice
+            self.textos.append(valor)
+        return indice
+
+    def registrar(self, codigo: int, a: float = 0, b: float = 0, c: float = 0, d: float = 0,
+                  nivel: int = NIVEL_INFO):
+        """Agrega un evento; solo escribe números en las columnas"""
+        if nivel < self.nivel_minimo:
+            return
+
+        i = self.posicion
+        self.ticks[i] = self.tick
+        self.niveles[i] = nivel
+        self.codigos[i] = codigo
+        args = self.args
+        args[0][i] = a
+        args[1][i] = b
+        args[2][i] = c
+        args[3][i] = d
+        self.total_registrados += 1
+
+        i += 1
+        if i < self.capacidad:
+            self.posicion = i
+        elif self.ruta:
+            self.posicion = i
+            self.volcar()
+        else:
+            self.posicion = 0
+            self.dio_vuelta = True
+
+    # === LECTURA ===
+
+    def _rango_pendiente(self) -> List[int]:
+        """Índices de los eventos en el buffer, del más viejo al más nuevo"""
+        if self.dio_vuelta:
+            return list(range(self.posicion, self.capacidad)) + list(range(self.posicion))
+        return list(range(self.posicion))
+
+    def __len__(self):
+        return self.capacidad if self.dio_vuelta else self.posicion
+
+    def eventos(self) -> List[dict]:
+        """Eventos del buffer como dicts legibles (para inspección y tests)"""
+        return [self._a_dict(i) for i in self._rango_pendiente()]
+
+    def _a_dict(self, i: int) -> dict:
+        codigo = self.codigos[i]
+        return _evento_a_dict(self.ticks[i], self.niveles[i], codigo,
+                              [columna[i] for columna in self.args], self.textos)
+
+    # === VOLCADO ===
+
+    def volcar(self) -> int:
+        """Escribe en disco los eventos pendientes en un único bloque; retorna cuántos"""
+        indices = self._rango_pendiente()
+        if not indices or not self.ruta:
+            return 0
+
+        directorio = os.path.dirname(self.ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+        if self.formato == "binario":
+            datos = self._bloque_binario(indices)
+            with open(self.ruta, "ab") as archivo:
+                archivo.write(datos)
+        else:
+            lineas = [json.dumps(self._a_dict(i), ensure_ascii=False) for i in indices]
+            with open(self.ruta, "a", encoding="utf-8") as archivo:
+                archivo.write("\n".join(lineas) + "\n")
+
+        self._textos_volcados = len(self.textos)
+        self.total_volcados += len(indices)
+        self.posicion = 0
+        self.dio_vuelta = False
+        return len(indices)
+
+    def _bloque_binario(self, indices: List[int]) -> bytes:
+        textos_nuevos = self.textos[self._textos_volcados:]
+        partes = [_CABECERA.pack(_MAGIA, len(indices), len(textos_nuevos))]
+        for texto in textos_nuevos:
+            codificado = texto.encode("utf-8")
+            partes.append(struct.pack("<H", len(codificado)) + codificado)
+
+        contiguo = not self.dio_vuelta
+        columnas = [self.ticks, self.niveles, self.codigos] + self.args
+        for columna in columnas:
+            if contiguo:
+                partes.append(columna[:len(indices)].tobytes())
+            else:
+                partes.append(array(columna.typecode, (columna[i] for i in indices)).tobytes())
+        return b"".join(partes)
+
+    def obtener_estadisticas(self) -> dict:
+        return {
+            "capacidad": self.capacidad,
+            "en_buffer": len(self),
+            "total_registrados": self.total_registrados,
+            "total_volcados": self.total_volcados,
+            "sobrescritos": self.total_registrados - self.total_volcados - len(self),
+            "textos": len(self.textos),
+        }
+
+
+def _evento_a_dict(tick: int, nivel: int, codigo: int, args: List[float], textos: List[str]) -> dict:
+    try:
+        nombre = CodigoEvento(codigo).name
+    except ValueError:
+        nombre = str(codigo)
+
+    evento = {"tick": tick, "nivel": _NOMBRES_NIVEL.get(nivel, str(nivel)), "evento": nombre}
+    esquema = ESQUEMAS.get(codigo)
+    if esquema is None:
+        evento["args"] = list(args)
+        return evento
+
+    for (campo, es_texto), valor in zip(esquema, args):
+        if es_texto:
+            indice = int(valor)
+            evento[campo] = textos[indice] if 0 <= indice < len(textos) else None
+        else:
+            evento[campo] = int(valor) if float(valor).is_integer() else valor
+    return evento
+
+
+def leer_registro_binario(ruta: str) -> List[dict]:
+    """Decodifica un archivo escrito en formato binario a la misma forma que el NDJSON"""
+    eventos = []
+    textos: List[str] = []
+    tipos = ["q", "B", "H"] + ["d"] * NUM_ARGS
+
+    with open(ruta, "rb") as archivo:
+        datos = archivo.read()
+
+    offset = 0
+    while offset < len(datos):
+        magia, cantidad, nuevos = _CABECERA.unpack_from(datos, offset)
+        if magia != _MAGIA:
+            raise ValueError(f"Bloque inválido en {ruta} (offset {offset})")
+        offset += _CABECERA.size
+
+        for _ in range(nuevos):
+            (largo,) = struct.unpack_from("<H", datos, offset)
+            offset += 2
+            textos.append(datos[offset:offset + largo].decode("utf-8"))
+            offset += largo
+
+        columnas = []
+        for tipo in tipos:
+            columna = array(tipo)
+            tamano = columna.itemsize * cantidad
+            columna.frombytes(datos[offset:offset + tamano])
+            offset += tamano
+            columnas.append(columna)
+
+        ticks, niveles, codigos = columnas[:3]
+        args = columnas[3:]
+        for i in range(cantidad):
+            eventos.append(_evento_a_dict(ticks[i], niveles[i], codigos[i], [col[i] for col in args], textos))
+
+    return eventos
@@ -0,0 +1,151 @@
+import random
+import threading
+import time
+
+import pytest
+
+from src.core.jugador import Jugador
+from src.core.motor_juego import MotorJuego
+from src.game.cartas.manager_cartas import manager_cartas
+from src.game.combate.fase.controlador_fase_enfrentamiento import ControladorFaseEnfrentamiento
+from src.game.combate.motor.anfitrion_partidas import AnfitrionPartidas
+from src.game.combate.motor.motor_tiempo_real import MotorTiempoReal, EstadoMotor
+from src.game.combate.motor.reloj import RelojVirtual
+
+
+@pytest.fixture
+def pool_limpio():
+    """Devuelve al pool global las cartas repartidas por las partidas del test"""
+    yield
+    if manager_cartas.cartas_cargadas:
+        manager_cartas.resetear_pool()
+
+
+def crear_motor_con_fase(reloj, duracion=0.5, fps=20):
+    motor = MotorTiempoReal(fps_objetivo=fps, reloj=reloj)
+    bandera = {"terminado": False}
+    controlador = ControladorFaseEnfrentamiento(
+        motor=motor,
+        jugadores_por_color={"rojo": [], "azul": []},
+        secuencia_turnos=[{"color": "rojo", "duracion": duracion}, {"color": "azul", "duracion": duracion}],
+        al_terminar_fase=lambda: bandera.update({"terminado": True})
+    )
+    motor.agregar_componente(controlador)
+    controlador.iniciar_fase()
+    return motor, bandera
+
+
+def test_muchas_partidas_en_un_solo_loop():
+    reloj = RelojVirtual()
+    anfitrion = AnfitrionPartidas(fps_objetivo=20, reloj=reloj)
+    partidas = [crear_motor_con_fase(reloj) for _ in range(50)]
+
+    hilos_antes = threading.active_count()
+    for motor, _ in partidas:
+        assert anfitrion.agregar_motor(motor) is not None
+
+    assert threading.active_count() == hilos_antes
+    anfitrion.ejecutar_hasta(lambda: all(bandera["terminado"] for _, bandera in partidas))
+
+    assert all(bandera["terminado"] for _, bandera in partidas)
+    estadisticas = anfitrion.obtener_estadisticas()
+    assert len(estadisticas["partidas"]) == 50
+    for stats_partida in estadisticas["partidas"].values():
+        assert stats_partida["total_ticks"] == 20
+
+
+def test_fps_propio_de_cada_partida():
+    reloj = RelojVirtual()
+    anfitrion = AnfitrionPartidas(fps_objetivo=20, reloj=reloj)
+    rapido, _ = crear_motor_con_fase(reloj, duracion=60, fps=20)
+    lento, _ = crear_motor_con_fase(reloj, duracion=60, fps=5)
+    anfitrion.agregar_motor(rapido, "rapido")
+    anfitrion.agregar_motor(lento, "lento")
+
+    anfitrion.ejecutar_hasta(lambda: False, max_ticks=41)
+
+    assert rapido.total_ticks == 40
+    assert lento.total_ticks == 10
+
+
+def test_error_en_una_partida_no_afecta_al_resto():
+    reloj = RelojVirtual()
+    anfitrion = AnfitrionPartidas(fps_objetivo=20, reloj=reloj)
+    sana, bandera = crear_motor_con_fase(reloj)
+    rota, _ = crear_motor_con_fase(reloj)
+
+    def fallar():
+        raise RuntimeError("fallo simulado")
+
+    rota._procesar_tick = fallar
+    anfitrion.agregar_motor(sana, "sana")
+    anfitrion.agregar_motor(rota, "rota")
+
+    anfitrion.ejecutar_hasta(lambda: bandera["terminado"])
+
+    assert bandera["terminado"] is True
+    assert rota.estado == EstadoMotor.ERROR
+    assert anfitrion.obtener_partidas() == ["sana"]
+    assert anfitrion.stats["partidas_con_error"] == 1
+
+
+def test_motor_juego_hospedado_no_bloquea(pool_limpio):
+    reloj = RelojVirtual()
+    anfitrion = AnfitrionPartidas(fps_objetivo=20, reloj=reloj)
+    juegos = [MotorJuego([Jugador(1, "A"), Jugador(2, "B")], anfitrion=anfitrion) for _ in range(5)]
+
+    for juego in juegos:
+        juego.iniciar()
+        juego.controlador_preparacion.finalizar_fase()
+        assert juego.fase_actual == "combate"
+
+    anfitrion.ejecutar_hasta(lambda: all(j.fase_actual == "preparacion" for j in juegos))
+
+    assert all(juego.ronda == 2 for juego in juegos)
+    assert anfitrion.obtener_partidas() == []
+
+
+def test_anfitrion_en_hilo_propio():
+    anfitrion = AnfitrionPartidas(fps_objetivo=50)
+    partidas = [crear_motor_con_fase(anfitrion.reloj, duracion=0.05, fps=50) for _ in range(10)]
+    for motor, _ in partidas:
+        anfitrion.agregar_motor(motor)
+
+    anfitrion.iniciar()
+    tiempo_limite = time.time() + 2
+    while not all(b["terminado"] for _, b in partidas) and time.time() < tiempo_limite:
+        time.sleep(0.01)
+    anfitrion.detener()
+
+    assert all(bandera["terminado"] for _, bandera in partidas)
+
+
+class RelojConJitter:
+    """Reloj de pared simulado: el tiempo corre mientras se procesa y dormir se pasa un poco"""
+
+    paso_fijo = False
+
+    def __init__(self):
+        self.tiempo = 0.0
+        self.azar = random.Random(5)
+
+    def ahora(self):
+        self.tiempo += 1e-5
+        return self.tiempo
+
+    def dormir(self, segundos):
+        if segundos > 0:
+            self.tiempo += segundos + self.azar.uniform(0, 0.002)
+
+
+def test_partidas_mantienen_su_fps_con_reloj_de_pared():
+    reloj = RelojConJitter()
+    anfitrion = AnfitrionPartidas(fps_objetivo=20, reloj=reloj)
+    motores = [MotorTiempoReal(fps_objetivo=20, reloj=reloj) for _ in range(100)]
+    for motor in motores:
+        anfitrion.agregar_motor(motor)
+
+    ticks_anfitrion = anfitrion.ejecutar_hasta(lambda: reloj.tiempo >= 2.0)
+
+    assert ticks_anfitrion >= 38
+    assert all(motor.total_ticks >= ticks_anfitrion - 1 for motor in motores)
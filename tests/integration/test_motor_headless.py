@@ -0,0 +1,83 @@
+import time
+
+from src.core.jugador import Jugador
+from src.core.motor_juego import MotorJuego
+from src.game.cartas.carta_base import CartaBase
+from src.game.combate.fase.controlador_fase_enfrentamiento import ControladorFaseEnfrentamiento
+from src.game.combate.fase.secuencia_turnos import generar_secuencia_turnos
+from src.game.combate.motor.motor_tiempo_real import MotorTiempoReal, EstadoMotor
+from src.game.combate.motor.reloj import RelojVirtual
+
+
+def test_fase_completa_con_reloj_virtual_sin_esperas():
+    reloj = RelojVirtual()
+    motor = MotorTiempoReal(fps_objetivo=20, reloj=reloj)
+    bandera = {"terminado": False}
+
+    secuencia = generar_secuencia_turnos()
+    controlador = ControladorFaseEnfrentamiento(
+        motor=motor,
+        jugadores_por_color={"rojo": [], "azul": []},
+        secuencia_turnos=secuencia,
+        al_terminar_fase=lambda: bandera.update({"terminado": True})
+    )
+    motor.agregar_componente(controlador)
+    controlador.iniciar_fase()
+
+    inicio = time.time()
+    ticks = motor.ejecutar_hasta(lambda: controlador.finalizada)
+    duracion_real = time.time() - inicio
+
+    duracion_virtual = sum(turno["duracion"] for turno in secuencia)
+    assert bandera["terminado"] is True
+    assert ticks == round(duracion_virtual * 20)
+    assert abs(reloj.ahora() - duracion_virtual) < 1e-6
+    assert duracion_real < duracion_virtual / 2
+    assert motor.estado == EstadoMotor.DETENIDO
+
+
+def test_delta_time_fijo_por_tick():
+    motor = MotorTiempoReal(fps_objetivo=10, reloj=RelojVirtual())
+    deltas = []
+
+    class Componente:
+        def procesar_tick(self, delta_time):
+            deltas.append(delta_time)
+            return True
+
+        def obtener_id_componente(self):
+            return "registro_deltas"
+
+    motor.agregar_componente(Componente())
+    motor.ejecutar_hasta(lambda: len(deltas) >= 5)
+
+    assert len(deltas) == 5
+    assert all(abs(delta - 0.1) < 1e-9 for delta in deltas)
+
+
+def test_motor_juego_headless_resuelve_combate_sin_bloquear():
+    jugadores = [Jugador(1, "A"), Jugador(2, "B")]
+    motor = MotorJuego(jugadores, headless=True)
+    motor.iniciar()
+
+    inicio = time.time()
+    motor.controlador_preparacion.finalizar_fase()
+
+    assert time.time() - inicio < 3
+    assert motor.fase_actual == "preparacion"
+    assert motor.ronda == 2
+
+
+def test_motor_juego_registra_las_cartas_del_tablero_en_el_combate():
+    jugadores = [Jugador(1, "A"), Jugador(2, "B")]
+    for jugador in jugadores:
+        for i in range(2):
+            jugador.agregar_carta_al_banco(CartaBase({"id": 100 * jugador.id + i, "nombre": f"Carta{jugador.id}-{i}",
+                                                      "categoria": "militar"}))
+    motor = MotorJuego(jugadores, headless=True)
+    motor.iniciar()
+    motor.controlador_preparacion.finalizar_fase()
+
+    gestor = motor.gestor_interacciones
+    assert len(gestor.estados_cartas) == 4
+    assert gestor.sinergias.sinergias_activas(jugadores[0]) == {"categoria_militar": 2, "rol_basico": 2}
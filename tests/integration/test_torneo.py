@@ -0,0 +1,49 @@
+from main_torneo import agregar_resultados, ejecutar_torneo, jugar_partida
+from src.game.cartas.manager_cartas import manager_cartas
+
+
+def test_torneo_en_paralelo_agrega_todas_las_partidas():
+    reporte = ejecutar_torneo(4, procesos=2, semilla_base=7)
+
+    assert reporte['partidas'] == 4
+    assert reporte['rondas_min'] <= reporte['rondas_promedio'] <= reporte['rondas_max']
+    assert set(reporte['jugadores']) == {"Napoleón Bonaparte", "Marie Curie"}
+    assert reporte['partidas_por_segundo'] > 0
+
+
+def test_misma_semilla_mismo_reporte():
+    primero = ejecutar_torneo(3, procesos=2, semilla_base=42)
+    segundo = ejecutar_torneo(3, procesos=3, semilla_base=42)
+
+    for clave in ('partidas', 'rondas_promedio', 'empates_o_limite', 'jugadores'):
+        assert primero[clave] == segundo[clave]
+
+
+def test_agregar_resultados_cuenta_victorias():
+    resultados = [
+        {'semilla': i, 'ganador': ganador, 'rondas': rondas, 'jugadores': [
+            {'nombre': "A", 'nivel': 2, 'oro_total_ganado': 10, 'dano_total_recibido': 5},
+            {'nombre': "B", 'nivel': 4, 'oro_total_ganado': 20, 'dano_total_recibido': 15},
+        ]}
+        for i, (ganador, rondas) in enumerate([("A", 5), ("A", 7), (None, 10)])
+    ]
+
+    reporte = agregar_resultados(resultados)
+
+    assert reporte['empates_o_limite'] == 1
+    assert reporte['rondas_min'] == 5 and reporte['rondas_max'] == 10
+    assert reporte['jugadores']["A"]['victorias'] == 2
+    assert reporte['jugadores']["B"]['oro_promedio'] == 20
+    assert agregar_resultados([]) == {'partidas': 0}
+
+
+def test_catalogo_columnar_no_cambia_el_resultado():
+    con_json = jugar_partida(5)
+    manager_cartas.usar_catalogo_columnar = True
+    try:
+        con_columnar = jugar_partida(5)
+    finally:
+        manager_cartas.usar_catalogo_columnar = False
+        manager_cartas.cargar_cartas()
+
+    assert con_columnar == con_json
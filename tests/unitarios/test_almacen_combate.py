@@ -0,0 +1,72 @@
+from src.game.cartas.almacen_combate import AlmacenCombate
+from src.game.cartas.carta_base import CartaBase
+from src.game.cartas.estado_carta import EstadoCarta
+from src.game.combate.interacciones.gestor_interacciones import GestorInteracciones
+from src.game.tablero.coordenada import CoordenadaHexagonal
+from src.game.tablero.tablero_hexagonal import TableroHexagonal
+
+
+def crear_carta(id, duenio, vida=100, dano=10, intervalo=1.0):
+    carta = CartaBase({"id": id, "nombre": f"Carta{id}", "tier": 1,
+                       "stats": {"vida": vida, "dano_fisico": dano, "defensa_fisica": 2,
+                                 "intervalo_ataque": intervalo}})
+    carta.duenio = duenio
+    return carta
+
+
+def test_estado_registrado_es_vista_y_al_liberarse_conserva_datos():
+    almacen = AlmacenCombate()
+    estado = EstadoCarta(crear_carta(1, "A"))
+    estado.recibir_dano(30)
+
+    slot = almacen.registrar(estado)
+    assert estado.almacen is almacen
+    assert almacen.vida[slot] == 70
+    assert estado.defensa_fisica_actual == estado.defensa == 2
+
+    almacen.vida[slot] = 50
+    estado.cooldown_ataque = 0.75
+    assert estado.vida_actual == 50
+    assert almacen.cooldown[slot] == 0.75
+
+    almacen.liberar(estado)
+    assert estado.almacen is None
+    assert (estado.vida_actual, estado.cooldown_ataque, estado.esta_viva()) == (50, 0.75, True)
+    assert len(almacen) == 0
+    # El slot libre se reutiliza
+    assert almacen.registrar(EstadoCarta(crear_carta(2, "B"))) == slot
+
+
+def test_avanzar_cooldowns_en_un_recorrido():
+    almacen = AlmacenCombate()
+    estados = [EstadoCarta(crear_carta(i, "A" if i % 2 else "B")) for i in range(4)]
+    for estado in estados:
+        almacen.registrar(estado)
+    estados[1].cooldown_ataque = 0.3
+    estados[2].cooldown_ataque = 1.0
+
+    assert almacen.avanzar_cooldowns(0.5) == [0, 1, 3]
+    assert estados[2].cooldown_ataque == 0.5
+
+    estados[0].recibir_dano(150)
+    assert estados[0].estado == "muerta"
+    assert almacen.avanzar_cooldowns(0.5) == [1, 2, 3]
+
+
+def test_gestor_con_almacen_resuelve_igual_que_sin_el():
+    def simular(almacen):
+        tablero = TableroHexagonal(radio=2)
+        gestor = GestorInteracciones(tablero=tablero, almacen=almacen)
+        estados = []
+        posiciones = [(0, 0), (1, 0), (0, 1), (-1, 1)]
+        for i, (q, r) in enumerate(posiciones):
+            carta = crear_carta(i, "A" if i < 2 else "B", vida=120 + 10 * i, dano=15 + i, intervalo=0.5 + 0.25 * i)
+            tablero.colocar_carta(CoordenadaHexagonal(q, r), carta)
+            estado = EstadoCarta(carta)
+            gestor.registrar_estado_carta(estado)
+            estados.append(estado)
+        for _ in range(200):
+            gestor.procesar_tick(0.05)
+        return [(e.vida_actual, e.estado) for e in estados]
+
+    assert simular(AlmacenCombate()) == simular(None)
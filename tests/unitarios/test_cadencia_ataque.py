@@ -0,0 +1,74 @@
+import pytest
+
+from src.game.cartas.carta_base import CartaBase
+from src.game.cartas.estado_carta import EstadoCarta
+from src.game.combate.interacciones.gestor_interacciones import GestorInteracciones
+from src.game.tablero.coordenada import CoordenadaHexagonal
+from src.game.tablero.tablero_hexagonal import TableroHexagonal
+
+
+def crear_carta(id, duenio, vida=10_000, dano=10, intervalo=1.5):
+    carta = CartaBase({
+        "id": id,
+        "nombre": f"Carta{id}",
+        "tier": 1,
+        "stats": {"vida": vida, "dano_fisico": dano, "rango_ataque": 1, "intervalo_ataque": intervalo}
+    })
+    carta.duenio = duenio
+    return carta
+
+
+def preparar(cartas_y_coords, **kwargs):
+    tablero = TableroHexagonal(radio=2)
+    gestor = GestorInteracciones(tablero=tablero, **kwargs)
+    estados = {}
+    for carta, (q, r) in cartas_y_coords:
+        tablero.colocar_carta(CoordenadaHexagonal(q, r), carta)
+        estados[carta.id] = EstadoCarta(carta)
+        gestor.registrar_estado_carta(estados[carta.id])
+    return gestor, estados
+
+
+@pytest.mark.parametrize("fps", [7, 10, 20, 30, 60])
+def test_cadencia_independiente_del_fps(fps):
+    atacante = crear_carta(1, "A", dano=10, intervalo=1.5)
+    defensor = crear_carta(2, "B", dano=0, intervalo=1.5)
+    gestor, estados = preparar([(atacante, (0, 0)), (defensor, (1, 0))])
+
+    for _ in range(6 * fps):
+        gestor.procesar_tick(1.0 / fps)
+
+    # Ataques en t = 0, 1.5, 3.0 y 4.5 dentro de los 6 segundos simulados
+    ataques = (10_000 - estados[2].vida_actual) // 10
+    assert ataques == 4
+
+
+def test_politica_menor_vida_concentra_el_ataque():
+    atacante = crear_carta(1, "A", dano=10)
+    sano = crear_carta(2, "B")
+    herido = crear_carta(3, "B")
+    gestor, estados = preparar([(atacante, (0, 0)), (sano, (1, 0)), (herido, (0, 1))])
+    estados[3].vida_actual = 500
+    for id_carta in (2, 3):
+        estados[id_carta].cooldown_ataque = 99  # los defensores no contraatacan
+
+    gestor.procesar_tick(0.05)
+
+    assert estados[2].vida_actual == 10_000
+    assert estados[3].vida_actual == 490
+
+
+def test_politica_todos_y_cartas_derrotadas():
+    atacante = crear_carta(1, "A", dano=10)
+    gestor, estados = preparar(
+        [(atacante, (0, 0)), (crear_carta(2, "B"), (1, 0)), (crear_carta(3, "B"), (0, 1))],
+        politica_objetivo="todos"
+    )
+    estados[3].estado = "muerta"
+
+    gestor.procesar_tick(0.05)
+
+    # La carta derrotada ni ataca ni es elegida como objetivo
+    assert estados[2].vida_actual == 10_000 - 10
+    assert estados[1].vida_actual == 10_000 - 10
+    assert estados[3].vida_actual == 10_000
@@ -0,0 +1,79 @@
+import json
+import pickle
+
+import pytest
+
+from src.game.cartas.catalogo_columnar import CatalogoColumnar, abrir_catalogo_columnar
+from src.game.cartas.manager_cartas import ManagerCartas
+from src.game.cartas.plantilla_carta import PlantillaCarta
+from src.utils.helpers import cargar_json
+
+ARCHIVO_CARTAS = "src/data/cartas/personajes_historicos.json"
+
+
+@pytest.fixture
+def archivo(tmp_path):
+    cartas = cargar_json(ARCHIVO_CARTAS)
+    cartas[0]["stats"]["intervalo_ataque"] = 0.8
+    cartas[1]["rareza"] = "épica"
+    cartas[1]["stats"]["critico"] = 0.25
+    cartas.append({"id": 500, "nombre": "Mínima"})
+    ruta = tmp_path / "cartas.json"
+    ruta.write_text(json.dumps(cartas, ensure_ascii=False), encoding="utf-8")
+    return ruta, cartas
+
+
+def campos(plantilla):
+    return {campo: getattr(plantilla, campo) for campo in PlantillaCarta.__slots__
+            if campo != "habilidades"}
+
+
+def test_registros_equivalen_al_json(archivo):
+    ruta, cartas = archivo
+    catalogo = abrir_catalogo_columnar(str(ruta))
+
+    assert len(catalogo) == len(cartas)
+    assert list(catalogo) == [c["id"] for c in cartas]
+    assert 500 in catalogo and 9999 not in catalogo and catalogo.get(9999) is None
+    for original in cartas:
+        registro = catalogo[original["id"]]
+        assert campos(PlantillaCarta(registro)) == campos(PlantillaCarta(original))
+        assert registro["habilidades"] == original.get("habilidades", [])
+
+    assert catalogo[cartas[1]["id"]]["rareza"] == "épica"
+    assert catalogo[cartas[1]["id"]]["stats"]["critico"] == 0.25
+    assert catalogo.valor(cartas[0]["id"], "intervalo_ataque") == 0.8
+    assert catalogo.valor(500, "nombre") == "Mínima"
+    catalogo.cerrar()
+
+
+def test_se_regenera_si_cambia_el_json_y_se_reabre_al_deserializar(archivo):
+    ruta, cartas = archivo
+    abrir_catalogo_columnar(str(ruta)).cerrar()
+
+    ruta.write_text(json.dumps([{"id": 3, "nombre": "Única", "tier": 3}]), encoding="utf-8")
+    catalogo = abrir_catalogo_columnar(str(ruta))
+    assert list(catalogo) == [3]
+
+    copia = pickle.loads(pickle.dumps(catalogo))
+    assert isinstance(copia, CatalogoColumnar) and copia[3]["nombre"] == "Única"
+    assert copia.indices()["cartas_por_tier"] == {1: [], 2: [], 3: [3]}
+
+
+def test_manager_con_catalogo_columnar_equivale_al_json(archivo):
+    ruta, _ = archivo
+    managers = []
+    for columnar in (False, True):
+        manager = ManagerCartas()
+        manager.archivo_cartas = str(ruta)
+        manager.usar_cache_catalogo = False
+        manager.usar_catalogo_columnar = columnar
+        assert manager.cargar_cartas()
+        managers.append(manager)
+
+    dicts, columnar = managers
+    assert isinstance(columnar.datos_cartas, CatalogoColumnar)
+    for atributo in ("cartas_por_tier", "cartas_por_categoria", "cartas_por_rol", "copias_totales", "pool_global"):
+        assert getattr(columnar, atributo) == getattr(dicts, atributo)
+    carta = columnar._tomar_instancia_del_pool(columnar.cartas_por_tier[2][0])
+    assert carta.nombre == dicts.datos_cartas[carta.carta_base_id]["nombre"]
@@ -0,0 +1,70 @@
+import json
+import os
+
+import pytest
+
+from src.game.cartas import catalogo_compilado
+from src.game.cartas.catalogo_compilado import cargar_catalogo, ruta_cache_de
+from src.game.cartas.manager_cartas import ManagerCartas
+
+
+@pytest.fixture
+def archivo(tmp_path):
+    ruta = tmp_path / "cartas.json"
+    ruta.write_text(json.dumps([
+        {"id": 1, "nombre": "A", "tier": 1, "categoria": "ciencia", "rol": "lider"},
+        {"id": 2, "nombre": "B", "tier": 3, "categoria": "ciencia"},
+        {"nombre": "Sin id"},
+    ]), encoding="utf-8")
+    return ruta
+
+
+@pytest.fixture
+def compilaciones(monkeypatch):
+    llamadas = []
+    original = catalogo_compilado.compilar_catalogo
+
+    def contar(datos):
+        llamadas.append(len(datos))
+        return original(datos)
+
+    monkeypatch.setattr(catalogo_compilado, "compilar_catalogo", contar)
+    return llamadas
+
+
+def test_segunda_carga_usa_el_cache(archivo, compilaciones):
+    primero = cargar_catalogo(str(archivo))
+    assert os.path.exists(ruta_cache_de(str(archivo)))
+    assert primero["cartas_por_tier"] == {1: [1], 2: [], 3: [2]}
+    assert primero["cartas_por_categoria"] == {"ciencia": [1, 2]}
+    assert primero["cartas_por_rol"] == {"lider": [1], "basico": [2]}
+
+    assert cargar_catalogo(str(archivo)) == primero
+    # Cambia el mtime pero no el contenido: decide el hash
+    os.utime(archivo, ns=(0, 10 ** 18))
+    assert cargar_catalogo(str(archivo)) == primero
+    assert compilaciones == [3]
+
+
+def test_cambios_en_el_json_o_cache_corrupto_recompilan(archivo, compilaciones):
+    cargar_catalogo(str(archivo))
+
+    archivo.write_text(json.dumps([{"id": 7, "nombre": "Nueva", "tier": 2}]), encoding="utf-8")
+    assert list(cargar_catalogo(str(archivo))["datos_cartas"]) == [7]
+
+    with open(ruta_cache_de(str(archivo)), "wb") as f:
+        f.write(b"basura")
+    assert list(cargar_catalogo(str(archivo))["datos_cartas"]) == [7]
+    assert compilaciones == [3, 1, 1]
+
+
+def test_manager_carga_igual_con_y_sin_cache(archivo):
+    resultados = []
+    for usar_cache in (False, True, True):
+        manager = ManagerCartas()
+        manager.archivo_cartas = str(archivo)
+        manager.usar_cache_catalogo = usar_cache
+        assert manager.cargar_cartas()
+        resultados.append((manager.datos_cartas, manager.cartas_por_tier, manager.cartas_por_rol,
+                           manager.copias_totales))
+    assert resultados[0] == resultados[1] == resultados[2]
@@ -0,0 +1,32 @@
+import copy
+import pickle
+
+import pytest
+
+from src.game.tablero.coordenada import CoordenadaHexagonal
+
+
+def test_coordenadas_iguales_son_el_mismo_objeto():
+    a = CoordenadaHexagonal(2, -1)
+    assert CoordenadaHexagonal(2, -1) is a
+    assert CoordenadaHexagonal(1, 0) + CoordenadaHexagonal(1, -1) is a
+    assert pickle.loads(pickle.dumps(a)) is a
+    assert copy.deepcopy(a) is a
+    assert {a: "x"}[CoordenadaHexagonal(2, -1)] == "x"
+    assert hash(a) == hash((2, -1))
+
+
+def test_coordenada_inmutable_y_s_precalculada():
+    a = CoordenadaHexagonal(3, -1)
+    assert a.s() == -2
+    with pytest.raises(AttributeError):
+        a.q = 5
+    assert not hasattr(a, "__dict__")
+
+
+def test_distancias():
+    origen = CoordenadaHexagonal(0, 0)
+    assert origen.distancia(CoordenadaHexagonal(2, -1)) == 2
+    assert origen.distancia_a(CoordenadaHexagonal(-3, 3)) == 3
+    assert all(origen.distancia(v) == 1 for v in origen.vecinos())
+    assert len(origen.obtener_area(2)) == 19
@@ -2,7 +2,13 @@ import sys, os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 
-from src.game.combate.calcular_dano.calculadora_dano import calcular_dano
+from src.game.cartas.almacen_combate import AlmacenCombate
+from src.game.cartas.carta_base import CartaBase
+from src.game.cartas.estado_carta import EstadoCarta
+from src.game.combate.calcular_dano.calculadora_dano import calcular_dano, calcular_dano_lote
+from src.game.combate.calcular_dano.modificadores_basicos import (
+    TIPO_FISICO, TIPO_MAGICO, TIPO_VERDADERO, codigo_tipo_dano
+)
 from src.game.combate.interacciones.interaccion_modelo import Interaccion, TipoInteraccion
 
 
@@ -56,6 +62,38 @@ def test_dano_minimo_1():
     assert dano == 1, f"El daño mínimo debería ser 1, se obtuvo {dano}"
 
 
+def test_lote_coincide_con_escalar():
+    estados = {
+        1: DummyEstado(1, 100, 30, 5, 2),
+        2: DummyEstado(2, 100, 0, 10, 15),
+        3: DummyEstado(3, 100, 0, 999, 0),
+    }
+    golpes = [(1, 2, 30, "fisico"), (1, 2, 40, "magico"), (2, 3, 5, "fisico"), (3, 1, 7, "verdadero")]
+
+    danos = calcular_dano_lote(estados, [g[0] for g in golpes], [g[1] for g in golpes],
+                               [g[2] for g in golpes], [codigo_tipo_dano(g[3]) for g in golpes])
+
+    esperados = [
+        calcular_dano(estados[f], estados[o], Interaccion(fuente_id=f, objetivo_id=o, tipo=TipoInteraccion.ATAQUE,
+                                                          metadata={"dano_base": b, "tipo_dano": t}))
+        for f, o, b, t in golpes
+    ]
+    assert list(danos) == esperados == [20, 25, 1, 7]
+
+
+def test_lote_lee_columnas_del_almacen():
+    almacen = AlmacenCombate()
+    slots = []
+    for i, (defensa_fisica, defensa_magica) in enumerate([(0, 0), (10, 3)]):
+        carta = CartaBase({"id": i, "nombre": f"C{i}",
+                           "stats": {"defensa_fisica": defensa_fisica, "defensa_magica": defensa_magica}})
+        slots.append(almacen.registrar(EstadoCarta(carta)))
+
+    danos = calcular_dano_lote(almacen, [slots[0]] * 3, [slots[1]] * 3, [25, 25, 25],
+                               [TIPO_FISICO, TIPO_MAGICO, TIPO_VERDADERO])
+    assert list(danos) == [15, 22, 25]
+
+
 if __name__ == "__main__":
     test_dano_fisico_sin_defensa()
     test_dano_fisico_con_defensa()
@@ -0,0 +1,102 @@
+from src.core.jugador import Jugador
+from src.game.cartas.carta_base import CartaBase
+from src.game.cartas.fusion_cartas import aplicar_fusiones
+from src.game.tablero.tablero_hexagonal import TableroHexagonal
+
+
+def crear_carta(nombre, tier=1):
+    return CartaBase({"id": 1, "nombre": nombre, "tier": tier, "stats": {"vida": 100}})
+
+
+def todas_las_cartas(jugador):
+    return jugador.tablero.obtener_cartas() + [c for c in jugador.cartas_banco if c]
+
+
+def test_fusiones_encadenadas_en_una_pasada():
+    jugador = Jugador(1)
+    coords = jugador.tablero.coordenadas_libres()
+    jugador.tablero.colocar_carta(coords[0], crear_carta("Tesla", tier=2))
+    jugador.tablero.colocar_carta(coords[1], crear_carta("Tesla", tier=2))
+    jugador.agregar_carta_al_banco(crear_carta("Tesla"))
+    jugador.agregar_carta_al_banco(crear_carta("Tesla"))
+    assert len(todas_las_cartas(jugador)) == 4
+
+    # La tercera copia tier 1 crea una tier 2, que completa el trío de tier 2
+    jugador.agregar_carta_al_banco(crear_carta("Tesla"))
+
+    cartas = todas_las_cartas(jugador)
+    assert [c.tier for c in cartas] == [3]
+    assert jugador.tablero.obtener_coordenada_de(cartas[0]) == coords[0]
+    assert jugador.indice_fusiones.contar("Tesla", 3) == 1
+    assert not jugador.indice_fusiones.hay_candidatos()
+
+
+def test_solo_fusiona_cartas_del_mismo_tier():
+    jugador = Jugador(1)
+    jugador.agregar_carta_al_banco(crear_carta("Curie", tier=2))
+    jugador.agregar_carta_al_banco(crear_carta("Curie"))
+    jugador.agregar_carta_al_banco(crear_carta("Curie"))
+
+    assert sorted(c.tier for c in todas_las_cartas(jugador)) == [1, 1, 2]
+
+
+def test_indice_sigue_movimientos_de_tablero_y_banco():
+    jugador = Jugador(1)
+    carta = crear_carta("Newton")
+    coord = jugador.tablero.coordenadas_libres()[0]
+    jugador.colocar_carta_en_tablero(carta, coord)
+    assert jugador.indice_fusiones.contar("Newton", 1) == 1
+
+    jugador.quitar_carta_del_tablero(coord)  # Vuelve al banco
+    assert jugador.indice_fusiones.contar("Newton", 1) == 1
+    jugador.sacar_carta_del_banco(0)
+    assert jugador.indice_fusiones.contar("Newton", 1) == 0
+
+    # Reemplazar el tablero reindexa su contenido
+    tablero = TableroHexagonal()
+    tablero.colocar_carta(coord, crear_carta("Newton"))
+    jugador.tablero = tablero
+    assert jugador.indice_fusiones.contar("Newton", 1) == 1
+    tablero.limpiar_tablero()
+    assert jugador.indice_fusiones.contar("Newton", 1) == 0
+
+
+def test_aplicar_fusiones_sobre_tablero_y_banco_sueltos():
+    tablero = TableroHexagonal()
+    tablero.colocar_carta(tablero.coordenadas_libres()[0], crear_carta("Ada"))
+    banco = [crear_carta("Ada"), None, crear_carta("Ada")]
+
+    eventos = aplicar_fusiones(tablero, banco)
+
+    assert len(eventos) == 1
+    assert banco == [None, None, None]
+    assert [c.tier for c in tablero.obtener_cartas()] == [2]
+    assert tablero.observador_celdas is None
+
+
+def test_resetear_partida_vacia_el_indice_del_banco():
+    jugador = Jugador(1)
+    jugador.agregar_carta_al_banco(crear_carta("Tesla"))
+    jugador.agregar_carta_al_banco(crear_carta("Tesla"))
+
+    jugador.resetear_stats_partida()
+    assert jugador.indice_fusiones.contar("Tesla", 1) == 0
+
+    nueva = crear_carta("Tesla")
+    jugador.agregar_carta_al_banco(nueva)
+    assert jugador.cartas_banco == [nueva]
+    assert nueva.tier == 1
+
+
+def test_aplicar_fusiones_mantiene_el_indice_del_jugador():
+    jugador = Jugador(1)
+    coords = jugador.tablero.coordenadas_libres()
+    jugador.tablero.colocar_carta(coords[0], crear_carta("Ada"))
+    jugador.tablero.colocar_carta(coords[1], crear_carta("Ada"))
+
+    aplicar_fusiones(jugador.tablero, [crear_carta("Ada")])
+
+    assert [c.tier for c in jugador.tablero.obtener_cartas()] == [2]
+    assert jugador.indice_fusiones.contar("Ada", 1) == 0
+    assert jugador.indice_fusiones.contar("Ada", 2) == 1
+    assert jugador.tablero.observador_celdas == jugador.indice_fusiones._al_cambiar_celda
@@ -0,0 +1,40 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from src.core.jugador import Jugador
+from src.data.config.game_config import GameConfig, obtener_config, recargar_config
+
+
+def test_configuracion_compartida_e_inmutable():
+    config = GameConfig()
+    assert GameConfig() is config is obtener_config()
+    assert Jugador(1).config is Jugador(2).config is config
+    assert pickle.loads(pickle.dumps(config)) is config
+
+    with pytest.raises(AttributeError):
+        config.oro_por_ronda = 99
+    with pytest.raises(AttributeError):
+        config.costos_nivel.append(100)
+
+
+def test_cambios_en_el_json_invalidan_el_cache(tmp_path):
+    ruta = str(tmp_path / "config.json")
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump({"oro_por_ronda": 7}, f)
+
+    config = obtener_config(ruta)
+    assert config.oro_por_ronda == 7 and config.cartas_por_tienda == 5
+    assert obtener_config(ruta) is config
+
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump({"oro_por_ronda": 12}, f)
+    os.utime(ruta, ns=(0, os.stat(ruta).st_mtime_ns + 10 ** 9))
+    nueva = obtener_config(ruta)
+    assert nueva is not config and nueva.oro_por_ronda == 12
+    assert config.oro_por_ronda == 7  # Los objetos ya entregados no cambian
+
+    assert recargar_config(ruta) is not nueva
+    assert obtener_config(ruta).oro_por_ronda == 12
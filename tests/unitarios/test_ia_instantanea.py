@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from src.game.cartas.carta_base import CartaBase
+from src.game.combate.ia.ia_instantanea import InstantaneaTablero
+from src.game.combate.ia.ia_utilidades import obtener_info_entorno
+from src.game.tablero.coordenada import CoordenadaHexagonal
+from src.game.tablero.tablero_bitboard import TableroBitboard
+from src.game.tablero.tablero_hexagonal import TableroHexagonal
+
+
+def crear_carta(id, duenio, rango):
+    carta = CartaBase({
+        "id": id,
+        "nombre": f"Carta{id}",
+        "tier": 1,
+        "stats": {"vida": 100, "dano_fisico": 10, "rango_ataque": rango}
+    })
+    carta.duenio = duenio
+    return carta
+
+
+@pytest.mark.parametrize("clase_tablero", [TableroHexagonal, TableroBitboard])
+def test_instantanea_coincide_con_consulta_por_carta(clase_tablero):
+    rng = random.Random(5)
+    tablero = clase_tablero(radio=3)
+    cartas = [crear_carta(i, rng.choice(["A", "B"]), rng.randint(1, 3)) for i in range(15)]
+    for carta, coord in zip(cartas, rng.sample(list(tablero.celdas), len(cartas))):
+        tablero.colocar_carta(coord, carta)
+    fuera_del_tablero = crear_carta(99, "A", 1)
+
+    instantanea = InstantaneaTablero(tablero, cartas + [fuera_del_tablero])
+
+    for carta in cartas:
+        esperado = [otra for otra in obtener_info_entorno(carta, tablero)["enemigos_en_rango"] if otra is not carta]
+        info = obtener_info_entorno(carta, instantanea)
+        assert info["coordenada_actual"] == tablero.obtener_coordenada_de(carta)
+        assert sorted(c.id for c in info["enemigos_en_rango"]) == sorted(c.id for c in esperado)
+
+    assert instantanea.enemigos_en_rango_de(fuera_del_tablero) == []
+    assert instantanea.obtener_coordenada_de(fuera_del_tablero) is None
+    # Las consultas no precalculadas se delegan al tablero
+    assert instantanea.contar_cartas() == 15
+    assert instantanea.esta_dentro_del_tablero(CoordenadaHexagonal(0, 0))
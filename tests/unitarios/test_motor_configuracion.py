@@ -0,0 +1,148 @@
+import json
+import os
+import time
+
+import pytest
+
+from src.game.combate.configuracion_tiempo_real import ConfiguradorTiempoReal
+from src.game.combate.motor.motor_tiempo_real import MotorTiempoReal
+from src.game.combate.motor.reloj import RelojVirtual
+
+
+class Componente:
+    def __init__(self, nombre, espera=0.0, fallar=False):
+        self.nombre = nombre
+        self.espera = espera
+        self.fallar = fallar
+        self.deltas = []
+
+    def procesar_tick(self, delta_time):
+        self.deltas.append(delta_time)
+        if self.fallar:
+            raise RuntimeError("fallo")
+        time.sleep(self.espera)
+        return True
+
+    def obtener_id_componente(self):
+        return self.nombre
+
+
+@pytest.fixture
+def configurador(tmp_path):
+    ruta = str(tmp_path / "tiempo_real.json")
+
+    def escribir(**motor):
+        datos = {"motor": {"fps_objetivo": 10, "max_componentes": 2, "max_eventos_programados": 3,
+                           "max_errores_por_componente": 3, "intervalo_recarga_segundos": 0.0, **motor},
+                 "componentes": {"timeout_procesamiento_segundos": 0.005}}
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(datos, f)
+        # Asegurar un mtime distinto aunque el sistema de archivos tenga poca resolución
+        escribir.version += 1
+        os.utime(ruta, ns=(0, escribir.version * 10 ** 9))
+
+    escribir.version = 0
+    escribir()
+    configurador = ConfiguradorTiempoReal(ruta)
+    configurador.escribir = escribir
+    return configurador
+
+
+def test_limites_de_componentes_y_eventos(configurador):
+    motor = MotorTiempoReal(reloj=RelojVirtual(), configurador=configurador)
+
+    assert motor.agregar_componente(Componente("a")) and motor.agregar_componente(Componente("b"))
+    assert not motor.agregar_componente(Componente("c"))
+
+    ids = [motor.programar_evento(lambda: None, delay_segundos=0) for _ in range(4)]
+    assert ids[3] is None and None not in ids[:3]
+    motor.tick()  # Los eventos vencidos liberan lugar
+    assert motor.programar_evento(lambda: None, delay_segundos=0) is not None
+
+    stats = motor.obtener_estadisticas()['stats_detalladas']
+    assert (stats['componentes_rechazados'], stats['eventos_rechazados']) == (1, 1)
+
+
+class RelojManual:
+    """Reloj de pared controlado por el test"""
+
+    paso_fijo = False
+
+    def __init__(self):
+        self.tiempo = 0.0
+
+    def ahora(self):
+        return self.tiempo
+
+    def dormir(self, segundos):
+        pass
+
+
+def test_componente_lento_se_difiere_y_recibe_el_delta_acumulado(configurador):
+    reloj = RelojManual()
+    motor = MotorTiempoReal(reloj=reloj, configurador=configurador)
+    lento = Componente("lento", espera=0.02)
+    rapido = Componente("rapido")
+    motor.agregar_componente(lento)
+    motor.agregar_componente(rapido)
+
+    for _ in range(4):
+        reloj.tiempo += 0.1
+        motor.tick()
+
+    assert rapido.deltas == pytest.approx([0.1] * 4)
+    assert lento.deltas == pytest.approx([0.1, 0.2])
+    assert motor.stats['excesos_presupuesto'] == 2
+
+
+def test_reloj_virtual_no_difiere_componentes_lentos(configurador):
+    motor = MotorTiempoReal(reloj=RelojVirtual(), configurador=configurador)
+    lento = Componente("lento", espera=0.02)
+    motor.agregar_componente(lento)
+
+    for _ in range(3):
+        motor.tick()
+
+    # El resultado de una simulación con paso fijo no depende de la velocidad de la CPU
+    assert lento.deltas == pytest.approx([0.1] * 3)
+    assert motor.stats['excesos_presupuesto'] == 0
+
+
+def test_errores_tolerados_hasta_el_maximo(configurador):
+    motor = MotorTiempoReal(reloj=RelojVirtual(), configurador=configurador)
+    motor.agregar_componente(Componente("roto", fallar=True))
+
+    motor.tick()
+    motor.tick()
+    assert motor.obtener_componentes_activos() == ["roto"]
+    motor.tick()
+    assert motor.obtener_componentes_activos() == []
+
+    # Solo cuentan los errores consecutivos
+    intermitente = Componente("intermitente")
+    motor.agregar_componente(intermitente)
+    for tick in range(10):
+        intermitente.fallar = tick % 2 == 0
+        motor.tick()
+    assert motor.obtener_componentes_activos() == ["intermitente"]
+
+    # Sin configurador se mantiene la remoción inmediata
+    sin_config = MotorTiempoReal(fps_objetivo=10, reloj=RelojVirtual())
+    sin_config.agregar_componente(Componente("roto", fallar=True))
+    sin_config.tick()
+    assert sin_config.obtener_componentes_activos() == []
+
+
+def test_fps_se_recarga_en_caliente(configurador):
+    motor = MotorTiempoReal(reloj=RelojVirtual(), configurador=configurador)
+    fijo = MotorTiempoReal(fps_objetivo=30, reloj=RelojVirtual(), configurador=configurador)
+    assert motor.fps_objetivo == 10
+
+    configurador.escribir(fps_objetivo=25, max_componentes=5)
+    motor.tick()
+    fijo.tick()
+
+    assert motor.fps_objetivo == 25 and motor.intervalo_tick == pytest.approx(0.04)
+    assert fijo.fps_objetivo == 30
+    assert configurador.motor.max_componentes == 5
+    assert motor.stats['recargas_config'] == 1
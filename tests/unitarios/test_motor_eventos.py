@@ -0,0 +1,64 @@
+import time
+
+from src.game.combate.motor.motor_tiempo_real import MotorTiempoReal
+
+
+def test_eventos_se_ejecutan_en_orden_de_vencimiento():
+    motor = MotorTiempoReal(fps_objetivo=10)
+    ejecutados = []
+
+    motor.programar_evento(lambda: ejecutados.append("segundo"), delay_segundos=-0.5)
+    motor.programar_evento(lambda: ejecutados.append("primero"), delay_segundos=-1.0)
+    motor.programar_evento(lambda: ejecutados.append("futuro"), delay_segundos=60)
+
+    motor.tick()
+
+    assert ejecutados == ["primero", "segundo"]
+    assert len(motor.obtener_eventos_programados()) == 1
+
+
+def test_evento_cancelado_no_se_ejecuta():
+    motor = MotorTiempoReal(fps_objetivo=10)
+    ejecutados = []
+
+    id_evento = motor.programar_evento(lambda: ejecutados.append("x"), delay_segundos=0)
+    assert motor.cancelar_evento(id_evento)
+    assert not motor.cancelar_evento(id_evento)
+
+    motor.tick()
+
+    assert ejecutados == []
+    assert motor.obtener_eventos_programados() == []
+    assert motor.cola_eventos == []
+
+
+def test_evento_recurrente_se_reprograma():
+    motor = MotorTiempoReal(fps_objetivo=10)
+    ejecuciones = {"total": 0}
+
+    def contar():
+        ejecuciones["total"] += 1
+
+    id_evento = motor.programar_evento(contar, delay_segundos=0, recurrente=True, intervalo=0.01)
+
+    motor.tick()
+    time.sleep(0.02)
+    motor.tick()
+
+    assert ejecuciones["total"] == 2
+    assert id_evento in motor.obtener_eventos_programados()
+
+    motor.cancelar_evento(id_evento)
+    time.sleep(0.02)
+    motor.tick()
+    assert ejecuciones["total"] == 2
+
+
+def test_cola_se_compacta_tras_muchas_cancelaciones():
+    motor = MotorTiempoReal(fps_objetivo=10)
+    ids = [motor.programar_evento(lambda: None, delay_segundos=60) for _ in range(200)]
+
+    for id_evento in ids[:-1]:
+        motor.cancelar_evento(id_evento)
+
+    assert len(motor.cola_eventos) <= 2 * len(motor.eventos_programados) + 64
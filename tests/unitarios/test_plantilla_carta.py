@@ -0,0 +1,59 @@
+import pickle
+
+import pytest
+
+from src.game.cartas.carta_base import CartaBase
+from src.game.cartas.plantilla_carta import PlantillaCarta
+
+DATOS = {
+    "id": 7,
+    "nombre": "Hipatia",
+    "tier": 2,
+    "costo": 3,
+    "rol": "especialista",
+    "categoria": "ciencia",
+    "stats": {"vida": 120, "dano_magico": 25, "intervalo_ataque": 1.2},
+    "habilidades": [{"nombre": "Astrolabio", "tipo": "activa", "cooldown": 3, "alcance_extra": 2}],
+}
+
+
+def test_copias_comparten_plantilla_y_separan_estado():
+    plantilla = PlantillaCarta(DATOS)
+    a, b = CartaBase(plantilla), CartaBase(plantilla)
+
+    assert a.plantilla is b.plantilla
+    assert a.habilidades[0].plantilla is b.habilidades[0].plantilla
+    assert (a.nombre, a.costo, a.rol, a.intervalo_ataque) == ("Hipatia", 3, "especialista", 1.2)
+    assert a.habilidades[0].propiedades == {"alcance_extra": 2}
+
+    a.recibir_dano(50)
+    a.tier += 1
+    a.habilidades[0].cooldown_actual = 3
+    assert (b.vida_actual, b.tier, b.habilidades[0].cooldown_actual) == (120, 2, 0)
+
+
+def test_plantilla_es_inmutable_y_serializable():
+    plantilla = PlantillaCarta(DATOS)
+    with pytest.raises(AttributeError):
+        plantilla.nombre = "Otra"
+    with pytest.raises(AttributeError):
+        CartaBase(plantilla).atributo_inventado = 1
+
+    copia = pickle.loads(pickle.dumps(CartaBase(plantilla)))
+    assert copia.nombre == "Hipatia"
+    assert copia.habilidades[0].cooldown == 3
+    # Se serializa desde los campos: la plantilla no guarda una copia del JSON
+    assert copia.plantilla.como_datos() == plantilla.como_datos()
+    assert copia.habilidades[0].propiedades == {"alcance_extra": 2}
+    assert not any(hasattr(p, '_datos') for p in (plantilla, plantilla.habilidades[0]))
+
+
+def test_clases_de_carta_sin_dict_por_instancia():
+    from src.game.cartas.estado_carta import EstadoCarta
+
+    carta = CartaBase(PlantillaCarta(DATOS))
+    for obj in (carta, carta.habilidades[0], EstadoCarta(carta)):
+        assert not hasattr(obj, "__dict__")
+
+    # Los campos que usa el pool son explícitos y tienen valor por defecto
+    assert (carta.carta_base_id, carta.numero_copia, carta._en_uso) == (7, 0, False)
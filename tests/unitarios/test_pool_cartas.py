@@ -0,0 +1,154 @@
+import json
+import random
+
+import pytest
+
+from src.game.cartas.manager_cartas import ManagerCartas
+from src.game.cartas.muestreo_pool import ArbolFenwick
+
+
+@pytest.fixture
+def manager(tmp_path):
+    cartas = [
+        {"id": i, "nombre": f"Carta{i}", "tier": 1 + i % 3, "stats": {"vida": 100}}
+        for i in range(1, 61)
+    ]
+    archivo = tmp_path / "cartas.json"
+    archivo.write_text(json.dumps(cartas), encoding="utf-8")
+
+    manager = ManagerCartas()
+    manager.archivo_cartas = str(archivo)
+    assert manager.cargar_cartas()
+    return manager
+
+
+def test_tomar_y_devolver_mantienen_contadores(manager):
+    total_tier1 = manager.disponibles_por_tier[1]
+    carta_id = manager.cartas_por_tier[1][0]
+
+    tomadas = [manager._tomar_instancia_del_pool(carta_id) for _ in range(5)]
+    assert [c.id for c in tomadas] == [f"{carta_id}_{n:03d}" for n in range(5)]
+    assert manager._tomar_instancia_del_pool(carta_id) is None
+    assert manager.disponibles_por_tier[1] == total_tier1 - 5
+
+    manager.devolver_carta_al_pool(tomadas[2])
+    assert manager.pool_disponibles[carta_id] == 1
+    assert manager.disponibles_por_tier[1] == total_tier1 - 4
+    assert manager._tomar_instancia_del_pool(carta_id) is tomadas[2]
+    assert manager.verificar_integridad_pool()
+
+
+def test_devolver_dos_veces_no_duplica_copias(manager):
+    carta_id = manager.cartas_por_tier[2][0]
+    carta = manager._tomar_instancia_del_pool(carta_id)
+
+    manager.devolver_carta_al_pool(carta)
+    manager.devolver_carta_al_pool(carta)
+
+    assert manager.pool_disponibles[carta_id] == manager.copias_por_tier[2]
+    assert manager.verificar_integridad_pool()
+
+
+def test_sorteos_agotan_el_pool_sin_perder_consistencia(manager):
+    random.seed(7)
+    total = manager.obtener_estadisticas_pool()["total_instancias_creadas"]
+
+    tomadas = []
+    while True:
+        nuevas = manager.obtener_cartas_aleatorias_por_nivel(9, cantidad=5)
+        if not nuevas:
+            break
+        tomadas.extend(nuevas)
+
+    assert len(tomadas) == total
+    assert len({c.id for c in tomadas}) == total
+    assert sum(manager.disponibles_por_tier.values()) == 0
+
+    for carta in tomadas[::2]:
+        manager.devolver_carta_al_pool(carta)
+    assert sum(manager.disponibles_por_tier.values()) == len(tomadas[::2])
+    assert manager.verificar_integridad_pool()
+
+    manager.resetear_pool()
+    assert sum(manager.disponibles_por_tier.values()) == total
+    assert manager.verificar_integridad_pool()
+
+
+def test_arbol_fenwick_busca_y_actualiza():
+    arbol = ArbolFenwick([3, 0, 2, 5])
+    assert arbol.total == 10
+    assert [arbol.buscar(x) for x in range(10)] == [0, 0, 0, 2, 2, 3, 3, 3, 3, 3]
+
+    arbol.actualizar(1, 4)
+    arbol.actualizar(3, -5)
+    assert arbol.total == 9
+    assert arbol.suma_acumulada(2) == 7
+    assert [arbol.buscar(x) for x in range(9)] == [0, 0, 0, 1, 1, 1, 1, 2, 2]
+
+    assert ArbolFenwick([0, 0]).sortear() is None
+
+
+def test_sorteo_ponderado_por_copias_restantes(manager):
+    random.seed(3)
+    favorita, escasa = manager.cartas_por_tier[1][:2]
+    # Dejar una sola copia de la segunda carta y sacar del pool el resto del tier
+    for carta_id in manager.cartas_por_tier[1][2:]:
+        while manager._tomar_instancia_del_pool(carta_id):
+            pass
+    for _ in range(4):
+        manager._tomar_instancia_del_pool(escasa)
+
+    conteo = {favorita: 0, escasa: 0}
+    for _ in range(3000):
+        carta = manager._sortear_carta({1: 1.0, 2: 0.0, 3: 0.0})
+        conteo[carta.carta_base_id] += 1
+        manager.devolver_carta_al_pool(carta)
+
+    # 5 copias contra 1: la primera debe salir unas cinco veces más
+    assert 4 < conteo[favorita] / conteo[escasa] < 6.5
+
+
+def test_tiendas_en_lote_reparten_por_turnos(manager):
+    random.seed(11)
+    tiendas = manager.obtener_cartas_para_tiendas([1, 5, 9, 9], cantidad=5)
+    assert [len(t) for t in tiendas] == [5, 5, 5, 5]
+    # Nivel 1 no puede recibir tier 3 mientras haya tier 1/2
+    assert all(carta.tier < 3 for carta in tiendas[0])
+
+    # Con 7 copias en el pool, dos tiendas de 5 se reparten 4 y 3
+    while sum(manager.disponibles_por_tier.values()) > 7:
+        manager.obtener_cartas_aleatorias_por_nivel(9, cantidad=1)
+    restantes = manager.obtener_cartas_para_tiendas([1, 1], cantidad=5)
+    assert [len(t) for t in restantes] == [4, 3]
+    assert sum(manager.disponibles_por_tier.values()) == 0
+    assert manager.verificar_integridad_pool()
+
+
+def test_copias_se_crean_al_salir_del_pool(manager):
+    stats = manager.obtener_estadisticas_pool()
+    assert stats["total_instancias_creadas"] == 200
+    assert stats["instancias_materializadas"] == 0
+
+    cartas = manager.obtener_cartas_aleatorias_por_nivel(5, cantidad=5)
+    assert manager.obtener_estadisticas_pool()["instancias_materializadas"] == 5
+    assert set(manager.obtener_cartas_en_uso()) == set(cartas)
+
+
+def test_instancia_reciclada_vuelve_limpia(manager):
+    carta_id = manager.cartas_por_tier[1][0]
+    carta = manager._tomar_instancia_del_pool(carta_id)
+    carta.duenio = "jugador"
+    carta.tier += 1
+    carta.recibir_dano(40)
+    carta.aplicar_modificador_stat("dano_fisico", 7, permanente=True)
+
+    manager.devolver_carta_al_pool(carta)
+    reciclada = manager._tomar_instancia_del_pool(carta_id)
+
+    assert reciclada is carta
+    assert reciclada.id == f"{carta_id}_000"
+    assert reciclada.duenio is None
+    assert reciclada.tier == 1
+    assert reciclada.vida_actual == reciclada.vida_maxima == 100
+    assert reciclada.dano_fisico_base == 10
+    assert manager.obtener_estadisticas_pool()["instancias_materializadas"] == 1
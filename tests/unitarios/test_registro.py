@@ -0,0 +1,78 @@
+from src.utils.registro import Registro, SalidaArchivoRotativo, SalidaBufferada
+
+
+def crear_registro(**kwargs):
+    registro = Registro(**kwargs)
+    salida = SalidaBufferada()
+    registro.salidas = [salida]
+    return registro, salida
+
+
+def test_nivel_filtra_antes_de_formatear():
+    registro, salida = crear_registro(nivel="INFO")
+    llamadas = []
+
+    def mensaje_caro():
+        llamadas.append(1)
+        return "detalle"
+
+    registro.registrar(mensaje_caro, "DEBUG")
+    registro.registrar(lambda: "visible", "WARNING")
+    registro.cerrar()
+
+    assert llamadas == []
+    lineas = salida.drenar()
+    assert len(lineas) == 1
+    assert lineas[0][1] == "WARNING" and lineas[0][0].endswith("⚠️ visible")
+
+
+def test_escritura_asincrona_conserva_el_orden():
+    registro, salida = crear_registro(nivel="DEBUG")
+
+    for i in range(500):
+        registro.registrar(f"mensaje {i}", "DEBUG")
+    registro.vaciar()
+
+    assert [linea.rsplit(" ", 1)[1] for linea, _ in salida.drenar()] == [str(i) for i in range(500)]
+    registro.cerrar()
+
+
+def test_cola_llena_descarta_y_avisa():
+    registro, salida = crear_registro(max_cola=1)
+    bloqueo = __import__("threading").Event()
+
+    class SalidaLenta:
+        def escribir(self, linea, nivel):
+            bloqueo.wait(timeout=2)
+
+        def vaciar(self):
+            pass
+
+        def cerrar(self):
+            pass
+
+    registro.salidas = [SalidaLenta(), salida]
+    for i in range(50):
+        registro.registrar(f"info {i}")
+    registro.registrar("error final", "ERROR")
+    bloqueo.set()
+    registro.cerrar()
+
+    lineas = [linea for linea, _ in salida.drenar()]
+    assert any("mensajes descartados" in linea for linea in lineas)
+    assert lineas[-1].endswith("error final")
+
+
+def test_archivo_rotativo(tmp_path):
+    registro = Registro(nivel="INFO", asincrono=False)
+    registro.salidas = [SalidaArchivoRotativo(directorio=str(tmp_path), nombre="prueba", max_bytes=200, copias=2)]
+
+    for i in range(40):
+        registro.registrar(f"línea número {i}")
+    registro.cerrar()
+
+    archivos = sorted(p.name for p in tmp_path.iterdir())
+    assert archivos == ["prueba.log", "prueba.log.1", "prueba.log.2"]
+    recientes = (tmp_path / "prueba.log").read_text(encoding="utf-8") + (tmp_path / "prueba.log.1").read_text(encoding="utf-8")
+    assert "línea número 39" in recientes
+    assert all(len((tmp_path / nombre).read_bytes()) <= 200 + 60 for nombre in archivos)
@@ -0,0 +1,96 @@
+import json
+
+from src.game.cartas.carta_base import CartaBase
+from src.game.cartas.estado_carta import EstadoCarta
+from src.game.combate.interacciones.gestor_interacciones import GestorInteracciones
+from src.game.tablero.coordenada import CoordenadaHexagonal
+from src.game.tablero.tablero_hexagonal import TableroHexagonal
+from src.utils.registro_estructurado import (
+    NIVEL_DEBUG,
+    NIVEL_INFO,
+    CodigoEvento,
+    RegistroEstructurado,
+    leer_registro_binario,
+)
+
+
+def test_buffer_circular_conserva_los_ultimos():
+    eventos = RegistroEstructurado(capacidad=4)
+    for i in range(10):
+        eventos.tick = i
+        eventos.registrar(CodigoEvento.INICIO_COMBATE, i, 0)
+
+    assert len(eventos) == 4
+    assert [e["ronda"] for e in eventos.eventos()] == [6, 7, 8, 9]
+    assert eventos.obtener_estadisticas()["sobrescritos"] == 6
+
+
+def test_nivel_minimo_descarta_sin_escribir():
+    eventos = RegistroEstructurado(capacidad=4, nivel_minimo=NIVEL_INFO)
+    eventos.registrar(CodigoEvento.INICIO_COMBATE, 1, 2, nivel=NIVEL_DEBUG)
+    assert len(eventos) == 0
+
+
+def test_volcado_binario_por_bloques(tmp_path):
+    ruta = tmp_path / "combate.bin"
+    eventos = RegistroEstructurado(capacidad=3, ruta=str(ruta))
+
+    a, b = eventos.texto("1_001"), eventos.texto("2_001")
+    for i in range(4):
+        eventos.tick = i
+        eventos.registrar(CodigoEvento.ATAQUE, a, b, 10, 100 - 10 * i)
+    # El buffer se llenó una vez (3 eventos volcados) y queda 1 pendiente
+    assert len(eventos) == 1
+
+    # Un texto nuevo después del primer bloque viaja en el siguiente
+    eventos.registrar(CodigoEvento.MUERTE, eventos.texto("3_001"), a)
+    assert eventos.volcar() == 2
+
+    leidos = leer_registro_binario(str(ruta))
+    assert len(leidos) == 5
+    assert leidos[0] == {"tick": 0, "nivel": "INFO", "evento": "ATAQUE", "fuente": "1_001",
+                         "objetivo": "2_001", "dano": 10, "vida_restante": 100}
+    assert leidos[-1]["evento"] == "MUERTE"
+    assert leidos[-1]["carta"] == "3_001"
+
+
+def test_volcado_ndjson(tmp_path):
+    ruta = tmp_path / "combate.ndjson"
+    eventos = RegistroEstructurado(capacidad=8, ruta=str(ruta), formato="ndjson")
+    eventos.registrar(CodigoEvento.FIN_COMBATE, 3, 2)
+    eventos.volcar()
+
+    lineas = ruta.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(l) for l in lineas] == [
+        {"tick": 0, "nivel": "INFO", "evento": "FIN_COMBATE", "ronda": 3, "cartas_vivas": 2}
+    ]
+
+
+def test_gestor_registra_ataques_y_muertes():
+    def crear_carta(id, duenio, vida, dano):
+        carta = CartaBase({"id": id, "nombre": f"Carta{id}", "tier": 1,
+                           "stats": {"vida": vida, "dano_fisico": dano, "rango_ataque": 1}})
+        carta.duenio = duenio
+        return carta
+
+    atacante = crear_carta(1, "A", vida=10_000, dano=50)
+    defensor = crear_carta(2, "B", vida=60, dano=0)
+    tablero = TableroHexagonal(radio=2)
+    eventos = RegistroEstructurado(capacidad=64)
+    gestor = GestorInteracciones(tablero=tablero, eventos=eventos)
+    for carta, coord in ((atacante, CoordenadaHexagonal(0, 0)), (defensor, CoordenadaHexagonal(1, 0))):
+        tablero.colocar_carta(coord, carta)
+        gestor.registrar_estado_carta(EstadoCarta(carta))
+
+    for _ in range(100):
+        gestor.procesar_tick(0.1)
+
+    registrados = eventos.eventos()
+    ataques = [e for e in registrados if e["evento"] == "ATAQUE"]
+    muertes = [e for e in registrados if e["evento"] == "MUERTE"]
+    golpes = [e for e in ataques if e["fuente"] == "1"]
+    assert golpes and all(e["objetivo"] == "2" and e["dano"] > 0 for e in golpes)
+    assert len(muertes) == 1
+    assert muertes[0]["carta"] == "2"
+    assert muertes[0]["tick"] == golpes[-1]["tick"]
+    assert golpes[-1]["vida_restante"] == 0
@@ -0,0 +1,86 @@
+import pytest
+
+from src.game.cartas.almacen_combate import AlmacenCombate
+from src.game.cartas.carta_base import CartaBase
+from src.game.cartas.estado_carta import EstadoCarta
+from src.game.cartas.manager_cartas import ManagerCartas
+from src.game.combate.calcular_dano.calculadora_dano import calcular_dano_lote
+from src.game.combate.calcular_dano.modificadores_basicos import TIPO_FISICO, TIPO_MAGICO
+from src.game.combate.calcular_dano.tabla_sinergias import TablaSinergias
+from src.game.combate.interacciones.gestor_interacciones import GestorInteracciones
+
+EQUIPO = [("A", "militar", "lider"), ("A", "militar", "lider"), ("A", "militar", "especialista"),
+          ("A", "ciencia", "especialista"), ("B", "militar", "lider")]
+
+
+def crear_carta(id, duenio, categoria, rol):
+    carta = CartaBase({"id": id, "nombre": f"Carta{id}", "categoria": categoria, "rol": rol})
+    carta.duenio = duenio
+    return carta
+
+
+def crear_estados():
+    return [EstadoCarta(crear_carta(i, *datos)) for i, datos in enumerate(EQUIPO)]
+
+
+def test_congelar_aplica_las_reglas_del_manager():
+    estados = crear_estados()
+    tabla = TablaSinergias()
+    tabla.congelar(estados)
+
+    manager = ManagerCartas()
+    for equipo in ("A", "B"):
+        cartas = [crear_carta(i, *datos) for i, datos in enumerate(EQUIPO) if datos[0] == equipo]
+        sinergias = manager.calcular_sinergias(cartas)
+        assert tabla.sinergias_activas(equipo) == sinergias
+
+        antes = [(c.vida_actual, c.dano_fisico_actual, c.dano_magico_actual, c.defensa_fisica_actual)
+                 for c in cartas]
+        manager.aplicar_sinergias(cartas, sinergias)
+        for carta, (vida, fisico, magico, defensa) in zip(cartas, antes):
+            estado = estados[carta.id]
+            assert tabla.bonus(estado) == {'vida': carta.vida_actual - vida,
+                                           'dano_fisico': carta.dano_fisico_actual - fisico,
+                                           'dano_magico': carta.dano_magico_actual - magico,
+                                           'defensa_fisica': carta.defensa_fisica_actual - defensa}
+
+    # 3 militares: +10 vida y +4 daño; 2 líderes: +6 defensa; 2 especialistas: +16 daño mágico
+    assert [e.vida_actual for e in estados] == [110, 110, 110, 100, 100]
+    assert [e.defensa_fisica_actual for e in estados] == [6, 6, 0, 0, 0]
+    assert [e.bonus_dano_magico for e in estados] == [4, 4, 20, 16, 0]
+
+
+def test_muerte_actualiza_solo_sus_grupos_como_un_recalculo():
+    estados = crear_estados()
+    tabla = TablaSinergias()
+    tabla.congelar(estados)
+
+    estados[0].recibir_dano(1000)
+    tabla.registrar_muerte(estados[0])
+
+    recalculo = crear_estados()
+    recalculo[0].recibir_dano(1000)
+    TablaSinergias().congelar(recalculo)
+
+    for incremental, desde_cero in zip(estados[1:], recalculo[1:]):
+        assert (incremental.bonus_dano_fisico, incremental.bonus_dano_magico, incremental.defensa_fisica_actual) == \
+               (desde_cero.bonus_dano_fisico, desde_cero.bonus_dano_magico, desde_cero.defensa_fisica_actual)
+    # El líder que queda pierde la sinergia de rol; la vida otorgada al inicio se conserva
+    assert estados[1].defensa_fisica_actual == 0
+    assert estados[1].vida_actual == 110
+    assert estados[0].bonus_dano_fisico == 0
+
+
+def test_pipeline_lee_el_bonus_del_almacen():
+    estados = crear_estados()
+    gestor = GestorInteracciones(almacen=AlmacenCombate())
+    for estado in estados:
+        gestor.registrar_estado_carta(estado)
+    gestor.congelar_sinergias()
+
+    slots = [estado._slot for estado in estados]
+    objetivo = [slots[4]] * 5
+    fisico = calcular_dano_lote(gestor.almacen, slots, objetivo, [100] * 5, [TIPO_FISICO] * 5)
+    magico = calcular_dano_lote(gestor.almacen, slots, objetivo, [100] * 5, [TIPO_MAGICO] * 5)
+    assert list(fisico) == [104, 104, 104, 100, 100]
+    assert list(magico) == [104, 104, 120, 116, 100]
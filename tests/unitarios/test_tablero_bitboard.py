@@ -0,0 +1,74 @@
+import random
+
+from src.game.tablero.coordenada import CoordenadaHexagonal
+from src.game.tablero.tablero_bitboard import TableroBitboard
+from src.game.tablero.tablero_hexagonal import TableroHexagonal
+
+
+class Ficha:
+    def __init__(self, id, duenio, rango=1):
+        self.id = id
+        self.duenio = duenio
+        self.rango_ataque_actual = rango
+        self.nombre = f"F{id}"
+
+
+def poblar_igual(tableros, semilla=3, operaciones=200):
+    """Aplica la misma secuencia aleatoria de operaciones a todos los tableros"""
+    rng = random.Random(semilla)
+    coordenadas = list(tableros[0].celdas)
+    fichas = [Ficha(i, rng.choice(["rojo", "azul"]), rng.randint(1, 3)) for i in range(40)]
+
+    for _ in range(operaciones):
+        operacion = rng.random()
+        a, b = rng.choice(coordenadas), rng.choice(coordenadas)
+        for tablero in tableros:
+            if operacion < 0.5:
+                tablero.colocar_carta(a, fichas[coordenadas.index(b) % len(fichas)])
+            elif operacion < 0.7:
+                tablero.quitar_carta(a)
+            elif operacion < 0.85:
+                tablero.mover_carta(a, b)
+            else:
+                tablero.intercambiar_cartas(a, b)
+
+
+def test_bitboard_equivale_al_tablero_de_diccionario():
+    base, bits = TableroHexagonal(radio=3), TableroBitboard(radio=3)
+    poblar_igual([base, bits])
+
+    assert base.celdas == bits.celdas
+    assert bits.contar_cartas() == base.contar_cartas()
+    assert bits.coordenadas_libres() == base.coordenadas_libres()
+    for origen in list(base.celdas) + [CoordenadaHexagonal(7, 0)]:
+        for rango in range(0, 7):
+            assert bits.obtener_cartas_en_rango(origen, rango) == base.obtener_cartas_en_rango(origen, rango)
+            assert abs(bits.obtener_densidad_area(origen, rango) - base.obtener_densidad_area(origen, rango)) < 1e-12
+
+
+def test_enemigos_en_rango_de_todas_las_cartas():
+    tablero = TableroBitboard(radio=3)
+    poblar_igual([tablero], semilla=11)
+
+    enemigos = tablero.enemigos_en_rango_de_todas()
+
+    assert list(enemigos) == tablero.coordenadas_ocupadas()
+    for coord, encontrados in enemigos.items():
+        carta = tablero.celdas[coord]
+        esperados = {(c, o) for c, o in tablero.obtener_cartas_en_rango(coord, carta.rango_ataque_actual) if o.duenio != carta.duenio}
+        assert set(encontrados) == esperados
+
+
+def test_bitboard_limpiar_y_celdas_agregadas():
+    tablero = TableroBitboard(radio=1)
+    ficha = Ficha(1, "rojo")
+    tablero.colocar_carta(CoordenadaHexagonal(0, 0), ficha)
+    tablero.limpiar_tablero()
+    assert tablero.obtener_cartas_en_rango(CoordenadaHexagonal(0, 0), 2) == []
+    assert tablero.mascara_enemigos(Ficha(2, "azul")) == 0
+
+    lejana = CoordenadaHexagonal(3, 0)
+    tablero.celdas[lejana] = None
+    tablero.colocar_carta(lejana, ficha)
+    assert tablero.obtener_cartas_en_rango(CoordenadaHexagonal(1, 0), 2) == [(lejana, ficha)]
+    assert tablero.obtener_vecinos(lejana) == ()
@@ -0,0 +1,123 @@
+from src.game.cartas.carta_base import CartaBase
+from src.game.tablero.coordenada import CoordenadaHexagonal
+from src.game.tablero.tablero_hexagonal import TableroHexagonal
+
+
+def verificar_indice(tablero):
+    """El índice inverso coincide con un recorrido completo de las celdas"""
+    esperado = {coord: carta for coord, carta in tablero.celdas.items() if carta is not None}
+    # Mismo orden que recorrer las celdas del tablero
+    assert tablero.coordenadas_ocupadas() == list(esperado)
+    assert tablero.obtener_cartas_con_posiciones() == list(esperado.items())
+    assert tablero.contar_cartas() == len(esperado)
+    for coord, carta in esperado.items():
+        assert tablero.obtener_coordenada_de(carta) == coord
+        assert tablero.buscar_carta(carta) == coord
+
+
+def test_indice_inverso_sigue_todas_las_operaciones():
+    tablero = TableroHexagonal(radio=2)
+    a, b, c = (CartaBase.crear_basica(i, nombre=n) for i, n in enumerate("ABC", 1))
+    c1, c2, c3 = CoordenadaHexagonal(0, 0), CoordenadaHexagonal(1, 0), CoordenadaHexagonal(0, 1)
+
+    assert tablero.colocar_carta(c1, a) is True
+    assert tablero.colocar_carta(b, c2) is True
+    verificar_indice(tablero)
+
+    assert tablero.mover_carta(c1, c3)
+    verificar_indice(tablero)
+
+    assert tablero.intercambiar_cartas(c2, c3)
+    assert tablero.obtener_coordenada_de(a) == c2
+    verificar_indice(tablero)
+
+    # Reemplazar una carta la saca del índice; recolocar la misma la mueve
+    tablero.colocar_carta(c2, c)
+    assert tablero.obtener_coordenada_de(a) is None
+    tablero.colocar_carta(c1, c)
+    assert tablero.obtener_carta_en(c2) is None
+    verificar_indice(tablero)
+
+    assert tablero.quitar_carta(c3) is b
+    verificar_indice(tablero)
+
+    tablero.limpiar_tablero()
+    assert tablero.contar_cartas() == 0
+    assert tablero.obtener_coordenada_de(c) is None
+    verificar_indice(tablero)
+
+
+def test_colocar_fuera_del_tablero_no_indexa():
+    tablero = TableroHexagonal(radio=1)
+    carta = CartaBase.crear_basica(1, nombre="A")
+
+    assert tablero.colocar_carta(CoordenadaHexagonal(5, 0), carta) is False
+    assert tablero.buscar_carta(carta) is None
+    assert tablero.contar_cartas() == 0
+
+
+def consulta_geometrica(tablero, origen, rango):
+    """Versión de referencia de obtener_cartas_en_rango sin tablas precalculadas"""
+    return [(c, carta) for c, carta in tablero.celdas.items()
+            if carta is not None and origen.distancia(c) <= rango]
+
+
+def test_rangos_precalculados_coinciden_con_la_geometria():
+    tablero = TableroHexagonal(radio=3)
+    coordenadas = list(tablero.celdas)
+
+    # Ocupación escasa (recorre ocupadas) y densa (recorre la tupla cacheada)
+    for cantidad in (3, len(coordenadas) - 2):
+        tablero.limpiar_tablero()
+        for i, coord in enumerate(coordenadas[::-1][:cantidad]):
+            tablero.colocar_carta(coord, CartaBase.crear_basica(i + 1, nombre=f"C{i}"))
+
+        for origen in coordenadas + [CoordenadaHexagonal(9, 9)]:
+            for rango in range(0, 8):
+                assert tablero.obtener_cartas_en_rango(origen, rango) == consulta_geometrica(tablero, origen, rango)
+
+
+def test_vecinos_precalculados_y_celdas_agregadas():
+    tablero = TableroHexagonal(radio=1)
+    assert len(tablero.obtener_vecinos(CoordenadaHexagonal(0, 0))) == 6
+    assert len(tablero.obtener_vecinos(CoordenadaHexagonal(1, 0))) == 3
+
+    # Agregar celdas invalida las tablas
+    lejana = CoordenadaHexagonal(2, 0)
+    tablero.celdas[lejana] = None
+    carta = CartaBase.crear_basica(1, nombre="A")
+    tablero.colocar_carta(lejana, carta)
+
+    assert CoordenadaHexagonal(1, 0) in tablero.obtener_vecinos(lejana)
+    assert tablero.obtener_cartas_en_rango(CoordenadaHexagonal(0, 0), 2) == [(lejana, carta)]
+
+
+def test_cambiar_celdas_sin_cambiar_la_cantidad_rehace_las_tablas():
+    tablero = TableroHexagonal(radio=1)
+    centro = CoordenadaHexagonal(0, 0)
+    assert len(tablero.obtener_vecinos(centro)) == 6
+    assert len(tablero.obtener_cartas_en_rango(centro, 1)) == 0
+
+    # Reemplazar una celda por otra deja la misma cantidad de celdas
+    del tablero.celdas[CoordenadaHexagonal(1, 0)]
+    lejana = CoordenadaHexagonal(2, 0)
+    tablero.celdas[lejana] = None
+    carta = CartaBase.crear_basica(1, nombre="A")
+    tablero.colocar_carta(lejana, carta)
+
+    assert len(tablero.obtener_vecinos(centro)) == 5
+    assert tablero.obtener_vecinos(lejana) == ()
+    assert tablero.obtener_cartas_en_rango(centro, 2) == [(lejana, carta)]
+
+
+def test_rangos_solo_se_tabulan_al_consultarse():
+    tablero = TableroHexagonal(radio=3)
+    centro = CoordenadaHexagonal(0, 0)
+
+    tablero.obtener_cartas_en_rango(centro, 1)
+    tablero.obtener_cartas_en_rango(centro, 1)
+
+    assert list(tablero._rangos) == [(centro, 1)]
+    assert len(tablero._rangos[(centro, 1)]) == 7
+    assert tablero._celdas_en_rango(centro, -1) == ()
+    assert tablero._celdas_en_rango(CoordenadaHexagonal(9, 0), 1) is None